@@ -0,0 +1,25 @@
+import os
+
+# VWorld 필지 단위 응답(토지특성, 토지이용계획) 캐시 설정
+API_CACHE_SIZE = int(os.getenv("API_CACHE_SIZE", "10000"))
+API_CACHE_TTL = int(os.getenv("API_CACHE_TTL", str(60 * 60 * 24 * 30)))
+# 지정하면 메모리 캐시 아래에 SQLite 파일 캐시를 함께 사용
+API_CACHE_DB_PATH = os.getenv("API_CACHE_DB_PATH")
+
+# 월별 거시 지표(지가변동률, 물가지수) 프로세스 내 캐시 설정
+INDICATOR_CACHE_SIZE = int(os.getenv("INDICATOR_CACHE_SIZE", "50000"))
+INDICATOR_CACHE_TTL = int(os.getenv("INDICATOR_CACHE_TTL", str(60 * 60)))
+
+# 데이터셋별 최신 공표 기간을 다시 확인하는 주기 (초)
+PERIOD_REFRESH_INTERVAL = int(os.getenv("PERIOD_REFRESH_INTERVAL", str(60 * 60 * 6)))
+
+# 지오코딩(주소 → 좌표), 역지오코딩(좌표 → PNU), 주소 자동완성 캐시 설정
+GEO_CACHE_SIZE = int(os.getenv("GEO_CACHE_SIZE", "50000"))
+GEO_CACHE_TTL = int(os.getenv("GEO_CACHE_TTL", str(60 * 60 * 24 * 7)))
+# 역지오코딩 캐시 키의 좌표 소수점 자릿수 (5자리 ≈ 1m)
+GEO_COORD_PRECISION = int(os.getenv("GEO_COORD_PRECISION", "5"))
+
+# 필지 경계(LP_PA_CBND_BUBUN)를 parcel_geometry_data 에서 그대로 사용하는 기간 (초)
+PARCEL_GEOMETRY_MAX_AGE = int(
+    os.getenv("PARCEL_GEOMETRY_MAX_AGE", str(60 * 60 * 24 * 90))
+)
@@ -0,0 +1,14 @@
+import os
+
+# 업스트림 API 호출용 공용 HTTP 커넥션 풀 설정
+HTTP_POOL_CONNECTIONS = int(os.getenv("HTTP_POOL_CONNECTIONS", "10"))
+HTTP_POOL_MAXSIZE = int(os.getenv("HTTP_POOL_MAXSIZE", "32"))
+HTTP_TIMEOUT = float(os.getenv("HTTP_TIMEOUT", "10"))
+HTTP_MAX_RETRIES = int(os.getenv("HTTP_MAX_RETRIES", "3"))
+HTTP_BACKOFF_FACTOR = float(os.getenv("HTTP_BACKOFF_FACTOR", "0.3"))
+
+# 비동기 클라이언트에서 동시에 진행할 수 있는 최대 업스트림 요청 수
+ASYNC_HTTP_CONCURRENCY = int(os.getenv("ASYNC_HTTP_CONCURRENCY", "32"))
+
+# 지적도 요청 한 번에서 동시에 가져오는 필지 경계 수
+CADASTRAL_FETCH_CONCURRENCY = int(os.getenv("CADASTRAL_FETCH_CONCURRENCY", "16"))
@@ -0,0 +1,8 @@
+import os
+
+# 예측 작업 큐 설정
+JOB_WORKERS = int(os.getenv("JOB_WORKERS", "4"))
+JOB_QUEUE_SIZE = int(os.getenv("JOB_QUEUE_SIZE", "1000"))
+# 끝난 작업의 결과를 보관하는 개수와 조회할 수 있는 시간 (초)
+JOB_RESULT_SIZE = int(os.getenv("JOB_RESULT_SIZE", "10000"))
+JOB_RESULT_TTL = int(os.getenv("JOB_RESULT_TTL", str(60 * 60)))
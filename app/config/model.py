@@ -1,3 +1,9 @@
 import os
 
 MODEL_PATH = os.getenv("MODEL_PATH")
+# 저장된 예측 결과를 구분하는 모델 버전 (지정하지 않으면 모델 파일의 해시)
+MODEL_VERSION = os.getenv("MODEL_VERSION")
+
+# 일괄 예측 요청당 최대 PNU 수와 동시에 입력 데이터를 만드는 필지 수
+PREDICT_BATCH_MAX_SIZE = int(os.getenv("PREDICT_BATCH_MAX_SIZE", "5000"))
+PREDICT_BATCH_CONCURRENCY = int(os.getenv("PREDICT_BATCH_CONCURRENCY", "64"))
@@ -0,0 +1,16 @@
+import os
+
+# 주변 장소 정보 조회 방식 ("kakao": 카카오 카테고리 검색, "offline": 로컬 POI 스냅샷)
+PLACE_DATA_MODE = os.getenv("PLACE_DATA_MODE", "kakao")
+# 카테고리 코드별 POI 스냅샷 CSV 파일(<코드>.csv, x/y 컬럼)이 있는 디렉터리
+POI_SNAPSHOT_DIR = os.getenv("POI_SNAPSHOT_DIR")
+
+# 주변 장소 정보 캐시: 좌표가 속한 geohash 셀 단위로 결과를 공유 (정밀도 7 ≈ 153m x 153m)
+PLACE_CELL_PRECISION = int(os.getenv("PLACE_CELL_PRECISION", "7"))
+PLACE_CACHE_SIZE = int(os.getenv("PLACE_CACHE_SIZE", "20000"))
+PLACE_CACHE_TTL = int(os.getenv("PLACE_CACHE_TTL", str(60 * 60 * 24 * 7)))
+# 지정하면 메모리 캐시 아래에 SQLite 파일 캐시를 함께 사용
+# (API_CACHE_DB_PATH 와 같은 파일을 쓰면 쓰기 잠금을 두고 경합하므로 별도 파일로 지정)
+PLACE_CACHE_DB_PATH = os.getenv("PLACE_CACHE_DB_PATH")
+# "1" 이면 셀 캐시를 사용하지 않고 필지 좌표로 매번 정확히 계산
+PLACE_CACHE_EXACT = os.getenv("PLACE_CACHE_EXACT", "0") == "1"
@@ -1,3 +1,6 @@
 import os
 
 SERVER_DOMAIN = os.getenv("SERVER_DOMAIN")
+
+# 응답 본문이 이 크기(바이트)를 넘으면 한 번에 만들지 않고 경계 단위로 스트리밍
+JSON_STREAM_THRESHOLD = int(os.getenv("JSON_STREAM_THRESHOLD", str(1 << 20)))
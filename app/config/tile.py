@@ -0,0 +1,20 @@
+import os
+
+# 벡터 타일(/geo/tiles/{z}/{x}/{y}) 설정
+TILE_MAX_ZOOM = int(os.getenv("TILE_MAX_ZOOM", "20"))
+# 이 줌 이상에서 parcel_geometry_data 에 저장된 필지 경계를 함께 그림
+PARCEL_TILE_MIN_ZOOM = int(os.getenv("PARCEL_TILE_MIN_ZOOM", "15"))
+
+# 타일 캐시: 메모리 LRU + (TILE_CACHE_DIR 를 지정하면) <디렉터리>/z/x/y.mvt 파일
+TILE_CACHE_SIZE = int(os.getenv("TILE_CACHE_SIZE", "5000"))
+TILE_CACHE_TTL = int(os.getenv("TILE_CACHE_TTL", str(60 * 60 * 24 * 7)))
+TILE_CACHE_DIR = os.getenv("TILE_CACHE_DIR")
+# 필지 경계가 들어가는 타일은 새로 저장되는 필지가 있으므로 메모리에만 짧게 보관
+PARCEL_TILE_CACHE_TTL = int(os.getenv("PARCEL_TILE_CACHE_TTL", str(60 * 10)))
+
+# src/seed_tiles.py 가 미리 만들어 두는 최대 줌
+TILE_SEED_MAX_ZOOM = int(os.getenv("TILE_SEED_MAX_ZOOM", "10"))
+
+# 지도 범위(viewport) 경계 조회 한 페이지의 기본/최대 경계 수
+VIEWPORT_PAGE_SIZE = int(os.getenv("VIEWPORT_PAGE_SIZE", "100"))
+VIEWPORT_MAX_PAGE_SIZE = int(os.getenv("VIEWPORT_MAX_PAGE_SIZE", "500"))
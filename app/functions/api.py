@@ -1,5 +1,18 @@
-import requests
 import json
+import threading
+import time
+from typing import Callable, Optional, Tuple
+from app.config.cache import (
+    API_CACHE_SIZE,
+    API_CACHE_TTL,
+    API_CACHE_DB_PATH,
+    PERIOD_REFRESH_INTERVAL,
+)
+from app.functions.cache import MISSING, TieredCache, TTLCache, make_cache
+from app.functions.http_client import HTTPClient, get_http_client
+
+# 필지 단위 VWorld 응답 캐시 (토지특성, 토지이용계획은 길어야 1년에 한 번 바뀜)
+parcel_cache = make_cache(API_CACHE_SIZE, API_CACHE_TTL, API_CACHE_DB_PATH)
 
 
 def _calc_date(year: int, month: int) -> tuple:
@@ -9,6 +22,83 @@ def _calc_date(year: int, month: int) -> tuple:
         return year, month - 1
 
 
+# 조회 기간 (연, 월). 연 단위 데이터셋은 월을 0 으로 둔다.
+Period = Tuple[int, int]
+
+
+def _prev_month(period: Period) -> Period:
+    return _calc_date(*period)
+
+
+def _prev_year(period: Period) -> Period:
+    return period[0] - 1, period[1]
+
+
+class PublishedPeriodTracker:
+    """데이터셋별로 가장 최근에 공표된 기간을 학습하여 조회 시작 기간으로 사용한다.
+
+    아직 공표되지 않은 기간부터 한 단계씩 거슬러 올라가는 대신, 학습한 최신 기간을
+    바로 조회하므로 대부분의 조회가 한 번의 요청으로 끝난다. 학습한 값은
+    refresh_interval 이 지나면 다시 요청 기간부터 확인하여 갱신한다.
+    """
+
+    def __init__(self, refresh_interval: float) -> None:
+        self.refresh_interval = refresh_interval
+        self._latest = {}  # dataset -> (period, learned_at)
+        self._lock = threading.Lock()
+
+    def latest(self, dataset: str) -> Optional[Period]:
+        known = self._latest.get(dataset)
+        if known and time.monotonic() - known[1] < self.refresh_interval:
+            return known[0]
+        return None
+
+    def start(self, dataset: str, period: Period) -> Period:
+        latest = self.latest(dataset)
+        if latest is not None and period > latest:
+            return latest
+        return period
+
+    def learn(self, dataset: str, found: Period) -> None:
+        with self._lock:
+            known = self._latest.get(dataset)
+            # 공표 기간은 뒤로 가지 않으므로 더 이른 기간으로는 덮어쓰지 않음
+            if known is None or found >= known[0]:
+                self._latest[dataset] = (found, time.monotonic())
+
+
+period_tracker = PublishedPeriodTracker(PERIOD_REFRESH_INTERVAL)
+
+
+def _find_latest(
+    dataset: str,
+    period: Period,
+    fetch: Callable[[Period], tuple],
+    prev: Callable[[Period], Period],
+    learn_steps: int,
+    with_period: bool = False,
+):
+    """요청 기간 이하에서 가장 최근에 공표된 기간의 데이터를 조회한다.
+
+    fetch(period) 는 (공표 여부, 결과) 를 반환한다. 요청 기간이 미공표임을 확인하고
+    learn_steps 단계 이내에서 찾은 기간만 최신 기간으로 학습한다 (특정 필지/지역에만
+    없는 자료로 잘못 학습하지 않도록). with_period 이면 (실제 공표 기간, 결과) 를
+    반환한다.
+    """
+    # 학습한 최신 기간이 없거나 만료된 경우에만 요청 기간부터 확인하며 새로 학습
+    probing = period_tracker.latest(dataset) is None
+    period, steps = period_tracker.start(dataset, period), 0
+    while True:
+        published, result = fetch(period)
+        if published:
+            if probing and 1 <= steps <= learn_steps:
+                period_tracker.learn(dataset, period)
+            return (period, result) if with_period else result
+        if period[0] < 2015:
+            return (None, None) if with_period else None
+        period, steps = prev(period), steps + 1
+
+
 class GetGeometryDataAPI:
     # 요청 파라미터 (변동되지 않음)
     service = "data"
@@ -16,13 +106,14 @@ class GetGeometryDataAPI:
     page = 1
     size = 1000
 
-    def __init__(self, key: str) -> None:
+    def __init__(self, key: str, client: HTTPClient = None) -> None:
         self.key = key
+        self.client = client or get_http_client()
 
     # 엔드포인트
     endpoint = "http://api.vworld.kr/req/data"
 
-    def get_data(self, pnu):
+    def _request_url(self, pnu: str) -> str:
         if len(pnu) == 19:
             data = "LP_PA_CBND_BUBUN"
             attrFilter = f"pnu:=:{pnu}"
@@ -36,18 +127,29 @@ class GetGeometryDataAPI:
             data = "LT_C_ADSIDO_INFO"
             attrFilter = f"ctprvn_cd:LIKE:{pnu}"
 
-        url = f"{self.endpoint}?service={self.service}&request={self.req}&data={data}&key={self.key}&attrFilter={attrFilter}&page={self.page}&size={self.size}"
-        response = json.loads(requests.get(url).text)
+        return f"{self.endpoint}?service={self.service}&request={self.req}&data={data}&key={self.key}&attrFilter={attrFilter}&page={self.page}&size={self.size}"
+
+    @staticmethod
+    def _parse(response: dict):
         if response["response"]["status"] == "NOT_FOUND":
             return None
         else:
             return response["response"]["result"]["featureCollection"]
 
+    def get_data(self, pnu):
+        response = json.loads(self.client.get(self._request_url(pnu)).text)
+        return self._parse(response)
+
 
 class LandFeatureAPI:
     url = "https://api.vworld.kr/ned/data/getLandCharacteristics"
+    cache: TieredCache = parcel_cache
+    # 연 단위로 공표되며, 1년 넘게 비어 있는 필지로는 최신 기간을 학습하지 않음
+    dataset = "getLandCharacteristics"
+    learn_steps = 1
 
-    def __init__(self, key: str) -> None:
+    def __init__(self, key: str, client: HTTPClient = None) -> None:
+        self.client = client or get_http_client()
         self.default_params = {
             "key": key,
             "format": "json",
@@ -55,32 +157,55 @@ class LandFeatureAPI:
             "pageNo": "1",
         }
 
-    def get_data(self, pnu: str, year: int, assorted=False):
+    def _params(self, pnu: str, year: int) -> dict:
         params = {"pnu": pnu, "stdrYear": year}
         params.update(self.default_params)
-        response = requests.get(self.url, params=params).json()
+        return params
+
+    @staticmethod
+    def _parse(response: dict, assorted: bool):
         if "landCharacteristicss" in response:
             if assorted:
                 return response["landCharacteristicss"]["field"]
             else:
                 return response["landCharacteristicss"]["field"][0]
-        else:
-            if year < 2015:
-                return None
-            else:
-                return self.get_data(pnu, year - 1, assorted)
+        return None
+
+    @staticmethod
+    def _cache_key(pnu: str, year: int, assorted: bool) -> tuple:
+        return ("LandFeatureAPI", pnu, int(year), bool(assorted))
+
+    def get_data(self, pnu: str, year: int, assorted=False):
+        key = self._cache_key(pnu, year, assorted)
+        result = self.cache.get(key)
+        if result is not MISSING:
+            return result
+
+        def fetch(period):
+            params = self._params(pnu, period[0])
+            response = self.client.get(self.url, params=params).json()
+            result = self._parse(response, assorted)
+            return result is not None, result
+
+        result = _find_latest(
+            self.dataset, (year, 0), fetch, _prev_year, self.learn_steps
+        )
+        if result is not None:
+            self.cache.set(key, result)
+        return result
 
 
 class LandTradeAPI:
     url = "http://openapi.molit.go.kr/OpenAPI_ToolInstallPackage/service/rest/RTMSOBJSvc/getRTMSDataSvcLandTrade"
 
-    def __init__(self, key: str) -> None:
+    def __init__(self, key: str, client: HTTPClient = None) -> None:
+        self.client = client or get_http_client()
         self.default_params = {"serviceKey": key, "numOfRows": "100", "pageNo": "1"}
 
     def get_data(self, pnu: str, year: int, month: int):
         params = {"LAWD_CD": pnu, "DEAL_YMD": f"{year:04d}{month:02d}"}
         params.update(self.default_params)
-        # response = xmltodict.parse(requests.get(self.url, params=params).text)
+        # response = xmltodict.parse(self.client.get(self.url, params=params).text)
         return None
         if response["response"]["header"]["resultCode"] == "00":
             if response["response"]["body"]["totalCount"] == "0":
@@ -91,8 +216,10 @@ class LandTradeAPI:
 
 class LandUsePlanAPI:
     url = "https://api.vworld.kr/ned/data/getLandUseAttr"
+    cache: TieredCache = parcel_cache
 
-    def __init__(self, key: str) -> None:
+    def __init__(self, key: str, client: HTTPClient = None) -> None:
+        self.client = client or get_http_client()
         self.default_params = {
             "key": key,
             "format": "json",
@@ -100,10 +227,13 @@ class LandUsePlanAPI:
             "pageNo": "1",
         }
 
-    def get_data(self, pnu: str, return2name=False):
+    def _params(self, pnu: str) -> dict:
         params = {"pnu": pnu}
         params.update(self.default_params)
-        response = requests.get(self.url, params=params).json()
+        return params
+
+    @staticmethod
+    def _parse(response: dict, return2name: bool):
         if "landUses" in response:
             datas = response["landUses"]["field"]
             land_use_plan_list = []
@@ -126,12 +256,34 @@ class LandUsePlanAPI:
         else:
             return None
 
+    @staticmethod
+    def _cache_key(pnu: str, return2name: bool) -> tuple:
+        return ("LandUsePlanAPI", pnu, bool(return2name))
+
+    def get_data(self, pnu: str, return2name=False):
+        key = self._cache_key(pnu, return2name)
+        result = self.cache.get(key)
+        if result is not MISSING:
+            return result
+        response = self.client.get(self.url, params=self._params(pnu)).json()
+        result = self._parse(response, return2name)
+        if result is not None:
+            self.cache.set(key, result)
+        return result
+
 
 class FluctuationRateOfLandPriceAPI:
     by_region_url = "https://api.vworld.kr/ned/data/getByRegion"
     by_large_region_url = "https://api.vworld.kr/ned/data/getLargeCLByRegion"
-
-    def __init__(self, key: str) -> None:
+    by_region_dataset = "getByRegion"
+    by_large_region_dataset = "getLargeCLByRegion"
+    learn_steps = 3
+    # 권역별 지가변동률은 한 번의 요청으로 전국 시도 자료가 오므로 월별로 통째로 보관
+    # (year, month) -> {시도 코드: 자료}
+    large_region_cache = TTLCache(maxsize=36, ttl=API_CACHE_TTL)
+
+    def __init__(self, key: str, client: HTTPClient = None) -> None:
+        self.client = client or get_http_client()
         self.default_params = {
             "key": key,
             "format": "json",
@@ -140,70 +292,137 @@ class FluctuationRateOfLandPriceAPI:
             "scopeDiv": "A",
         }
 
-    def get_data_by_region(self, ld_code: str, year: int, month: int):
+    def _by_region_params(self, ld_code: str, year: int, month: int) -> dict:
         params = {"reqLdCode": ld_code, "stdrYear": year, "stdrMt": f"{month:02d}"}
         params.update(self.default_params)
-        response = requests.get(self.by_region_url, params=params).json()
-        if "byRegions" in response:
-            return response["byRegions"]["field"][0]
-        else:
-            if year < 2015:
-                return None
-            else:
-                _year, _month = _calc_date(year, month)
-                return self.get_data_by_region(ld_code, _year, _month)
+        return params
 
-    def get_data_by_large_region(self, ld_code: str, year: int, month: int):
+    def _by_large_region_params(self, year: int, month: int) -> dict:
         params = {"stdrYear": year, "stdrMt": f"{month:02d}"}
         params.update(self.default_params)
-        response = requests.get(self.by_large_region_url, params=params).json()
+        return params
+
+    @staticmethod
+    def _parse_by_region(response: dict):
         if "byRegions" in response:
-            for data in response["byRegions"]["field"]:
-                if data["ldCtprvnCode"] == ld_code[0:2]:
-                    return data
-        else:
-            if year < 2015:
-                return None
-            else:
-                _year, _month = _calc_date(year, month)
-                return self.get_data_by_large_region(ld_code, _year, _month)
+            return response["byRegions"]["field"][0]
+        return None
+
+    @staticmethod
+    def _parse_by_large_region(response: dict):
+        if "byRegions" in response:
+            return {d["ldCtprvnCode"]: d for d in response["byRegions"]["field"]}
+        return None
+
+    def get_data_by_region(
+        self, ld_code: str, year: int, month: int, with_period: bool = False
+    ):
+        def fetch(period):
+            params = self._by_region_params(ld_code, *period)
+            response = self.client.get(self.by_region_url, params=params).json()
+            result = self._parse_by_region(response)
+            return result is not None, result
+
+        return _find_latest(
+            self.by_region_dataset,
+            (year, month),
+            fetch,
+            _prev_month,
+            self.learn_steps,
+            with_period,
+        )
+
+    def get_large_region_table(self, year: int, month: int, with_period: bool = False):
+        """해당 월(미공표 시 가장 최근 월)의 시도 코드별 권역 지가변동률을 반환한다."""
+
+        def fetch(period):
+            table = self.large_region_cache.get(period)
+            if table is MISSING:
+                params = self._by_large_region_params(*period)
+                response = self.client.get(self.by_large_region_url, params=params)
+                table = self._parse_by_large_region(response.json())
+                if table is not None:
+                    self.large_region_cache.set(period, table)
+            return table is not None, table
+
+        return _find_latest(
+            self.by_large_region_dataset,
+            (year, month),
+            fetch,
+            _prev_month,
+            self.learn_steps,
+            with_period,
+        )
+
+    def get_data_by_large_region(
+        self, ld_code: str, year: int, month: int, with_period: bool = False
+    ):
+        period, table = self.get_large_region_table(year, month, with_period=True)
+        result = table.get(ld_code[0:2]) if table is not None else None
+        return (period, result) if with_period else result
 
 
 class ProducerPriceIndexAPI:
     url = "https://ecos.bok.or.kr/api/StatisticSearch"
+    dataset = "ecos/404Y014"
+    learn_steps = 3
 
-    def __init__(self, key: str) -> None:
+    def __init__(self, key: str, client: HTTPClient = None) -> None:
+        self.client = client or get_http_client()
         self.url += f"/{key}/json/kr/1/100/404Y014/M"
 
-    def get_data(self, year: int, month: int):
-        response = requests.get(
-            f"{self.url}/{year:04d}{month:02d}/{year:04d}{month:02d}/*AA/?/?/?"
-        ).json()
+    def _request_url(self, year: int, month: int) -> str:
+        return f"{self.url}/{year:04d}{month:02d}/{year:04d}{month:02d}/*AA/?/?/?"
+
+    @staticmethod
+    def _parse(response: dict):
         if "StatisticSearch" in response:
             return float(response["StatisticSearch"]["row"][0]["DATA_VALUE"])
-        else:
-            if year < 2015:
-                return None
-            else:
-                _year, _month = _calc_date(year, month)
-                return self.get_data(_year, _month)
+        return None
+
+    def get_data(self, year: int, month: int, with_period: bool = False):
+        def fetch(period):
+            result = self._parse(self.client.get(self._request_url(*period)).json())
+            return result is not None, result
+
+        return _find_latest(
+            self.dataset,
+            (year, month),
+            fetch,
+            _prev_month,
+            self.learn_steps,
+            with_period,
+        )
 
 
 class ConsumerPriceIndexAPI:
     url = "https://ecos.bok.or.kr/api/StatisticSearch"
+    dataset = "ecos/901Y009"
+    learn_steps = 3
 
-    def __init__(self, key: str) -> None:
+    def __init__(self, key: str, client: HTTPClient = None) -> None:
+        self.client = client or get_http_client()
         self.url += f"/{key}/json/kr/1/100/901Y009/M"
 
-    def get_data(self, year: int, month: int):
-        response = requests.get(
-            f"{self.url}/{year:04d}{month:02d}/{year:04d}{month:02d}/0/?/?/?"
-        ).json()
+    def _request_url(self, year: int, month: int) -> str:
+        return f"{self.url}/{year:04d}{month:02d}/{year:04d}{month:02d}/0/?/?/?"
+
+    @staticmethod
+    def _parse(response: dict):
         if "StatisticSearch" in response:
             return float(response["StatisticSearch"]["row"][0]["DATA_VALUE"])
-        else:
-            if year < 2015:
-                return None
-            else:
-                _year, _month = _calc_date(year, month)
-                return self.get_data(_year, _month)
+        return None
+
+    def get_data(self, year: int, month: int, with_period: bool = False):
+        def fetch(period):
+            result = self._parse(self.client.get(self._request_url(*period)).json())
+            return result is not None, result
+
+        return _find_latest(
+            self.dataset,
+            (year, month),
+            fetch,
+            _prev_month,
+            self.learn_steps,
+            with_period,
+        )
@@ -0,0 +1,214 @@
+import json
+from typing import Awaitable, Callable
+from app.functions.api import (
+    Period,
+    _prev_month,
+    _prev_year,
+    period_tracker,
+    GetGeometryDataAPI,
+    LandFeatureAPI,
+    LandUsePlanAPI,
+    FluctuationRateOfLandPriceAPI,
+    ProducerPriceIndexAPI,
+    ConsumerPriceIndexAPI,
+)
+from app.functions.cache import MISSING
+from app.functions.http_client import AsyncHTTPClient, get_async_http_client
+
+
+async def _afind_latest(
+    dataset: str,
+    period: Period,
+    fetch: Callable[[Period], Awaitable[tuple]],
+    prev: Callable[[Period], Period],
+    learn_steps: int,
+):
+    """api._find_latest 의 비동기 버전 (같은 PublishedPeriodTracker 를 공유)."""
+    probing = period_tracker.latest(dataset) is None
+    period, steps = period_tracker.start(dataset, period), 0
+    while True:
+        published, result = await fetch(period)
+        if published:
+            if probing and 1 <= steps <= learn_steps:
+                period_tracker.learn(dataset, period)
+            return result
+        if period[0] < 2015:
+            return None
+        period, steps = prev(period), steps + 1
+
+
+class _AsyncClientMixin:
+    # 생성 시점에 이벤트 루프가 없을 수 있으므로 공용 클라이언트는 호출 시점에 가져옴
+    async_client: AsyncHTTPClient = None
+
+    @property
+    def aclient(self) -> AsyncHTTPClient:
+        return self.async_client or get_async_http_client()
+
+
+class AsyncGetGeometryDataAPI(_AsyncClientMixin, GetGeometryDataAPI):
+    def __init__(self, key: str, client: AsyncHTTPClient = None) -> None:
+        super().__init__(key)
+        self.async_client = client
+
+    async def get_data(self, pnu):
+        response = await self.aclient.get(self._request_url(pnu))
+        return self._parse(json.loads(response.text))
+
+
+class AsyncLandFeatureAPI(_AsyncClientMixin, LandFeatureAPI):
+    def __init__(self, key: str, client: AsyncHTTPClient = None) -> None:
+        super().__init__(key)
+        self.async_client = client
+
+    async def get_data(self, pnu: str, year: int, assorted=False):
+        key = self._cache_key(pnu, year, assorted)
+        result = self.cache.get(key)
+        if result is not MISSING:
+            return result
+
+        async def fetch(period):
+            params = self._params(pnu, period[0])
+            response = await self.aclient.get(self.url, params=params)
+            result = self._parse(response.json(), assorted)
+            return result is not None, result
+
+        result = await _afind_latest(
+            self.dataset, (year, 0), fetch, _prev_year, self.learn_steps
+        )
+        if result is not None:
+            self.cache.set(key, result)
+        return result
+
+
+class AsyncLandUsePlanAPI(_AsyncClientMixin, LandUsePlanAPI):
+    def __init__(self, key: str, client: AsyncHTTPClient = None) -> None:
+        super().__init__(key)
+        self.async_client = client
+
+    async def get_data(self, pnu: str, return2name=False):
+        key = self._cache_key(pnu, return2name)
+        result = self.cache.get(key)
+        if result is not MISSING:
+            return result
+        response = await self.aclient.get(self.url, params=self._params(pnu))
+        result = self._parse(response.json(), return2name)
+        if result is not None:
+            self.cache.set(key, result)
+        return result
+
+
+class AsyncFluctuationRateOfLandPriceAPI(
+    _AsyncClientMixin, FluctuationRateOfLandPriceAPI
+):
+    def __init__(self, key: str, client: AsyncHTTPClient = None) -> None:
+        super().__init__(key)
+        self.async_client = client
+
+    async def get_data_by_region(self, ld_code: str, year: int, month: int):
+        async def fetch(period):
+            params = self._by_region_params(ld_code, *period)
+            response = await self.aclient.get(self.by_region_url, params=params)
+            result = self._parse_by_region(response.json())
+            return result is not None, result
+
+        return await _afind_latest(
+            self.by_region_dataset, (year, month), fetch, _prev_month, self.learn_steps
+        )
+
+    async def get_large_region_table(self, year: int, month: int):
+        async def fetch(period):
+            table = self.large_region_cache.get(period)
+            if table is MISSING:
+                params = self._by_large_region_params(*period)
+                response = await self.aclient.get(
+                    self.by_large_region_url, params=params
+                )
+                table = self._parse_by_large_region(response.json())
+                if table is not None:
+                    self.large_region_cache.set(period, table)
+            return table is not None, table
+
+        return await _afind_latest(
+            self.by_large_region_dataset,
+            (year, month),
+            fetch,
+            _prev_month,
+            self.learn_steps,
+        )
+
+    async def get_data_by_large_region(self, ld_code: str, year: int, month: int):
+        table = await self.get_large_region_table(year, month)
+        return table.get(ld_code[0:2]) if table is not None else None
+
+
+class AsyncProducerPriceIndexAPI(_AsyncClientMixin, ProducerPriceIndexAPI):
+    def __init__(self, key: str, client: AsyncHTTPClient = None) -> None:
+        super().__init__(key)
+        self.async_client = client
+
+    async def get_data(self, year: int, month: int):
+        async def fetch(period):
+            response = await self.aclient.get(self._request_url(*period))
+            result = self._parse(response.json())
+            return result is not None, result
+
+        return await _afind_latest(
+            self.dataset, (year, month), fetch, _prev_month, self.learn_steps
+        )
+
+
+class AsyncConsumerPriceIndexAPI(_AsyncClientMixin, ConsumerPriceIndexAPI):
+    def __init__(self, key: str, client: AsyncHTTPClient = None) -> None:
+        super().__init__(key)
+        self.async_client = client
+
+    async def get_data(self, year: int, month: int):
+        async def fetch(period):
+            response = await self.aclient.get(self._request_url(*period))
+            result = self._parse(response.json())
+            return result is not None, result
+
+        return await _afind_latest(
+            self.dataset, (year, month), fetch, _prev_month, self.learn_steps
+        )
+
+
+class AsyncKakaoLocalAPI(_AsyncClientMixin):
+    """PyKakao.Local(dataframe=False) 과 같은 형태의 응답을 돌려주는 카카오 로컬 API."""
+
+    url = "https://dapi.kakao.com/v2/local"
+
+    def __init__(self, key: str, client: AsyncHTTPClient = None) -> None:
+        self.headers = {"Authorization": f"KakaoAK {key}"}
+        self.async_client = client
+
+    async def _get(self, path: str, params: dict) -> dict:
+        response = await self.aclient.get(
+            f"{self.url}{path}", params=params, headers=self.headers
+        )
+        return response.json()
+
+    async def search_address(self, query: str) -> dict:
+        return await self._get("/search/address.json", {"query": query})
+
+    async def search_keyword(self, query: str, size: int = 15) -> dict:
+        return await self._get("/search/keyword.json", {"query": query, "size": size})
+
+    async def search_category(
+        self, category_group_code: str, x, y, radius: int, sort: str = "accuracy"
+    ) -> dict:
+        params = {
+            "category_group_code": category_group_code,
+            "x": x,
+            "y": y,
+            "radius": radius,
+            "sort": sort,
+        }
+        return await self._get("/search/category.json", params)
+
+    async def geo_coord2address(self, x: float, y: float) -> dict:
+        return await self._get("/geo/coord2address.json", {"x": x, "y": y})
+
+    async def geo_coord2regioncode(self, x: float, y: float) -> dict:
+        return await self._get("/geo/coord2regioncode.json", {"x": x, "y": y})
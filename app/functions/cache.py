@@ -0,0 +1,224 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional, Union
+
+# 캐시에 값이 없음을 나타내는 표식 (None 도 값으로 저장할 수 있도록 구분)
+MISSING = object()
+
+
+class TTLCache:
+    """크기 제한이 있는 LRU 메모리 캐시. 항목마다 만료 시간을 가진다."""
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = MISSING) -> Any:
+        with self._lock:
+            item = self._data.get(key)
+            if item is not None:
+                expires_at, value = item
+                if expires_at > time.monotonic():
+                    self._data.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._data[key]
+            self.misses += 1
+            return default
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def delete(self, key: Hashable) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def stats(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+        }
+
+
+class SQLiteCache:
+    """프로세스 재시작 후에도 유지되는 SQLite 파일 캐시. 값은 JSON 으로 저장한다."""
+
+    def __init__(self, path: str, ttl: float) -> None:
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache "
+            "(key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL)"
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def _key(key: Hashable) -> str:
+        return json.dumps(key, ensure_ascii=False)
+
+    def get(self, key: Hashable, default: Any = MISSING) -> Any:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, expires_at FROM cache WHERE key = ?", (self._key(key),)
+            ).fetchone()
+            if row is not None and row[1] > time.time():
+                self.hits += 1
+                return json.loads(row[0])
+            self.misses += 1
+            return default
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        expires_at = time.time() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._conn.execute(
+                "REPLACE INTO cache (key, value, expires_at) VALUES (?, ?, ?)",
+                (self._key(key), json.dumps(value, ensure_ascii=False), expires_at),
+            )
+            self._conn.commit()
+
+    def delete(self, key: Hashable) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM cache WHERE key = ?", (self._key(key),))
+            self._conn.commit()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM cache")
+            self._conn.commit()
+
+    def stats(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+        }
+
+
+class DirectoryCache:
+    """바이트 값을 키 경로의 파일(<root>/<키 요소>/.../<마지막 요소><suffix>)로 저장하는 캐시.
+
+    벡터 타일처럼 JSON 으로 담기 어려운 바이너리 값을 위해 사용하며, 만료 여부는
+    파일 수정 시각으로 판단한다. 키는 문자열/정수로 된 튜플이어야 한다.
+    """
+
+    def __init__(self, root: str, ttl: float, suffix: str = "") -> None:
+        self.root = root
+        self.ttl = ttl
+        self.suffix = suffix
+        self.hits = 0
+        self.misses = 0
+
+    def _path(self, key: Hashable) -> str:
+        parts = [str(part) for part in (key if isinstance(key, tuple) else (key,))]
+        return os.path.join(self.root, *parts[:-1], parts[-1] + self.suffix)
+
+    def get(self, key: Hashable, default: Any = MISSING) -> Any:
+        path = self._path(key)
+        try:
+            if os.path.getmtime(path) + self.ttl > time.time():
+                with open(path, "rb") as f:
+                    value = f.read()
+                self.hits += 1
+                return value
+        except OSError:
+            pass
+        self.misses += 1
+        return default
+
+    def set(self, key: Hashable, value: bytes, ttl: Optional[float] = None) -> None:
+        # 항목별 ttl 은 지원하지 않음 (수정 시각 + 캐시 ttl 로 만료)
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(value)
+        os.replace(tmp_path, path)
+
+    def delete(self, key: Hashable) -> None:
+        try:
+            os.remove(self._path(key))
+        except FileNotFoundError:
+            pass
+
+    def clear(self) -> None:
+        for directory, _, files in os.walk(self.root):
+            for name in files:
+                if name.endswith(self.suffix):
+                    os.remove(os.path.join(directory, name))
+
+    def stats(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+        }
+
+
+class TieredCache:
+    """메모리 LRU 캐시를 먼저 조회하고, 없으면 (선택적인) 파일 캐시를 조회한다."""
+
+    def __init__(
+        self, memory: TTLCache, disk: Optional[Union[SQLiteCache, DirectoryCache]] = None
+    ) -> None:
+        self.memory = memory
+        self.disk = disk
+
+    def get(self, key: Hashable, default: Any = MISSING) -> Any:
+        value = self.memory.get(key)
+        if value is MISSING and self.disk is not None:
+            value = self.disk.get(key)
+            if value is not MISSING:
+                self.memory.set(key, value)
+        return default if value is MISSING else value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        self.memory.set(key, value, ttl)
+        if self.disk is not None:
+            self.disk.set(key, value, ttl)
+
+    def delete(self, key: Hashable) -> None:
+        self.memory.delete(key)
+        if self.disk is not None:
+            self.disk.delete(key)
+
+    def clear(self) -> None:
+        self.memory.clear()
+        if self.disk is not None:
+            self.disk.clear()
+
+    def stats(self) -> dict:
+        stats = {"memory": self.memory.stats()}
+        if self.disk is not None:
+            stats["disk"] = self.disk.stats()
+        return stats
+
+
+def make_cache(maxsize: int, ttl: float, db_path: Optional[str] = None) -> TieredCache:
+    disk = SQLiteCache(db_path, ttl) if db_path else None
+    return TieredCache(TTLCache(maxsize, ttl), disk)
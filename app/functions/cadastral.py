@@ -0,0 +1,224 @@
+import asyncio
+import json
+from datetime import datetime, timedelta
+from typing import List, Optional, Tuple
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.dialects.mysql import insert
+from sqlalchemy.orm import Session
+from app.config.cache import PARCEL_GEOMETRY_MAX_AGE
+from app.config.http import CADASTRAL_FETCH_CONCURRENCY
+from app.config.key import VWORLD_API_KEY
+from app.config.tile import PARCEL_TILE_MIN_ZOOM
+from app.functions import geometry, vector_tile
+from app.functions.async_api import AsyncGetGeometryDataAPI
+from app.models.geo import GeometryData, GeometryDataLod, ParcelGeometryData
+
+geo_api = AsyncGetGeometryDataAPI(key=VWORLD_API_KEY)
+
+
+def _clean_parcel(multi_polygon: list) -> list:
+    return [
+        [[float(point[0]), float(point[1])] for point in polygon]
+        for polygon in multi_polygon[0]
+    ]
+
+
+def _parcel_values(pnu: str, multi_polygon: list, now: datetime) -> dict:
+    measured = geometry.measure(multi_polygon)
+    return {
+        "pnu": pnu,
+        "centroid_lat": measured["centroid_lat"],
+        "centroid_lng": measured["centroid_lng"],
+        "multi_polygon": json.dumps(multi_polygon),
+        "fetched_at": now,
+    }
+
+
+def get_region_polygons(
+    codes: List[str], db: Session, level: Optional[int] = None
+) -> dict:
+    """시도/시군구/읍면동 경계를 IN 쿼리 한 번으로 읽어 {코드: JSON 바이트} 로 반환한다.
+
+    level(geometry.lod_level 로 고른 줌 레벨)을 주면 geometry_data_lod 의 단순화된
+    경계를 사용하고, 해당 레벨이 아직 만들어지지 않은 코드만 원본 경계를 읽는다.
+    원본 경계는 저장된 JSON 문자열을 파싱/직렬화 없이 그대로 사용한다
+    (가장 큰 시도 기준 바이너리를 다시 직렬화하는 것보다 수십 배 빠름,
+    src/benchmark_json.py 참고).
+    """
+    codes = list(set(codes))
+    if not codes:
+        return {}
+    result = {}
+    if level is not None:
+        rows = (
+            db.query(GeometryDataLod.pnu, GeometryDataLod.geometry)
+            .filter(GeometryDataLod.pnu.in_(codes), GeometryDataLod.level == level)
+            .all()
+        )
+        result.update((pnu, geometry.to_json_bytes(packed)) for pnu, packed in rows)
+        codes = [code for code in codes if code not in result]
+        if not codes:
+            return result
+    rows = (
+        db.query(GeometryData.pnu, GeometryData.multi_polygon)
+        .filter(GeometryData.pnu.in_(codes))
+        .all()
+    )
+    result.update((pnu, multi_polygon.encode("utf-8")) for pnu, multi_polygon in rows)
+    return result
+
+
+def _load_parcels(pnus: List[str], db: Session) -> dict:
+    rows = (
+        db.query(
+            ParcelGeometryData.pnu,
+            ParcelGeometryData.multi_polygon,
+            ParcelGeometryData.fetched_at,
+        )
+        .filter(ParcelGeometryData.pnu.in_(pnus))
+        .all()
+    )
+    return {pnu: (multi_polygon, fetched_at) for pnu, multi_polygon, fetched_at in rows}
+
+
+def _save_parcels(parcels: dict, now: datetime, db: Session) -> None:
+    # 같은 필지를 동시에 저장하는 요청이 있어도 충돌하지 않도록 INSERT ... ON DUPLICATE
+    # KEY UPDATE 한 번으로 기록
+    statement = insert(ParcelGeometryData)
+    statement = statement.on_duplicate_key_update(
+        centroid_lat=statement.inserted.centroid_lat,
+        centroid_lng=statement.inserted.centroid_lng,
+        multi_polygon=statement.inserted.multi_polygon,
+        fetched_at=statement.inserted.fetched_at,
+    )
+    db.execute(
+        statement,
+        [
+            _parcel_values(pnu, multi_polygon, now)
+            for pnu, multi_polygon in parcels.items()
+        ],
+    )
+    db.commit()
+
+
+async def get_parcel_polygons(pnus: List[str], db: Session) -> dict:
+    """19자리 필지 경계를 반환한다. 찾지 못한 필지의 값은 None 이다.
+
+    parcel_geometry_data 에 PARCEL_GEOMETRY_MAX_AGE 이내에 저장된 경계는 그대로 사용하고,
+    없거나 오래된 필지만 VWorld 에서 동시에 (CADASTRAL_FETCH_CONCURRENCY 개씩) 가져와
+    저장한다. VWorld 요청이 실패하거나 결과가 없으면 오래된 경계라도 저장된 값을 사용한다.
+    DB 조회와 저장은 이벤트 루프를 막지 않도록 스레드 풀에서 실행한다.
+    """
+    pnus = list(dict.fromkeys(pnus))
+    if not pnus:
+        return {}
+    now = datetime.now()
+    stored = await run_in_threadpool(_load_parcels, pnus, db)
+    cutoff = now - timedelta(seconds=PARCEL_GEOMETRY_MAX_AGE)
+    result = {
+        pnu: json.loads(multi_polygon)
+        for pnu, (multi_polygon, fetched_at) in stored.items()
+        if fetched_at is not None and fetched_at >= cutoff
+    }
+    fetched = {}
+    semaphore = asyncio.Semaphore(CADASTRAL_FETCH_CONCURRENCY)
+
+    async def fetch(pnu: str) -> Optional[list]:
+        async with semaphore:
+            try:
+                response = await geo_api.get_data(pnu=pnu)
+            except Exception as e:
+                if pnu not in stored:
+                    raise
+                print(f"# {pnu}: {e}")
+                response = None
+        if not response:
+            return json.loads(stored[pnu][0]) if pnu in stored else None
+        multi_polygon = response["features"][0]["geometry"]["coordinates"]
+        fetched[pnu] = multi_polygon
+        return multi_polygon
+
+    targets = [pnu for pnu in pnus if pnu not in result]
+    if targets:
+        result.update(zip(targets, await asyncio.gather(*map(fetch, targets))))
+    if fetched:
+        await run_in_threadpool(_save_parcels, fetched, now, db)
+    return {
+        pnu: _clean_parcel(result[pnu]) if result.get(pnu) else None for pnu in pnus
+    }
+
+
+async def get_cadastral_polygons(
+    pnus: List[str], db: Session, level: Optional[int] = None
+) -> List[Optional[bytes]]:
+    """요청 순서대로 각 코드의 지적도 경계를 JSON 바이트로 반환한다. 없는 코드는 None 이다.
+
+    level 은 지역 경계에만 적용되며, 필지 경계는 항상 원본을 반환한다.
+    """
+    parcels = await get_parcel_polygons([pnu for pnu in pnus if len(pnu) == 19], db)
+    regions = await run_in_threadpool(
+        get_region_polygons, [pnu for pnu in pnus if len(pnu) != 19], db, level
+    )
+    result = []
+    for pnu in pnus:
+        if len(pnu) == 19:
+            polygon = parcels.get(pnu)
+            result.append(geometry.dumps(polygon) if polygon is not None else None)
+        else:
+            result.append(regions.get(pnu))
+    return result
+
+
+def get_viewport_polygons(
+    bounds: Tuple[float, float, float, float],
+    zoom: float,
+    page: int,
+    size: int,
+    db: Session,
+) -> Tuple[str, List[Tuple[str, bytes]], bool]:
+    """지도 범위 (서, 남, 동, 북) 와 겹치는 경계를 코드 순서로 한 페이지씩 반환한다.
+
+    줌에 따라 벡터 타일과 같은 지역 단위를 고르고 바운딩 박스 인덱스로 찾으며,
+    PARCEL_TILE_MIN_ZOOM 이상에서는 parcel_geometry_data 에 저장된 필지를 중심점
+    인덱스로 찾는다. (레이어 이름, [(코드, JSON 바이트)], 다음 페이지 여부) 를 반환한다.
+    """
+    west, south, east, north = bounds
+    offset = (page - 1) * size
+    if zoom >= PARCEL_TILE_MIN_ZOOM:
+        margin = vector_tile.PARCEL_MARGIN
+        rows = (
+            db.query(ParcelGeometryData.pnu, ParcelGeometryData.multi_polygon)
+            .filter(
+                ParcelGeometryData.centroid_lng.between(west - margin, east + margin),
+                ParcelGeometryData.centroid_lat.between(south - margin, north + margin),
+            )
+            .order_by(ParcelGeometryData.pnu)
+            .offset(offset)
+            .limit(size + 1)
+            .all()
+        )
+        items = [
+            (pnu, geometry.dumps(_clean_parcel(json.loads(multi_polygon))))
+            for pnu, multi_polygon in rows[:size]
+        ]
+        return vector_tile.PARCEL_LAYER, items, len(rows) > size
+
+    length, layer = vector_tile.region_layer(int(zoom))
+    codes = [
+        pnu
+        for (pnu,) in db.query(GeometryData.pnu)
+        .filter(
+            GeometryData.pnu.like("_" * length),
+            GeometryData.bbox_min_lng <= east,
+            GeometryData.bbox_max_lng >= west,
+            GeometryData.bbox_min_lat <= north,
+            GeometryData.bbox_max_lat >= south,
+        )
+        .order_by(GeometryData.pnu)
+        .offset(offset)
+        .limit(size + 1)
+        .all()
+    ]
+    polygons = get_region_polygons(codes[:size], db, geometry.lod_level(zoom=zoom))
+    items = [(code, polygons[code]) for code in codes[:size] if code in polygons]
+    return layer, items, len(codes) > size
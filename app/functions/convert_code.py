@@ -1,24 +1,83 @@
 import os
+import sys
 import csv
-from typing import Dict, Union
+import bisect
+import threading
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+import numpy as np
 from app.config import BASE_DIR
 
+# 법정동 코드 자릿수 (시도 / 시군구 / 읍면동 / 동리)
+REGION_CODE_LENGTHS = (2, 5, 8, 10)
+ADDRESS_COLUMNS = ("sido", "sigungu", "eupmyeondong", "donglee")
+
+
+class PnuCodeTable:
+    """data/PnuCode.csv 를 한 번만 읽어 프로세스 전역에서 공유하는 인덱스."""
+
+    _instance = None
+    _lock = threading.Lock()
+
+    def __init__(self, path: str) -> None:
+        # code -> (sido, sigungu, eupmyeondong, donglee)
+        self.rows: Dict[str, Tuple[str, str, str, str]] = {}
+        # 2/5/8자리 접두어 -> 해당 접두어로 시작하는 첫 번째 10자리 코드
+        self.prefixes: Dict[str, str] = {}
+        with open(path, encoding="utf-8") as data:
+            reader = csv.reader(data)
+            next(reader)
+            for code, sido, sigungu, eupmyeondong, donglee in reader:
+                # 시도/시군구/읍면동 이름은 중복이 많으므로 같은 문자열 객체를 공유
+                self.rows[code] = (
+                    sys.intern(sido),
+                    sys.intern(sigungu),
+                    sys.intern(eupmyeondong),
+                    donglee,
+                )
+        self.codes: List[str] = sorted(self.rows)
+        for code in self.codes:
+            for n in REGION_CODE_LENGTHS[:-1]:
+                self.prefixes.setdefault(code[:n], code)
+
+    @classmethod
+    def get(cls) -> "PnuCodeTable":
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = cls(os.path.join(BASE_DIR, "data/PnuCode.csv"))
+        return cls._instance
+
+    def find(self, code: str) -> Optional[Tuple[str, str, str, str]]:
+        key = code[:10]
+        row = self.rows.get(key)
+        if row is not None:
+            return row
+        match = self.prefixes.get(key)
+        if match is None and len(key) not in REGION_CODE_LENGTHS:
+            # 2/5/8/10자리가 아닌 접두어는 정렬된 코드 목록에서 탐색
+            i = bisect.bisect_left(self.codes, key)
+            if i < len(self.codes) and self.codes[i].startswith(key):
+                match = self.codes[i]
+        return self.rows[match] if match is not None else None
+
+    def children(self, prefix: str) -> List[str]:
+        """prefix 로 시작하는 10자리 법정동 코드 목록."""
+        i = bisect.bisect_left(self.codes, prefix)
+        result = []
+        while i < len(self.codes) and self.codes[i].startswith(prefix):
+            result.append(self.codes[i])
+            i += 1
+        return result
+
 
 def code2addr(
     code: str, scale: int = 0, dict_format: bool = False
 ) -> Union[str, Dict[str, str]]:
-    with open(os.path.join(BASE_DIR, "data/PnuCode.csv")) as data:
-        csv_mapping = list(csv.DictReader(data))
-    match = next((d for d in csv_mapping if d["code"].startswith(code[:10])), None)
+    match = PnuCodeTable.get().find(code)
     if not match:
         return None
 
-    sido, sigungu, eupmyeondong, donglee = (
-        match["sido"],
-        match["sigungu"],
-        match["eupmyeondong"],
-        match["donglee"],
-    )
+    sido, sigungu, eupmyeondong, donglee = match
 
     if len(code) == 19:
         m = "" if code[10] == "1" else "산"
@@ -44,3 +103,57 @@ def code2addr(
         return {1: sido, 2: sigungu, 3: eupmyeondong}.get(scale, full_address)
 
     return full_address
+
+
+def code2addr_many(codes: Union[Iterable[str], np.ndarray]) -> Dict[str, np.ndarray]:
+    """여러 PNU 코드를 한 번에 주소로 변환하여 컬럼(NumPy 배열) 단위로 반환한다.
+
+    반환값은 sido, sigungu, eupmyeondong, donglee, detail, fulladdr 문자열 배열과
+    코드표에서 찾았는지를 나타내는 resolved 불리언 배열이다. 찾지 못한 코드와
+    19자리가 아닌 코드의 detail 은 빈 문자열이다.
+    """
+    codes = np.asarray(codes, dtype="U19").reshape(-1)
+    table = PnuCodeTable.get()
+
+    # 같은 법정동 코드는 한 번만 조회
+    keys, inverse = np.unique(codes.astype("U10"), return_inverse=True)
+    matches = [table.find(key) for key in keys]
+    key_resolved = np.array([m is not None for m in matches], dtype=bool)
+    key_parts = np.array(
+        [m if m is not None else ("", "", "", "") for m in matches], dtype=str
+    ).reshape(len(keys), len(ADDRESS_COLUMNS))
+    resolved = key_resolved[inverse]
+    parts = key_parts[inverse]
+    columns = {name: parts[:, i] for i, name in enumerate(ADDRESS_COLUMNS)}
+
+    # 19자리 PNU 의 산 여부, 본번, 부번 (문자 코드를 숫자로 직접 변환)
+    is_parcel = (np.char.str_len(codes) == 19) & resolved
+    digits = codes.view(np.uint32).reshape(len(codes), 19)[:, 10:].astype(np.int64)
+    digits -= ord("0")
+    main_n = digits[:, 1:5] @ np.array([1000, 100, 10, 1])
+    sub_n = digits[:, 5:9] @ np.array([1000, 100, 10, 1])
+    main_s = main_n.astype(str)
+    detail = np.where(
+        sub_n != 0, np.char.add(np.char.add(main_s, "-"), sub_n.astype(str)), main_s
+    )
+    detail = np.char.add(np.where(digits[:, 0] == 1, "", "산"), detail)
+    detail = np.where(is_parcel, detail, "")
+
+    full_address = columns["sido"]
+    for part in (
+        columns["sigungu"],
+        columns["eupmyeondong"],
+        np.where(is_parcel, columns["donglee"], ""),
+        detail,
+    ):
+        sep = np.where(np.char.str_len(full_address) > 0, " ", "")
+        full_address = np.where(
+            np.char.str_len(part) > 0,
+            np.char.add(np.char.add(full_address, sep), part),
+            full_address,
+        )
+
+    columns["detail"] = detail
+    columns["fulladdr"] = full_address
+    columns["resolved"] = resolved
+    return columns
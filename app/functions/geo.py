@@ -1,19 +1,80 @@
 from PyKakao import Local
+from app.config.cache import GEO_CACHE_SIZE, GEO_CACHE_TTL, GEO_COORD_PRECISION
 from app.config.key import KAKAO_API_KEY
-from app.functions.convert_code import code2addr
+from app.functions.cache import MISSING, TTLCache
+from app.functions.convert_code import code2addr, PnuCodeTable
+from app.functions.region_index import RegionIndex
+
+# 주소 문자열 → (lat, lng)
+coord_cache = TTLCache(GEO_CACHE_SIZE, GEO_CACHE_TTL)
+# 양자화한 (lat, lng) → (pnu, address)
+pnu_cache = TTLCache(GEO_CACHE_SIZE, GEO_CACHE_TTL)
+# 검색어 → 자동완성 목록
+auto_complete_cache = TTLCache(GEO_CACHE_SIZE, GEO_CACHE_TTL)
+
+
+def _normalize(text: str) -> str:
+    return " ".join(text.split()).casefold()
+
+
+def _quantize(lat: float, lng: float) -> tuple:
+    return (
+        round(float(lat), GEO_COORD_PRECISION),
+        round(float(lng), GEO_COORD_PRECISION),
+    )
+
+
+def cache_stats() -> dict:
+    return {
+        "coord": coord_cache.stats(),
+        "pnu": pnu_cache.stats(),
+        "auto_complete": auto_complete_cache.stats(),
+    }
 
 
 def get_pnu(lat: float, lng: float) -> tuple:
+    key = _quantize(lat, lng)
+    cached = pnu_cache.get(key)
+    if cached is not MISSING:
+        return cached
+    pnu, address = _get_pnu(lat, lng)
+    if pnu is not None:
+        pnu_cache.set(key, (pnu, address))
+    return pnu, address
+
+
+def _local_ld_code(lat: float, lng: float):
+    """geometry_data 경계로 좌표의 10자리 법정동 코드를 찾는다.
+
+    리(里)가 없는 읍면동(법정동 코드가 <읍면동>00 하나뿐인 경우)만 결정할 수 있으며,
+    그 외에는 None 을 반환한다.
+    """
+    try:
+        emd_code = RegionIndex.get().locate(lat, lng)[8]
+    except Exception as e:
+        print(e)
+        return None
+    if emd_code is None:
+        return None
+    if PnuCodeTable.get().children(emd_code) == [emd_code + "00"]:
+        return emd_code + "00"
+    return None
+
+
+def _get_pnu(lat: float, lng: float) -> tuple:
     try:
         local = Local(service_key=KAKAO_API_KEY)
         request_address = local.geo_coord2address(lng, lat, dataframe=False)
-        request_region = local.geo_coord2regioncode(lng, lat, dataframe=False)
 
-        if request_region == None:
-            return None, None
-        i = 0 if request_region["documents"][0]["region_type"] == "B" else 1
-        pnu = request_region["documents"][i]["code"]
-        address = request_region["documents"][i]["address_name"]
+        # 법정동 코드는 가능하면 로컬 경계 인덱스로 찾고, 안 되면 카카오에 요청
+        pnu = _local_ld_code(lat, lng)
+        i = 0
+        if pnu is None:
+            request_region = local.geo_coord2regioncode(lng, lat, dataframe=False)
+            if request_region == None:
+                return None, None
+            i = 0 if request_region["documents"][0]["region_type"] == "B" else 1
+            pnu = request_region["documents"][i]["code"]
 
         if request_address["documents"][i]["address"]["mountain_yn"] == "N":
             mountain = "1"  # 산 X
@@ -33,6 +94,11 @@ def get_pnu(lat: float, lng: float) -> tuple:
 
 
 def get_coord(word: str) -> tuple:
+    key = _normalize(word)
+    cached = coord_cache.get(key)
+    if cached is not MISSING:
+        return cached
+
     local = Local(service_key=KAKAO_API_KEY)
     address = local.search_address(word, dataframe=False)
 
@@ -40,10 +106,15 @@ def get_coord(word: str) -> tuple:
         return None, None
     lng = float(address["documents"][0]["x"])
     lat = float(address["documents"][0]["y"])
+    coord_cache.set(key, (lat, lng))
     return lat, lng
 
 
 def auto_complete_address(query: str):
+    key = _normalize(query)
+    cached = auto_complete_cache.get(key)
+    if cached is not MISSING:
+        return cached
     try:
         local = Local(service_key=KAKAO_API_KEY)
         response = local.search_keyword(query, dataframe=False, size=15)["documents"]
@@ -57,6 +128,7 @@ def auto_complete_address(query: str):
                     "lng": r["x"],
                 }
             )
+        auto_complete_cache.set(key, related_search)
     except:
         related_search = []
     return related_search
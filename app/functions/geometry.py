@@ -0,0 +1,196 @@
+import json
+import struct
+from typing import List, Optional
+import numpy as np
+import shapely
+
+try:
+    import orjson
+except ImportError:  # orjson 이 없으면 표준 json 으로 직렬화
+    orjson = None
+
+# 바이너리 지오메트리 형식
+#   magic(4) | 링 수 n(uint32) | 다각형 수 m(uint32)
+#   | 다각형별 링 수 (uint32 x m) | 링별 점 수 (uint32 x n)
+#   | 좌표 [경도, 위도] (float64 x 2 x 전체 점 수)
+MAGIC = b"KGB1"
+HEADER = struct.Struct("<4sII")
+EARTH_RADIUS = 6371008.8  # m
+
+# 미리 단순화해 두는 웹 메르카토르 줌 레벨과 허용 오차 (픽셀)
+LOD_ZOOMS = (6, 8, 10, 12)
+LOD_PIXEL_TOLERANCE = 1.0
+# 줌 0 에서 적도 기준 한 픽셀의 길이 (m, 256px 타일)
+MERCATOR_RADIUS = 6378137  # m
+MERCATOR_RESOLUTION = 2 * np.pi * MERCATOR_RADIUS / 256
+
+
+def encode(multi_polygon: list) -> bytes:
+    """GeoJSON MultiPolygon 좌표를 압축된 바이너리로 변환한다."""
+    polygon_sizes = [len(polygon) for polygon in multi_polygon]
+    rings = [
+        np.asarray(ring, dtype="<f8").reshape(-1, 2)
+        for polygon in multi_polygon
+        for ring in polygon
+    ]
+    ring_sizes = [len(ring) for ring in rings]
+    coords = np.concatenate(rings) if rings else np.empty((0, 2), dtype="<f8")
+    return b"".join(
+        (
+            HEADER.pack(MAGIC, len(rings), len(multi_polygon)),
+            np.asarray(polygon_sizes, dtype="<u4").tobytes(),
+            np.asarray(ring_sizes, dtype="<u4").tobytes(),
+            coords.tobytes(),
+        )
+    )
+
+
+def decode(data: bytes) -> List[List[np.ndarray]]:
+    """바이너리를 다각형별 링 배열(각각 (점 수, 2) float64 배열) 목록으로 변환한다."""
+    magic, n_rings, n_polygons = HEADER.unpack_from(data)
+    if magic != MAGIC:
+        raise ValueError("Unknown geometry format")
+    offset = HEADER.size
+    polygon_sizes = np.frombuffer(data, "<u4", n_polygons, offset)
+    offset += 4 * n_polygons
+    ring_sizes = np.frombuffer(data, "<u4", n_rings, offset)
+    offset += 4 * n_rings
+    coords = np.frombuffer(data, "<f8", int(ring_sizes.sum()) * 2, offset)
+    rings = np.split(coords.reshape(-1, 2), np.cumsum(ring_sizes)[:-1])
+    bounds = np.cumsum(polygon_sizes)
+    return [list(rings[end - size : end]) for size, end in zip(polygon_sizes, bounds)]
+
+
+def dumps(multi_polygon) -> bytes:
+    """다각형 좌표(리스트 또는 decode 결과)를 JSON 바이트로 직렬화한다."""
+    if orjson is not None:
+        return orjson.dumps(multi_polygon, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(multi_polygon, default=np.ndarray.tolist).encode("utf-8")
+
+
+def to_json_bytes(data: bytes) -> bytes:
+    """바이너리 지오메트리를 파싱 과정 없이 응답용 JSON 바이트로 바로 변환한다."""
+    return dumps(decode(data))
+
+
+def _ring_moments(ring: np.ndarray, lat0: float):
+    # 기준 위도에서의 등장방형 투영(m)으로 신발끈 공식 계산
+    scale = np.pi / 180 * EARTH_RADIUS
+    x = ring[:, 0] * scale * np.cos(np.radians(lat0))
+    y = ring[:, 1] * scale
+    x2, y2 = np.roll(x, -1), np.roll(y, -1)
+    cross = x * y2 - x2 * y
+    area = cross.sum() / 2
+    cx = ((x + x2) * cross).sum() / 6
+    cy = ((y + y2) * cross).sum() / 6
+    return area, cx / (scale * np.cos(np.radians(lat0))), cy / scale
+
+
+def measure(multi_polygon) -> dict:
+    """바운딩 박스, 면적(㎡), 면적 가중 중심점을 계산한다. 구멍은 면적에서 제외한다."""
+    polygons = [
+        [np.asarray(ring, dtype=np.float64)[:, :2] for ring in polygon]
+        for polygon in multi_polygon
+    ]
+    points = np.concatenate([ring for polygon in polygons for ring in polygon])
+    lat0 = float(points[:, 1].mean())
+    total_area = moment_x = moment_y = 0.0
+    for polygon in polygons:
+        for i, ring in enumerate(polygon):
+            area, mx, my = _ring_moments(ring, lat0)
+            # 외곽선은 양수, 구멍은 음수 면적이 되도록 방향을 맞춤
+            sign = 1 if (area >= 0) == (i == 0) else -1
+            total_area += sign * area
+            moment_x += sign * mx
+            moment_y += sign * my
+    if total_area:
+        centroid_lng, centroid_lat = moment_x / total_area, moment_y / total_area
+    else:
+        centroid_lng, centroid_lat = points.mean(axis=0)
+    return {
+        "bbox_min_lng": float(points[:, 0].min()),
+        "bbox_min_lat": float(points[:, 1].min()),
+        "bbox_max_lng": float(points[:, 0].max()),
+        "bbox_max_lat": float(points[:, 1].max()),
+        "area": abs(float(total_area)),
+        "centroid_lat": float(centroid_lat),
+        "centroid_lng": float(centroid_lng),
+    }
+
+
+def zoom_tolerance(zoom: float) -> float:
+    """해당 줌 레벨에서 LOD_PIXEL_TOLERANCE 픽셀에 해당하는 웹 메르카토르 거리(m)."""
+    return MERCATOR_RESOLUTION / 2**zoom * LOD_PIXEL_TOLERANCE
+
+
+def lod_level(
+    zoom: Optional[float] = None, tolerance: Optional[float] = None
+) -> Optional[int]:
+    """요청한 줌 또는 허용 오차(m)에 맞는 LOD 레벨을 고른다. 원본이 필요하면 None."""
+    if tolerance is None:
+        if zoom is None:
+            return None
+        tolerance = zoom_tolerance(zoom)
+    levels = [level for level in LOD_ZOOMS if zoom_tolerance(level) <= tolerance]
+    return levels[0] if levels else None
+
+
+def to_mercator(ring: np.ndarray) -> np.ndarray:
+    """[경도, 위도] 좌표를 웹 메르카토르(EPSG:3857) 좌표(m)로 변환한다."""
+    lng = np.radians(ring[:, 0])
+    lat = np.radians(np.clip(ring[:, 1], -85.05112878, 85.05112878))
+    return np.column_stack((lng, np.log(np.tan(np.pi / 4 + lat / 2)))) * MERCATOR_RADIUS
+
+
+def from_mercator(points: np.ndarray) -> np.ndarray:
+    """웹 메르카토르 좌표(m)를 [경도, 위도] 좌표로 변환한다."""
+    lng = points[:, 0] / MERCATOR_RADIUS
+    lat = 2 * np.arctan(np.exp(points[:, 1] / MERCATOR_RADIUS)) - np.pi / 2
+    return np.degrees(np.column_stack((lng, lat)))
+
+
+def _polygon_parts(geom) -> list:
+    # make_valid 결과가 GeometryCollection 일 수 있으므로 다각형만 골라냄
+    parts = []
+    for part in shapely.get_parts(geom):
+        if isinstance(part, shapely.Polygon):
+            if not part.is_empty:
+                parts.append(part)
+        elif isinstance(part, (shapely.MultiPolygon, shapely.GeometryCollection)):
+            parts.extend(_polygon_parts(part))
+    return parts
+
+
+def simplify(multi_polygon, tolerance: float) -> List[List[np.ndarray]]:
+    """MultiPolygon 을 웹 메르카토르 기준 허용 오차(m)로 위상을 유지하며 단순화한다.
+
+    shapely 의 preserve_topology 단순화를 사용하므로 링끼리 교차하거나 구멍이
+    외곽선 밖으로 나가지 않는다. 허용 오차보다 작은(면적 < 오차²) 다각형은 제외하되,
+    모두 작으면 가장 큰 다각형을 남긴다.
+    """
+    polygons = [
+        shapely.Polygon(
+            to_mercator(np.asarray(polygon[0], dtype=np.float64)[:, :2]),
+            [
+                to_mercator(np.asarray(ring, dtype=np.float64)[:, :2])
+                for ring in polygon[1:]
+            ],
+        )
+        for polygon in multi_polygon
+    ]
+    if not polygons:
+        return []
+    shape = shapely.MultiPolygon(polygons)
+    if not shape.is_valid:
+        shape = shapely.make_valid(shape)
+    parts = _polygon_parts(shapely.simplify(shape, tolerance, preserve_topology=True))
+    if not parts:
+        return []
+    kept = [part for part in parts if part.area >= tolerance**2]
+    if not kept:
+        kept = [max(parts, key=lambda part: part.area)]
+    return [
+        [from_mercator(np.asarray(part.exterior.coords))]
+        + [from_mercator(np.asarray(ring.coords)) for ring in part.interiors]
+        for part in kept
+    ]
@@ -1,10 +1,27 @@
+import asyncio
 import os
 import sys
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
 from app.config.key import KAKAO_API_KEY
+from app.config.place import (
+    PLACE_DATA_MODE,
+    PLACE_CELL_PRECISION,
+    PLACE_CACHE_SIZE,
+    PLACE_CACHE_TTL,
+    PLACE_CACHE_DB_PATH,
+    PLACE_CACHE_EXACT,
+)
 from PyKakao import Local
 from enum import Enum
+from app.functions.async_api import AsyncKakaoLocalAPI
+from app.functions import geohash
+from app.functions.cache import MISSING, make_cache
+from app.functions.place_index import PlaceIndex
+
+
+# geohash 셀 -> (최근접 거리, 500m, 1000m, 3000m 내 장소 수)
+place_cache = make_cache(PLACE_CACHE_SIZE, PLACE_CACHE_TTL, PLACE_CACHE_DB_PATH)
 
 
 class Category(Enum):
@@ -32,20 +49,20 @@ class Category(Enum):
         return [c.value + prefix for c in cls]
 
 
-def get_nearest_place_distance(address: str):
-    rd = {}
+def search_coord(address: str):
+    """주소를 카카오 주소 검색으로 (x, y) = (경도, 위도) 문자열 좌표로 변환한다."""
     local = Local(service_key=KAKAO_API_KEY)
     sa = local.search_address(address)
     if len(sa["documents"]) == 0:
         return None
+    return sa["documents"][0]["x"], sa["documents"][0]["y"]
+
+
+def get_nearest_place_distance_by_coord(x, y):
+    rd = {}
+    local = Local(service_key=KAKAO_API_KEY)
     for c in Category.list():
-        distance = local.search_category(
-            c,
-            x=sa["documents"][0]["x"],
-            y=sa["documents"][0]["y"],
-            radius=20000,
-            sort="distance",
-        )
+        distance = local.search_category(c, x=x, y=y, radius=20000, sort="distance")
         if len(distance["documents"]) == 0:
             rd[c] = 20000
         else:
@@ -53,15 +70,163 @@ def get_nearest_place_distance(address: str):
     return rd
 
 
-def get_place_count_in_radius(address: str, radius: 25):
+def get_place_count_in_radius_by_coord(x, y, radius: 25):
     rd = {}
     local = Local(service_key=KAKAO_API_KEY)
-    sa = local.search_address(address)
+    for c in Category.list():
+        distance = local.search_category(c, x=x, y=y, radius=radius)
+        rd[c] = int(distance["meta"]["total_count"])
+    return rd
+
+
+def get_nearest_place_distance(address: str):
+    coord = search_coord(address)
+    if coord is None:
+        return None
+    return get_nearest_place_distance_by_coord(*coord)
+
+
+def get_place_count_in_radius(address: str, radius: 25):
+    coord = search_coord(address)
+    if coord is None:
+        return None
+    return get_place_count_in_radius_by_coord(*coord, radius)
+
+
+def get_place_features_offline(x, y) -> tuple:
+    """로컬 POI 스냅샷 인덱스로 최근접 거리와 500/1000/3000m 내 장소 수를 계산한다."""
+    return PlaceIndex.get(Category.list()).query_one(float(y), float(x))
+
+
+def _place_cell_key(x, y) -> tuple:
+    cell = geohash.encode(float(y), float(x), PLACE_CELL_PRECISION)
+    return ("place", PLACE_DATA_MODE, cell)
+
+
+def _place_cell_center(key: tuple) -> tuple:
+    """셀 중심 좌표를 카카오 검색과 같은 (x, y) 문자열로 반환한다."""
+    lat, lng = geohash.center(key[-1])
+    return f"{lng:.7f}", f"{lat:.7f}"
+
+
+def _compute_place_features(x, y, executor=None):
+    if PLACE_DATA_MODE == "offline":
+        return get_place_features_offline(x, y)
+
+    jobs = [
+        (get_nearest_place_distance_by_coord, (x, y)),
+        (get_place_count_in_radius_by_coord, (x, y, 500)),
+        (get_place_count_in_radius_by_coord, (x, y, 1000)),
+        (get_place_count_in_radius_by_coord, (x, y, 3000)),
+    ]
+    if executor is None:
+        return tuple(fn(*args) for fn, args in jobs)
+    futures = [executor.submit(fn, *args) for fn, args in jobs]
+    return tuple(f.result() for f in futures)
+
+
+def get_place_features(address: str, executor=None, exact: bool = PLACE_CACHE_EXACT):
+    """주소 한 번의 지오코딩으로 (최근접 거리, 500m, 1000m, 3000m 내 장소 수)를 구한다.
+
+    PLACE_DATA_MODE 가 "offline" 이면 로컬 POI 인덱스를, 아니면 카카오 카테고리 검색을
+    사용한다. executor 를 주면 카카오 검색을 병렬로 실행한다.
+
+    exact 가 아니면 좌표가 속한 geohash 셀의 중심에서 계산한 값을 셀 단위로 캐시하여
+    같은 동네의 필지들이 결과를 공유한다.
+    """
+    coord = search_coord(address)
+    if coord is None:
+        return None
+    if exact:
+        return _compute_place_features(*coord, executor)
+
+    key = _place_cell_key(*coord)
+    cached = place_cache.get(key)
+    if cached is not MISSING:
+        return tuple(cached)
+    result = _compute_place_features(*_place_cell_center(key), executor)
+    if all(r is not None for r in result):
+        place_cache.set(key, list(result))
+    return result
+
+
+async def search_coord_async(address: str):
+    local = AsyncKakaoLocalAPI(KAKAO_API_KEY)
+    sa = await local.search_address(address)
     if len(sa["documents"]) == 0:
         return None
-    for c in Category.list():
-        distance = local.search_category(
-            c, x=sa["documents"][0]["x"], y=sa["documents"][0]["y"], radius=radius
-        )
+    return sa["documents"][0]["x"], sa["documents"][0]["y"]
+
+
+async def get_nearest_place_distance_by_coord_async(x, y):
+    local = AsyncKakaoLocalAPI(KAKAO_API_KEY)
+    categories = Category.list()
+    responses = await asyncio.gather(
+        *[
+            local.search_category(c, x=x, y=y, radius=20000, sort="distance")
+            for c in categories
+        ]
+    )
+    rd = {}
+    for c, distance in zip(categories, responses):
+        if len(distance["documents"]) == 0:
+            rd[c] = 20000
+        else:
+            rd[c] = int(distance["documents"][0]["distance"])
+    return rd
+
+
+async def get_place_count_in_radius_by_coord_async(x, y, radius: 25):
+    local = AsyncKakaoLocalAPI(KAKAO_API_KEY)
+    categories = Category.list()
+    responses = await asyncio.gather(
+        *[local.search_category(c, x=x, y=y, radius=radius) for c in categories]
+    )
+    rd = {}
+    for c, distance in zip(categories, responses):
         rd[c] = int(distance["meta"]["total_count"])
     return rd
+
+
+async def get_nearest_place_distance_async(address: str):
+    coord = await search_coord_async(address)
+    if coord is None:
+        return None
+    return await get_nearest_place_distance_by_coord_async(*coord)
+
+
+async def get_place_count_in_radius_async(address: str, radius: 25):
+    coord = await search_coord_async(address)
+    if coord is None:
+        return None
+    return await get_place_count_in_radius_by_coord_async(*coord, radius)
+
+
+async def _compute_place_features_async(x, y):
+    if PLACE_DATA_MODE == "offline":
+        # 첫 호출에서 스냅샷을 읽어 인덱스를 만드므로 스레드에서 실행
+        return await asyncio.to_thread(get_place_features_offline, x, y)
+    return await asyncio.gather(
+        get_nearest_place_distance_by_coord_async(x, y),
+        get_place_count_in_radius_by_coord_async(x, y, 500),
+        get_place_count_in_radius_by_coord_async(x, y, 1000),
+        get_place_count_in_radius_by_coord_async(x, y, 3000),
+    )
+
+
+async def get_place_features_async(address: str, exact: bool = PLACE_CACHE_EXACT):
+    """get_place_features 의 asyncio 버전."""
+    coord = await search_coord_async(address)
+    if coord is None:
+        return None
+    if exact:
+        return await _compute_place_features_async(*coord)
+
+    key = _place_cell_key(*coord)
+    cached = place_cache.get(key)
+    if cached is not MISSING:
+        return tuple(cached)
+    result = await _compute_place_features_async(*_place_cell_center(key))
+    if all(r is not None for r in result):
+        place_cache.set(key, list(result))
+    return result
@@ -0,0 +1,123 @@
+import asyncio
+import threading
+import weakref
+from typing import Optional
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from app.config.http import (
+    HTTP_POOL_CONNECTIONS,
+    HTTP_POOL_MAXSIZE,
+    HTTP_TIMEOUT,
+    HTTP_MAX_RETRIES,
+    HTTP_BACKOFF_FACTOR,
+    ASYNC_HTTP_CONCURRENCY,
+)
+
+# 일시적인 업스트림 오류로 보고 재시도할 상태 코드
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+
+class HTTPClient:
+    """호스트별 keep-alive 커넥션 풀을 공유하는 requests.Session 래퍼."""
+
+    def __init__(
+        self,
+        pool_connections: int = HTTP_POOL_CONNECTIONS,
+        pool_maxsize: int = HTTP_POOL_MAXSIZE,
+        timeout: float = HTTP_TIMEOUT,
+        max_retries: int = HTTP_MAX_RETRIES,
+        backoff_factor: float = HTTP_BACKOFF_FACTOR,
+    ) -> None:
+        self.timeout = timeout
+        retry = Retry(
+            total=max_retries,
+            backoff_factor=backoff_factor,
+            status_forcelist=RETRY_STATUS_CODES,
+            allowed_methods=frozenset(["GET"]),
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            max_retries=retry,
+        )
+        self.session = requests.Session()
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        kwargs.setdefault("timeout", self.timeout)
+        return self.session.get(url, **kwargs)
+
+    def close(self) -> None:
+        self.session.close()
+
+
+_client: Optional[HTTPClient] = None
+_lock = threading.Lock()
+
+
+def get_http_client() -> HTTPClient:
+    """프로세스 전역에서 공유하는 HTTPClient 를 반환한다."""
+    global _client
+    if _client is None:
+        with _lock:
+            if _client is None:
+                _client = HTTPClient()
+    return _client
+
+
+class AsyncHTTPClient:
+    """httpx.AsyncClient 래퍼. 동시 요청 수를 제한하고 일시적 오류를 재시도한다."""
+
+    def __init__(
+        self,
+        pool_maxsize: int = HTTP_POOL_MAXSIZE,
+        timeout: float = HTTP_TIMEOUT,
+        max_retries: int = HTTP_MAX_RETRIES,
+        backoff_factor: float = HTTP_BACKOFF_FACTOR,
+        concurrency: int = ASYNC_HTTP_CONCURRENCY,
+    ) -> None:
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.semaphore = asyncio.Semaphore(concurrency)
+        # 연결 실패는 transport 에서, 5xx/429 응답은 get() 에서 재시도
+        transport = httpx.AsyncHTTPTransport(
+            retries=max_retries,
+            limits=httpx.Limits(
+                max_connections=max(pool_maxsize, concurrency),
+                max_keepalive_connections=pool_maxsize,
+            ),
+        )
+        self.client = httpx.AsyncClient(timeout=timeout, transport=transport)
+
+    async def get(self, url: str, **kwargs) -> httpx.Response:
+        attempt = 0
+        while True:
+            async with self.semaphore:
+                response = await self.client.get(url, **kwargs)
+            if response.status_code not in RETRY_STATUS_CODES:
+                return response
+            if attempt >= self.max_retries:
+                return response
+            await asyncio.sleep(self.backoff_factor * (2**attempt))
+            attempt += 1
+
+    async def aclose(self) -> None:
+        await self.client.aclose()
+
+
+# httpx.AsyncClient 의 커넥션 풀은 이벤트 루프에 묶이므로 루프마다 하나씩 생성
+_async_clients = weakref.WeakKeyDictionary()
+
+
+def get_async_http_client() -> AsyncHTTPClient:
+    """현재 이벤트 루프에서 공유하는 AsyncHTTPClient 를 반환한다."""
+    loop = asyncio.get_running_loop()
+    client = _async_clients.get(loop)
+    if client is None:
+        client = AsyncHTTPClient()
+        _async_clients[loop] = client
+    return client
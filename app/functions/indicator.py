@@ -0,0 +1,191 @@
+import json
+from datetime import datetime
+from typing import Any, Iterable, NamedTuple, Optional
+from sqlalchemy.orm import Session
+from app import SessionLocal
+from app.config.cache import INDICATOR_CACHE_SIZE, INDICATOR_CACHE_TTL
+from app.config.key import VWORLD_API_KEY, ECOS_API_KEY
+from app.functions.api import (
+    _calc_date,
+    FluctuationRateOfLandPriceAPI,
+    ProducerPriceIndexAPI,
+    ConsumerPriceIndexAPI,
+)
+from app.functions.cache import MISSING, TTLCache
+from app.functions.convert_code import PnuCodeTable
+from app.models.land import LandInfo, MacroIndicator
+
+# 지표 종류
+REGION = "REGION"  # 법정동별 지가변동률
+LARGE_REGION = "LARGE_REGION"  # 시도(권역)별 지가변동률
+PPI = "PPI"  # 생산자물가지수
+CPI = "CPI"  # 소비자물가지수
+
+frolp_api = FluctuationRateOfLandPriceAPI(VWORLD_API_KEY)
+ppi_api = ProducerPriceIndexAPI(ECOS_API_KEY)
+cpi_api = ConsumerPriceIndexAPI(ECOS_API_KEY)
+
+# macro_indicator 테이블 앞단의 프로세스 내 캐시
+_memo = TTLCache(INDICATOR_CACHE_SIZE, INDICATOR_CACHE_TTL)
+
+
+def _region_code(indicator: str, ld_code: str) -> str:
+    if indicator == REGION:
+        return ld_code[0:10]
+    if indicator == LARGE_REGION:
+        return ld_code[0:2]
+    return ""
+
+
+class IndicatorRecord(NamedTuple):
+    """조회한 지표와 그 지표가 실제로 공표된 기간, 테이블에 저장된 시각."""
+
+    stdr_year: int
+    stdr_month: int
+    data: Any
+    refreshed_at: Optional[datetime]
+
+
+def _fetch(indicator: str, region_code: str, year: int, month: int):
+    """요청 월 이하에서 가장 최근에 공표된 (기간, 지표) 를 반환한다."""
+    if indicator == REGION:
+        return frolp_api.get_data_by_region(region_code, year, month, with_period=True)
+    if indicator == LARGE_REGION:
+        return frolp_api.get_data_by_large_region(
+            region_code, year, month, with_period=True
+        )
+    if indicator == PPI:
+        return ppi_api.get_data(year, month, with_period=True)
+    if indicator == CPI:
+        return cpi_api.get_data(year, month, with_period=True)
+    raise ValueError(f"Unknown indicator: {indicator}")
+
+
+def _store(
+    db: Session, indicator: str, region_code: str, period: tuple, data
+) -> IndicatorRecord:
+    # 요청한 월이 아니라 업스트림이 실제로 공표한 월로 저장 (미공표 월은 다시 조회되도록)
+    # 테이블의 TIMESTAMP 는 초 단위이므로 캐시 값과 다시 읽은 값이 같도록 맞춤
+    now = datetime.now().replace(microsecond=0)
+    db.merge(
+        MacroIndicator(
+            indicator=indicator,
+            region_code=region_code,
+            stdr_year=period[0],
+            stdr_month=period[1],
+            data=json.dumps(data, ensure_ascii=False),
+            refreshed_at=now,
+        )
+    )
+    db.commit()
+    record = IndicatorRecord(period[0], period[1], data, now)
+    _memo.set((indicator, region_code, *period), record)
+    return record
+
+
+def get_indicator_record(
+    indicator: str, ld_code: str, year: int, month: int, db: Optional[Session] = None
+) -> Optional[IndicatorRecord]:
+    """월별 지표를 캐시 → macro_indicator 테이블 → 업스트림 API 순서로 조회한다.
+
+    테이블에는 공표된 월의 행만 있으므로, 요청 월이 아직 공표되지 않았으면 업스트림에서
+    가장 최근 공표 월의 지표를 받아 그 월로 저장하고 반환한다. 이 경우 요청 월은
+    캐시 TTL(INDICATOR_CACHE_TTL) 이 지나면 다시 업스트림에서 확인한다.
+    """
+    region_code = _region_code(indicator, ld_code)
+    key = (indicator, region_code, year, month)
+    record = _memo.get(key)
+    if record is not MISSING:
+        return record
+
+    session = db or SessionLocal()
+    try:
+        row = session.get(MacroIndicator, key)
+        if row is not None:
+            record = IndicatorRecord(
+                year, month, json.loads(row.data), row.refreshed_at
+            )
+        else:
+            period, data = _fetch(indicator, region_code, year, month)
+            if data is None:
+                return None
+            record = _store(session, indicator, region_code, period, data)
+        _memo.set(key, record)
+        return record
+    finally:
+        if db is None:
+            session.close()
+
+
+def get_indicator(
+    indicator: str, ld_code: str, year: int, month: int, db: Optional[Session] = None
+):
+    """get_indicator_record 의 지표 값만 반환한다. 없으면 None."""
+    record = get_indicator_record(indicator, ld_code, year, month, db)
+    return record.data if record is not None else None
+
+
+def get_macro_indicator_records(
+    pnu: str, year: int, month: int, db: Optional[Session] = None
+) -> dict:
+    """예측 입력에 필요한 네 지표의 IndicatorRecord 를 한 번에 조회한다."""
+    if db is None:
+        with SessionLocal() as db:
+            return get_macro_indicator_records(pnu, year, month, db)
+    return {
+        name: get_indicator_record(name, pnu, year, month, db)
+        for name in (REGION, LARGE_REGION, PPI, CPI)
+    }
+
+
+def get_macro_indicators(pnu: str, year: int, month: int) -> dict:
+    """예측 입력에 필요한 지가변동률, 권역별 지가변동률, PPI, CPI 를 한 번에 조회한다."""
+    records = get_macro_indicator_records(pnu, year, month)
+    return {
+        name: record.data if record is not None else None
+        for name, record in records.items()
+    }
+
+
+def refresh(
+    year: int, month: int, db: Session, ld_codes: Optional[Iterable[str]] = None
+) -> int:
+    """해당 월의 지표를 업스트림에서 다시 받아와 테이블을 갱신한다.
+
+    PPI, CPI 와 (PnuCode.csv 의) 모든 시도의 권역별 지가변동률을 갱신하며, 법정동별
+    지가변동률은 ld_codes 를, 주지 않으면 land_info 에 저장된 필지들의 법정동 코드를
+    대상으로 한다. 갱신한 행의 수를 반환한다.
+    """
+    if ld_codes is None:
+        ld_codes = [pnu for (pnu,) in db.query(LandInfo.pnu).all()]
+    ld_codes = sorted(set(code[0:10] for code in ld_codes))
+    # 권역별 지가변동률은 한 번의 요청으로 모든 시도를 받으므로 전체를 미리 저장
+    sido_codes = {code[0:2] for code in PnuCodeTable.get().codes}
+    sido_codes.update(code[0:2] for code in ld_codes)
+    targets = [(PPI, ""), (CPI, "")]
+    targets += [(LARGE_REGION, code) for code in sorted(sido_codes)]
+    targets += [(REGION, code) for code in ld_codes]
+
+    count = 0
+    for indicator, region_code in targets:
+        period, data = _fetch(indicator, region_code, year, month)
+        if data is None:
+            print(f"# {indicator} {region_code} {year}{month:02d}: no data")
+            continue
+        if period != (year, month):
+            print(
+                f"# {indicator} {region_code} {year}{month:02d}: not published yet, "
+                f"stored {period[0]}{period[1]:02d}"
+            )
+        _store(db, indicator, region_code, period, data)
+        count += 1
+    return count
+
+
+def refresh_recent(db: Session, year: int, month: int, ld_codes=None) -> int:
+    """이번 달과 지난 달 지표를 갱신한다 (지난 달 자료가 뒤늦게 공표되는 경우 대비)."""
+    prev_year, prev_month = _calc_date(year, month)
+    ld_codes = list(ld_codes) if ld_codes is not None else None
+    count = refresh(prev_year, prev_month, db, ld_codes)
+    count += refresh(year, month, db, ld_codes)
+    return count
@@ -0,0 +1,135 @@
+import itertools
+import queue
+import threading
+import time
+import uuid
+from typing import Dict, Optional
+from app import SessionLocal
+from app.config.job import (
+    JOB_WORKERS,
+    JOB_QUEUE_SIZE,
+    JOB_RESULT_SIZE,
+    JOB_RESULT_TTL,
+)
+from app.functions import land
+from app.functions.cache import MISSING, TTLCache
+
+# 작업 상태
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+
+
+class Job:
+    def __init__(self, pnu: str, priority: int) -> None:
+        self.job_id = uuid.uuid4().hex
+        self.pnu = pnu
+        self.priority = priority
+        self.status = QUEUED
+        self.result: Optional[str] = None
+        self.error: Optional[str] = None
+        self.created_at = time.time()
+        self.finished_at: Optional[float] = None
+        self.finished = threading.Event()
+
+
+class PredictionJobQueue:
+    """토지 예측가 계산을 요청 스레드 밖에서 처리하는 프로세스 내 작업 큐.
+
+    - 큐 크기는 JOB_QUEUE_SIZE 로 제한되며, 가득 차면 submit 이 queue.Full 을 발생시킨다.
+    - 같은 PNU 의 작업이 대기 중이거나 실행 중이면 새 작업을 만들지 않고 그 작업을 반환한다.
+      대기 중인 작업보다 priority 가 높으면 높은 priority 로 큐에 다시 넣는다.
+    - priority 가 높은 작업부터, 같으면 먼저 들어온 작업부터 처리한다.
+    """
+
+    def __init__(
+        self, workers: int, maxsize: int, result_size: int, result_ttl: float
+    ) -> None:
+        self.workers = workers
+        self._queue = queue.PriorityQueue(maxsize)
+        # 대기 중인 작업이 밀려나지 않도록 큐 크기만큼 여유를 둠
+        self._jobs = TTLCache(maxsize + result_size, result_ttl)
+        self._active: Dict[str, Job] = {}
+        self._counter = itertools.count()
+        self._lock = threading.Lock()
+        self._threads = []
+
+    def _start(self) -> None:
+        if self._threads:
+            return
+        for i in range(self.workers):
+            thread = threading.Thread(
+                target=self._work, name=f"prediction-job-{i}", daemon=True
+            )
+            thread.start()
+            self._threads.append(thread)
+
+    def submit(self, pnu: str, priority: int = 0) -> Job:
+        with self._lock:
+            job = self._active.get(pnu)
+            if job is not None:
+                if job.status == QUEUED and priority > job.priority:
+                    # 이전 항목은 _work 에서 건너뜀. 큐가 가득 차면 기존 순서를 유지
+                    try:
+                        self._queue.put_nowait((-priority, next(self._counter), job))
+                        job.priority = priority
+                    except queue.Full:
+                        pass
+                return job
+            job = Job(pnu, priority)
+            self._queue.put_nowait((-priority, next(self._counter), job))
+            self._active[pnu] = job
+            self._jobs.set(job.job_id, job)
+            self._start()
+        return job
+
+    def get(self, job_id: str) -> Optional[Job]:
+        job = self._jobs.get(job_id)
+        return None if job is MISSING else job
+
+    def _work(self) -> None:
+        while True:
+            priority, _, job = self._queue.get()
+            with self._lock:
+                # priority 를 올리며 다시 넣은 작업의 이전 항목이나 이미 처리한 작업은 건너뜀
+                stale = job.status != QUEUED or -priority != job.priority
+                if not stale:
+                    job.status = RUNNING
+            if stale:
+                self._queue.task_done()
+                continue
+            try:
+                with SessionLocal() as db:
+                    result = land.set_land_predict_price_data(job.pnu, db)
+                if result is None:
+                    # land_info 에 없는 PNU
+                    job.error = "해당 토지의 정보가 존재하지 않습니다."
+                    job.status = FAILED
+                else:
+                    job.result = result
+                    job.status = DONE
+            except (Exception, SystemExit) as e:
+                # make_input_data.make 는 업스트림 실패 시 sys.exit 를 호출함
+                job.error = str(e)
+                job.status = FAILED
+            finally:
+                job.finished_at = time.time()
+                with self._lock:
+                    self._active.pop(job.pnu, None)
+                    # 결과 조회 만료 시간은 작업이 끝난 시점부터 계산
+                    self._jobs.set(job.job_id, job)
+                job.finished.set()
+                self._queue.task_done()
+
+    def stats(self) -> dict:
+        return {
+            "workers": self.workers,
+            "queued": self._queue.qsize(),
+            "active": len(self._active),
+        }
+
+
+prediction_jobs = PredictionJobQueue(
+    JOB_WORKERS, JOB_QUEUE_SIZE, JOB_RESULT_SIZE, JOB_RESULT_TTL
+)
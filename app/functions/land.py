@@ -1,20 +1,25 @@
+import hashlib
+import json
 from datetime import datetime
+from typing import Dict, Iterable, Optional
 import pytz
+from sqlalchemy import insert, update
 from sqlalchemy.orm import Session
 from app.functions.api import LandFeatureAPI, LandUsePlanAPI
 from app.functions.convert_code import code2addr
 from app.functions.geo import get_coord
+import app.functions.make_input_data as make_input_data
 import app.functions.model as model
 from app.config.key import VWORLD_API_KEY
-from app.models.land import LandInfo
+from app.models.land import LandInfo, LandPrediction
 from app.schemas import LAND
 
 
 def _generate_land_data(pnu: str):
     address = code2addr(pnu, dict_format=True)
-    lat, lng = get_coord(address["fulladdr"])
     if pnu is None or address is None:
         return None
+    lat, lng = get_coord(address["fulladdr"])
     target_year = datetime.now(pytz.timezone("Asia/Seoul")).year
 
     # 토지 특성 정보 받아오기
@@ -61,15 +66,48 @@ def _generate_land_data(pnu: str):
     return land
 
 
+def _set_land_location(land_info: LandInfo, address: dict, lat, lng) -> None:
+    land_info.lat = lat
+    land_info.lng = lng
+    land_info.sido = address["sido"]
+    land_info.sigungu = address["sigungu"]
+    land_info.eupmyeondong = address["eupmyeondong"]
+    land_info.donglee = address["donglee"]
+    land_info.address_detail = address["detail"]
+    land_info.full_address = address["fulladdr"]
+
+
+def _land_address(land_info: LandInfo) -> dict:
+    return {
+        "sido": land_info.sido,
+        "sigungu": land_info.sigungu,
+        "eupmyeondong": land_info.eupmyeondong,
+        "donglee": land_info.donglee,
+        "detail": land_info.address_detail,
+        "fulladdr": land_info.full_address,
+    }
+
+
 def get_land_data(pnu: str, db: Session):
-    address = code2addr(pnu, dict_format=True)
-    lat, lng = get_coord(address["fulladdr"])
-    if pnu is None or address is None:
+    if pnu is None:
         return None
 
     land_info = db.query(LandInfo).filter(LandInfo.pnu == pnu).first()
 
     if land_info:
+        if land_info.lat is None or land_info.lng is None:
+            # 좌표가 저장되지 않은 기존 행은 한 번만 지오코딩하여 채워 넣음
+            address = code2addr(pnu, dict_format=True)
+            if address is None:
+                return None
+            lat, lng = get_coord(address["fulladdr"])
+            if lat is not None:
+                _set_land_location(land_info, address, lat, lng)
+                db.commit()
+        else:
+            address = _land_address(land_info)
+            lat, lng = land_info.lat, land_info.lng
+
         land_detail = LAND.LandDetail(
             official_price=land_info.official_land_price,
             predict_price=land_info.predict_land_price,
@@ -116,6 +154,9 @@ def get_land_data(pnu: str, db: Session):
             road_side=new_land.detail.road_side,
             land_uses=new_land.detail.use_plan,
         )
+        _set_land_location(
+            new_land_info, new_land.address.model_dump(), new_land.lat, new_land.lng
+        )
         db.add(new_land_info)
         db.commit()
         db.refresh(new_land_info)
@@ -124,14 +165,174 @@ def get_land_data(pnu: str, db: Session):
     return None
 
 
+def _input_hash(land_info: LandInfo, fingerprints: Dict[str, dict]) -> str:
+    """예측 입력의 해시. 토지 정보와 법정동의 월별 지표(공표 기간, 값)를 포함하며,
+    값이 바뀌면 저장된 예측을 다시 계산한다.
+
+    fingerprints 는 make_input_data.input_fingerprints 의 결과이다.
+    """
+    snapshot = [
+        land_info.land_feature_stdr_year,
+        land_info.official_land_price,
+        land_info.land_classification,
+        land_info.land_zoning,
+        land_info.land_use_situation,
+        land_info.land_register,
+        land_info.land_area,
+        land_info.land_height,
+        land_info.land_form,
+        land_info.road_side,
+        land_info.land_uses,
+        fingerprints.get(land_info.pnu[0:10]),
+    ]
+    data = json.dumps(snapshot, ensure_ascii=False, default=str, sort_keys=True)
+    return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+
+def _store_prediction(
+    land_info: LandInfo,
+    year: int,
+    month: int,
+    model_version: str,
+    predict_price: float,
+    now: datetime,
+    fingerprints: Dict[str, dict],
+    db: Session,
+) -> None:
+    db.merge(
+        LandPrediction(
+            pnu=land_info.pnu,
+            target_year=year,
+            target_month=month,
+            model_version=model_version,
+            input_hash=_input_hash(land_info, fingerprints),
+            predict_price=predict_price,
+            predicted_at=now,
+        )
+    )
+    land_info.predict_land_price = predict_price
+    land_info.predicted_at = now
+
+
+def get_stored_predictions(
+    pnus: Iterable[str],
+    year: int,
+    month: int,
+    db: Session,
+    fingerprints: Optional[Dict[str, dict]] = None,
+) -> Dict[str, float]:
+    """같은 기준월, 같은 모델, 같은 입력으로 저장된 예측가를 반환한다.
+
+    fingerprints 를 주지 않으면 pnus 의 법정동별로 한 번씩 계산한다.
+    """
+    pnus = list(pnus)
+    if not pnus:
+        return {}
+    if fingerprints is None:
+        fingerprints = make_input_data.input_fingerprints(pnus, year, month)
+    rows = (
+        db.query(LandPrediction, LandInfo)
+        .join(LandInfo, LandInfo.pnu == LandPrediction.pnu)
+        .filter(
+            LandPrediction.pnu.in_(pnus),
+            LandPrediction.target_year == year,
+            LandPrediction.target_month == month,
+            LandPrediction.model_version == model.ModelService.get().version,
+        )
+        .all()
+    )
+    return {
+        prediction.pnu: prediction.predict_price
+        for prediction, land_info in rows
+        if prediction.input_hash == _input_hash(land_info, fingerprints)
+    }
+
+
 def set_land_predict_price_data(pnu: str, db: Session):
     land_info = db.query(LandInfo).filter(LandInfo.pnu == pnu).first()
     if not land_info:
         return None
-    target_year = datetime.now(pytz.timezone("Asia/Seoul")).year
-    target_month = datetime.now(pytz.timezone("Asia/Seoul")).month
-    predict_land_price = str(model.predict(pnu, target_year, target_month))
-    land_info.predict_land_price = predict_land_price
-    land_info.last_predicted_date = datetime.now(pytz.timezone("Asia/Seoul"))
+    now = datetime.now(pytz.timezone("Asia/Seoul"))
+    target_year, target_month = now.year, now.month
+
+    # 이번 달에 같은 모델과 같은 입력으로 예측한 값이 있으면 그대로 사용
+    fingerprints = make_input_data.input_fingerprints([pnu], target_year, target_month)
+    stored = get_stored_predictions(
+        [pnu], target_year, target_month, db, fingerprints
+    )
+    if pnu in stored:
+        return str(stored[pnu])
+
+    predict_land_price = model.predict(pnu, target_year, target_month)
+    _store_prediction(
+        land_info,
+        target_year,
+        target_month,
+        model.ModelService.get().version,
+        predict_land_price,
+        now,
+        fingerprints,
+        db,
+    )
+    db.commit()
+    return str(predict_land_price)
+
+
+def save_land_predict_prices(
+    predictions: dict,
+    year: int,
+    month: int,
+    db: Session,
+    fingerprints: Optional[Dict[str, dict]] = None,
+) -> int:
+    """일괄 예측 결과 중 land_info 에 있는 필지의 예측가를 저장하고, 저장한 수를 반환한다.
+
+    land_info 는 기본키 기준 일괄 UPDATE 로, land_prediction 은 기존 행을 지운 뒤
+    일괄 INSERT 로 기록한다. fingerprints 는 get_stored_predictions 와 같다.
+    """
+    predicted = {pnu: price for pnu, price in predictions.items() if price is not None}
+    if not predicted:
+        return 0
+    now = datetime.now(pytz.timezone("Asia/Seoul"))
+    model_version = model.ModelService.get().version
+    land_infos = db.query(LandInfo).filter(LandInfo.pnu.in_(list(predicted))).all()
+    if not land_infos:
+        return 0
+    pnus = [land_info.pnu for land_info in land_infos]
+    if fingerprints is None:
+        fingerprints = make_input_data.input_fingerprints(pnus, year, month)
+
+    db.execute(
+        update(LandInfo),
+        [
+            {
+                "pnu": land_info.pnu,
+                "predict_land_price": predicted[land_info.pnu],
+                "predicted_at": now,
+            }
+            for land_info in land_infos
+        ],
+    )
+    db.query(LandPrediction).filter(
+        LandPrediction.pnu.in_(pnus),
+        LandPrediction.target_year == year,
+        LandPrediction.target_month == month,
+        LandPrediction.model_version == model_version,
+    ).delete(synchronize_session=False)
+    db.execute(
+        insert(LandPrediction),
+        [
+            {
+                "pnu": land_info.pnu,
+                "target_year": year,
+                "target_month": month,
+                "model_version": model_version,
+                "input_hash": _input_hash(land_info, fingerprints),
+                "predict_price": predicted[land_info.pnu],
+                "predicted_at": now,
+            }
+            for land_info in land_infos
+        ],
+    )
     db.commit()
-    return predict_land_price
+    return len(land_infos)
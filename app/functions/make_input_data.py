@@ -1,15 +1,80 @@
+import asyncio
 import sys
 import time
 from concurrent.futures import ThreadPoolExecutor
-from app.config.key import VWORLD_API_KEY, ECOS_API_KEY
+from typing import Dict, Iterable
+from app import SessionLocal
+from app.config.key import VWORLD_API_KEY
 import app.functions.get_place_data as gpd
-from app.functions.api import (
-    LandFeatureAPI,
-    LandUsePlanAPI,
-    FluctuationRateOfLandPriceAPI,
-    ProducerPriceIndexAPI,
-    ConsumerPriceIndexAPI,
-)
+import app.functions.indicator as indicator
+from app.functions.api import LandFeatureAPI, LandUsePlanAPI
+from app.functions.async_api import AsyncLandFeatureAPI, AsyncLandUsePlanAPI
+
+# API 클라이언트는 공용 커넥션 풀을 공유하므로 요청마다 새로 만들지 않음
+lf_api = LandFeatureAPI(VWORLD_API_KEY)
+lup_api = LandUsePlanAPI(VWORLD_API_KEY)
+async_lf_api = AsyncLandFeatureAPI(VWORLD_API_KEY)
+async_lup_api = AsyncLandUsePlanAPI(VWORLD_API_KEY)
+
+
+def _land_address(pnu: str, result: dict) -> str:
+    addr = result["ldCodeNm"] + " "
+    addr += result["regstrSeCodeNm"] if result["regstrSeCodeNm"] == "산" else ""
+    addr += str(int(str(pnu)[11:15])) + "-" + str(int(str(pnu)[15:19]))
+    return addr
+
+
+def _apply_land_feature(land: dict, result: dict) -> None:
+    land["PblntfPclnd"] = result["pblntfPclnd"]
+    land["RegstrSe"] = "Re" + result["regstrSeCode"]
+    land["Lndcgr"] = "Lc" + result["lndcgrCode"]
+    land["LndpclAr"] = result["lndpclAr"]
+    land["PrposArea1"] = "A1" + result["prposArea1"]
+    land["PrposArea2"] = "A2" + result["prposArea2"]
+    land["LadUseSittn"] = "Us" + result["ladUseSittn"]
+    land["TpgrphHg"] = "Hg" + result["tpgrphHgCode"]
+    land["TpgrphFrm"] = "Fm" + result["tpgrphFrmCode"]
+    land["RoadSide"] = "Rs" + result["roadSideCode"]
+
+
+def _apply_fluctuation_rate(
+    land: dict, region_data: dict, large_region_data: dict
+) -> None:
+    land["PclndIndex"] = region_data["pclndIndex"]
+    land["PclndChgRt"] = region_data["pclndChgRt"]
+    land["AcmtlPclndChgRt"] = region_data["acmtlPclndChgRt"]
+    land["LargeClPclndIndex"] = large_region_data["pclndIndex"]
+    land["LargeClPclndChgRt"] = large_region_data["pclndChgRt"]
+    land["LargeClAcmtlPclndChgRt"] = large_region_data["acmtlPclndChgRt"]
+
+
+def _apply_place_data(
+    land: dict, rd: dict, rd_500: dict, rd_1000: dict, rd_3000: dict
+) -> None:
+    for category in gpd.Category.list():
+        land[category] = rd[category]
+        land[category + "_500m"] = rd_500[category]
+        land[category + "_1000m"] = rd_1000[category]
+        land[category + "_3000m"] = rd_3000[category]
+
+
+def input_fingerprints(pnus: Iterable[str], year: int, month: int) -> Dict[str, dict]:
+    """make() 가 쓰는 월별 지표를 법정동(PNU 앞 10자리)별로 요약한다.
+
+    지표마다 실제 공표 기간과 값을 담으며, 저장된 예측이 같은 입력으로 계산된 것인지
+    확인하는 데 사용한다. 같은 법정동의 필지는 한 번만 조회하고, 세션 하나를 공유한다.
+    """
+    result = {}
+    with SessionLocal() as db:
+        for ld_code in sorted({pnu[0:10] for pnu in pnus}):
+            records = indicator.get_macro_indicator_records(ld_code, year, month, db)
+            result[ld_code] = {
+                name: None
+                if record is None
+                else [record.stdr_year, record.stdr_month, record.data]
+                for name, record in records.items()
+            }
+    return result
 
 
 def make(pnu: str, date: str):
@@ -18,53 +83,25 @@ def make(pnu: str, date: str):
 
     # 병렬로 실행할 함수들을 정의
     def fetch_land_feature_data():
-        lf_api = LandFeatureAPI(VWORLD_API_KEY)
         result = lf_api.get_data(land["PNU"], land["Year"])
         if result is None:
             sys.exit("Failed to fetch land characteristic data from the API.")
         return result
 
-    def fetch_fluctuation_rate_data():
-        frolp_api = FluctuationRateOfLandPriceAPI(VWORLD_API_KEY)
-        region_data = frolp_api.get_data_by_region(
-            land["PNU"][0:10], int(land["Year"]), int(land["Month"])
+    def fetch_macro_indicator_data():
+        # 지가변동률과 물가지수는 월별 지표 테이블에서 읽음 (없을 때만 API 호출)
+        return indicator.get_macro_indicators(
+            land["PNU"], int(land["Year"]), int(land["Month"])
         )
-        large_region_data = frolp_api.get_data_by_large_region(
-            land["PNU"][0:10], int(land["Year"]), int(land["Month"])
-        )
-        return region_data, large_region_data
-
-    def fetch_price_index_data():
-        ppi_api = ProducerPriceIndexAPI(ECOS_API_KEY)
-        ppi_result = ppi_api.get_data(int(land["Year"]), int(land["Month"]))
-        if ppi_result is None:
-            sys.exit("Failed to fetch producer price index data from the API.")
-
-        cpi_api = ConsumerPriceIndexAPI(ECOS_API_KEY)
-        cpi_result = cpi_api.get_data(int(land["Year"]), int(land["Month"]))
-        if cpi_result is None:
-            sys.exit("Failed to fetch customer price index data from the API.")
-
-        return ppi_result, cpi_result
 
     def fetch_place_data():
-        future_rd = executor.submit(gpd.get_nearest_place_distance, addr)
-        future_rd_500 = executor.submit(gpd.get_place_count_in_radius, addr, 500)
-        future_rd_1000 = executor.submit(gpd.get_place_count_in_radius, addr, 1000)
-        future_rd_3000 = executor.submit(gpd.get_place_count_in_radius, addr, 3000)
-
-        rd = future_rd.result()
-        rd_500 = future_rd_500.result()
-        rd_1000 = future_rd_1000.result()
-        rd_3000 = future_rd_3000.result()
-
-        if rd is None or rd_500 is None or rd_1000 is None or rd_3000 is None:
+        # 주소는 한 번만 좌표로 변환하고, 최근접 거리와 반경별 개수를 함께 구함
+        result = gpd.get_place_features(addr, executor)
+        if result is None or any(r is None for r in result):
             sys.exit("Failed to fetch place data from the API.")
-
-        return rd, rd_500, rd_1000, rd_3000
+        return result
 
     def fetch_land_use_plan_data():
-        lup_api = LandUsePlanAPI(VWORLD_API_KEY)
         result = lup_api.get_data(land["PNU"])
         if result is None:
             sys.exit("Failed to fetch land use plans data from the API.")
@@ -74,40 +111,23 @@ def make(pnu: str, date: str):
     with ThreadPoolExecutor() as executor:
         # 병렬 실행
         future_feature = executor.submit(fetch_land_feature_data)
-        future_fluctuation = executor.submit(fetch_fluctuation_rate_data)
-        future_price_index = executor.submit(fetch_price_index_data)
+        future_indicators = executor.submit(fetch_macro_indicator_data)
         future_land_use_plan = executor.submit(fetch_land_use_plan_data)
 
         # Land feature 데이터 처리
         feature_start = time.time()
         result = future_feature.result()
-        addr = result["ldCodeNm"] + " "
-        addr += result["regstrSeCodeNm"] if result["regstrSeCodeNm"] == "산" else ""
-        addr += (
-            str(int(str(land["PNU"])[11:15])) + "-" + str(int(str(land["PNU"])[15:19]))
-        )
-        land["PblntfPclnd"] = result["pblntfPclnd"]
-        land["RegstrSe"] = "Re" + result["regstrSeCode"]
-        land["Lndcgr"] = "Lc" + result["lndcgrCode"]
-        land["LndpclAr"] = result["lndpclAr"]
-        land["PrposArea1"] = "A1" + result["prposArea1"]
-        land["PrposArea2"] = "A2" + result["prposArea2"]
-        land["LadUseSittn"] = "Us" + result["ladUseSittn"]
-        land["TpgrphHg"] = "Hg" + result["tpgrphHgCode"]
-        land["TpgrphFrm"] = "Fm" + result["tpgrphFrmCode"]
-        land["RoadSide"] = "Rs" + result["roadSideCode"]
+        addr = _land_address(land["PNU"], result)
+        _apply_land_feature(land, result)
         feature_end = time.time()
         print(f"Land feature data fetched in {feature_end - feature_start:.2f} seconds")
 
         # Fluctuation rate 데이터 처리
         fluctuation_start = time.time()
-        region_data, large_region_data = future_fluctuation.result()
-        land["PclndIndex"] = region_data["pclndIndex"]
-        land["PclndChgRt"] = region_data["pclndChgRt"]
-        land["AcmtlPclndChgRt"] = region_data["acmtlPclndChgRt"]
-        land["LargeClPclndIndex"] = large_region_data["pclndIndex"]
-        land["LargeClPclndChgRt"] = large_region_data["pclndChgRt"]
-        land["LargeClAcmtlPclndChgRt"] = large_region_data["acmtlPclndChgRt"]
+        indicators = future_indicators.result()
+        _apply_fluctuation_rate(
+            land, indicators[indicator.REGION], indicators[indicator.LARGE_REGION]
+        )
         fluctuation_end = time.time()
         print(
             f"Fluctuation rate data fetched in {fluctuation_end - fluctuation_start:.2f} seconds"
@@ -115,9 +135,12 @@ def make(pnu: str, date: str):
 
         # Price index 데이터 처리
         price_index_start = time.time()
-        ppi_result, cpi_result = future_price_index.result()
-        land["PPI"] = ppi_result
-        land["CPI"] = cpi_result
+        if indicators[indicator.PPI] is None:
+            sys.exit("Failed to fetch producer price index data from the API.")
+        if indicators[indicator.CPI] is None:
+            sys.exit("Failed to fetch customer price index data from the API.")
+        land["PPI"] = indicators[indicator.PPI]
+        land["CPI"] = indicators[indicator.CPI]
         price_index_end = time.time()
         print(
             f"Price index data fetched in {price_index_end - price_index_start:.2f} seconds"
@@ -131,11 +154,7 @@ def make(pnu: str, date: str):
         place_data_end = time.time()
         print(f"Place data fetched in {place_data_end - place_data_start:.2f} seconds")
 
-        for category in gpd.Category.list():
-            land[category] = rd[category]
-            land[category + "_500m"] = rd_500[category]
-            land[category + "_1000m"] = rd_1000[category]
-            land[category + "_3000m"] = rd_3000[category]
+        _apply_place_data(land, rd, rd_500, rd_1000, rd_3000)
 
         # Land use plan 데이터 처리
         land_use_plan_start = time.time()
@@ -149,3 +168,50 @@ def make(pnu: str, date: str):
     print(f"Total execution time: {end_time - start_time:.2f} seconds")
 
     return land
+
+
+async def make_async(pnu: str, date: str):
+    """make() 의 asyncio 버전. 업스트림 호출을 asyncio.gather 로 동시에 진행한다.
+
+    동시 요청 수는 공용 AsyncHTTPClient 의 세마포어(ASYNC_HTTP_CONCURRENCY)로
+    제한되며, 실패 시 sys.exit 대신 RuntimeError 를 발생시킨다.
+    """
+    start_time = time.time()  # 전체 실행 시작 시간
+    land = {"PNU": pnu, "Year": int(date[0:4]), "Month": int(date[4:6])}
+    year, month = land["Year"], land["Month"]
+
+    feature, indicators, land_use_plans = await asyncio.gather(
+        async_lf_api.get_data(pnu, year),
+        # 월별 지표 테이블 조회는 동기 DB 세션을 사용하므로 스레드에서 실행
+        asyncio.to_thread(indicator.get_macro_indicators, pnu, year, month),
+        async_lup_api.get_data(pnu),
+    )
+    if feature is None:
+        raise RuntimeError("Failed to fetch land characteristic data from the API.")
+    if indicators[indicator.PPI] is None:
+        raise RuntimeError("Failed to fetch producer price index data from the API.")
+    if indicators[indicator.CPI] is None:
+        raise RuntimeError("Failed to fetch customer price index data from the API.")
+    if land_use_plans is None:
+        raise RuntimeError("Failed to fetch land use plans data from the API.")
+
+    _apply_land_feature(land, feature)
+    _apply_fluctuation_rate(
+        land, indicators[indicator.REGION], indicators[indicator.LARGE_REGION]
+    )
+    land["PPI"] = indicators[indicator.PPI]
+    land["CPI"] = indicators[indicator.CPI]
+
+    # 주변 장소 정보는 토지 특성 정보의 주소가 필요하므로 이후에 요청
+    addr = _land_address(pnu, feature)
+    place_data = await gpd.get_place_features_async(addr)
+    if place_data is None or any(r is None for r in place_data):
+        raise RuntimeError("Failed to fetch place data from the API.")
+    rd, rd_500, rd_1000, rd_3000 = place_data
+    _apply_place_data(land, rd, rd_500, rd_1000, rd_3000)
+    land["LandUsePlans"] = land_use_plans
+
+    end_time = time.time()  # 전체 실행 종료 시간
+    print(f"Total execution time: {end_time - start_time:.2f} seconds")
+
+    return land
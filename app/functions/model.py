@@ -1,36 +1,178 @@
-import xgboost as xgb
+import asyncio
+import hashlib
+import threading
+from typing import Dict, FrozenSet, Iterable, List, Optional, Tuple
+import numpy as np
 import pandas as pd
+import xgboost as xgb
 import app.functions.make_input_data as mid
 from app.config import model
 
 
+def _file_hash(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 16), b""):
+            digest.update(chunk)
+    return digest.hexdigest()[:16]
+
+
+class FeaturePlan:
+    """모델의 feature_names_in_ 을 입력 데이터 키에 맞춰 미리 분류해 둔 컬럼 계획.
+
+    - direct: 입력 데이터의 값을 그대로 사용하는 컬럼
+    - sido: Sido_<시도코드> 원-핫 컬럼
+    - land_use_plans: LandUsePlans_<코드> 멀티-핫 컬럼 ("/" 로 구분된 목록에 포함 여부)
+    - categorical: <필드>_<값> 컬럼 (필드 값 문자열에 포함되는지 여부)
+    """
+
+    def __init__(self, feature_names: List[str], keys: FrozenSet[str]) -> None:
+        self.size = len(feature_names)
+        self.direct: List[Tuple[int, str]] = []
+        self.sido: Dict[str, List[int]] = {}
+        self.land_use_plans: Dict[str, List[int]] = {}
+        self.categorical: Dict[str, List[Tuple[int, str]]] = {}
+        for i, feature in enumerate(feature_names):
+            if feature in keys:
+                self.direct.append((i, feature))
+                continue
+            parts = feature.split("_")
+            if parts[0] == "Sido":
+                self.sido.setdefault(parts[1], []).append(i)
+            elif parts[0] == "LandUsePlans":
+                self.land_use_plans.setdefault(parts[1], []).append(i)
+            else:
+                self.categorical.setdefault(parts[0], []).append((i, parts[1]))
+
+    def fill(self, land: dict, row: np.ndarray) -> np.ndarray:
+        row.fill(0.0)
+        for i, field in self.direct:
+            value = land[field]
+            row[i] = np.nan if value is None else float(value)
+        for i in self.sido.get(land["PNU"][0:2], ()):
+            row[i] = 1.0
+        for plan in set(land["LandUsePlans"].split("/")):
+            for i in self.land_use_plans.get(plan, ()):
+                row[i] = 1.0
+        for field, columns in self.categorical.items():
+            value = land[field]
+            for i, token in columns:
+                if token in value:
+                    row[i] = 1.0
+        return row
+
+
+class ModelService:
+    """프로세스당 한 번만 불러오는 XGBoost 예측 모델."""
+
+    _instance = None
+    _lock = threading.Lock()
+
+    def __init__(self, path: str) -> None:
+        self.booster = xgb.Booster(model_file=path)
+        self.version = model.MODEL_VERSION or _file_hash(path)
+        self.feature_names: List[str] = list(self.booster.feature_names)
+        # 조기 종료로 학습된 모델이면 XGBRegressor.predict 와 같이 best_iteration 까지 사용
+        best_iteration = self.booster.attr("best_iteration")
+        self.iteration_range = (
+            (0, int(best_iteration) + 1) if best_iteration is not None else (0, 0)
+        )
+        self._plans: Dict[FrozenSet[str], FeaturePlan] = {}
+        self._plans_lock = threading.Lock()
+
+    @classmethod
+    def get(cls) -> "ModelService":
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = cls(model.MODEL_PATH)
+        return cls._instance
+
+    def plan(self, land: dict) -> FeaturePlan:
+        keys = frozenset(land)
+        plan = self._plans.get(keys)
+        if plan is None:
+            with self._plans_lock:
+                plan = self._plans.get(keys)
+                if plan is None:
+                    plan = self._plans[keys] = FeaturePlan(self.feature_names, keys)
+        return plan
+
+    def vectorize(self, land: dict) -> np.ndarray:
+        plan = self.plan(land)
+        return plan.fill(land, np.empty(plan.size, dtype=np.float64))
+
+    def frame(self, x: np.ndarray) -> pd.DataFrame:
+        return pd.DataFrame(np.atleast_2d(x), columns=self.feature_names)
+
+    def matrix(self, lands: List[dict]) -> np.ndarray:
+        x = np.empty((len(lands), len(self.feature_names)), dtype=np.float64)
+        for row, land in zip(x, lands):
+            self.plan(land).fill(land, row)
+        return x
+
+    def predict_rows(self, x: np.ndarray) -> np.ndarray:
+        return self.booster.inplace_predict(
+            np.atleast_2d(x), iteration_range=self.iteration_range
+        )
+
+
+def _round_price(value: float) -> float:
+    return abs(int(f"{value:.0f}")) / 1000 * 1000
+
+
 def predict(pnu: str, year: int, month: int, return_all=False) -> int:
-    loaded_model = xgb.XGBRegressor()
-    loaded_model.load_model(model.MODEL_PATH)
+    service = ModelService.get()
     target_land = mid.make(pnu, f"{year:04d}{month:02d}")
-    target_feature = {}
-    for feature in loaded_model.feature_names_in_:
-        if feature not in target_land.keys():
-            if feature.split("_")[0] == "Sido":
-                target_feature[feature] = (
-                    feature.split("_")[1] == target_land["PNU"][0:2]
-                )
-            elif feature.split("_")[0] == "LandUsePlans":
-                target_feature[feature] = feature.split("_")[1] in target_land[
-                    "LandUsePlans"
-                ].split("/")
-            else:
-                target_feature[feature] = (
-                    feature.split("_")[1] in target_land[feature.split("_")[0]]
-                )
-        else:
-            target_feature[feature] = target_land[feature]
-
-    target_x = pd.DataFrame.from_dict(
-        data=[target_feature], orient="columns", dtype=float
-    )
-    target_predict = loaded_model.predict(target_x)
+    target_x = service.vectorize(target_land)
+    target_predict = service.predict_rows(target_x)
     if return_all:
-        return target_x, target_predict
+        return service.frame(target_x), target_predict
     else:
-        return abs(int(f"{target_predict[0]:.0f}")) / 1000 * 1000
+        return _round_price(target_predict[0])
+
+
+def _predict_lands(lands: List[dict]) -> List[float]:
+    service = ModelService.get()
+    return service.predict_rows(service.matrix(lands)).tolist()
+
+
+async def predict_many_async(
+    pnus: Iterable[str], year: int, month: int, concurrency: Optional[int] = None
+) -> Dict[str, Optional[float]]:
+    """여러 필지의 예측가를 한 번에 계산한다.
+
+    필지별 입력 데이터는 make_async 로 동시에 만들고 (기본 PREDICT_BATCH_CONCURRENCY 개씩),
+    하나의 특성 행렬로 모아 모델을 한 번만 호출한다. 입력 데이터를 만들지 못한 필지의
+    예측가는 None 이다.
+    """
+    date = f"{year:04d}{month:02d}"
+    semaphore = asyncio.Semaphore(concurrency or model.PREDICT_BATCH_CONCURRENCY)
+
+    async def build(pnu: str) -> Optional[dict]:
+        async with semaphore:
+            try:
+                return await mid.make_async(pnu, date)
+            except Exception as e:
+                print(f"# {pnu}: {e}")
+                return None
+
+    pnus = list(dict.fromkeys(pnus))
+    lands = await asyncio.gather(*[build(pnu) for pnu in pnus])
+    built = [(pnu, land) for pnu, land in zip(pnus, lands) if land is not None]
+
+    result = {pnu: None for pnu in pnus}
+    if built:
+        # 특성 행렬 구성과 모델 호출(최대 PREDICT_BATCH_MAX_SIZE 행)은 이벤트 루프를
+        # 막지 않도록 스레드에서 실행
+        values = await asyncio.to_thread(_predict_lands, [land for _, land in built])
+        for (pnu, _), value in zip(built, values):
+            result[pnu] = _round_price(value)
+    return result
+
+
+def predict_many(
+    pnus: Iterable[str], year: int, month: int, concurrency: Optional[int] = None
+) -> Dict[str, Optional[float]]:
+    """predict_many_async 의 동기 버전 (스크립트 등 이벤트 루프 밖에서 사용)."""
+    return asyncio.run(predict_many_async(pnus, year, month, concurrency))
@@ -0,0 +1,125 @@
+import os
+import csv
+import threading
+from typing import Dict, Iterable, Sequence
+import numpy as np
+from scipy.spatial import cKDTree
+from app.config.place import POI_SNAPSHOT_DIR
+
+EARTH_RADIUS = 6371008.8  # m
+# 카카오 카테고리 검색과 같은 기준 (20km 안에 없으면 20000m)
+MAX_DISTANCE = 20000
+RADII = (500, 1000, 3000)
+
+
+def _to_unit_xyz(lat: np.ndarray, lng: np.ndarray) -> np.ndarray:
+    """위경도를 단위 구 위의 3차원 직교 좌표로 변환한다 (현 거리는 구면 거리와 단조)."""
+    lat = np.radians(np.asarray(lat, dtype=np.float64))
+    lng = np.radians(np.asarray(lng, dtype=np.float64))
+    cos_lat = np.cos(lat)
+    return np.column_stack((cos_lat * np.cos(lng), cos_lat * np.sin(lng), np.sin(lat)))
+
+
+def _chord(distance: float) -> float:
+    return 2 * np.sin(distance / (2 * EARTH_RADIUS))
+
+
+def _arc(chord: np.ndarray) -> np.ndarray:
+    return 2 * EARTH_RADIUS * np.arcsin(np.clip(chord / 2, 0, 1))
+
+
+def load_snapshot(path: str) -> np.ndarray:
+    """POI 스냅샷 CSV 에서 (lat, lng) 배열을 읽는다. 카카오 응답과 같이 x=경도, y=위도."""
+    with open(path, encoding="utf-8") as f:
+        reader = csv.reader(f)
+        header = next(reader)
+        xi, yi = header.index("x"), header.index("y")
+        coords = [(float(row[yi]), float(row[xi])) for row in reader]
+    return np.array(coords, dtype=np.float64).reshape(-1, 2)
+
+
+class PlaceIndex:
+    """카테고리별 POI 좌표에 대한 KD-tree.
+
+    한 번의 호출로 여러 지점에 대해 카테고리별 최근접 거리와 500/1000/3000m 반경 내
+    장소 수를 계산한다.
+    """
+
+    _instance = None
+    _lock = threading.Lock()
+
+    def __init__(self, points: Dict[str, np.ndarray]) -> None:
+        self.trees = {}
+        for category, latlng in points.items():
+            xyz = _to_unit_xyz(latlng[:, 0], latlng[:, 1]) if len(latlng) else None
+            self.trees[category] = cKDTree(xyz) if xyz is not None else None
+
+    @classmethod
+    def from_directory(cls, directory: str, categories: Iterable[str]) -> "PlaceIndex":
+        """디렉터리의 <카테고리>.csv 스냅샷으로 인덱스를 만든다.
+
+        스냅샷이 없는 카테고리를 0건으로 처리하면 모든 필지의 입력값이 조용히 틀어지므로,
+        디렉터리가 지정되지 않았거나 파일이 하나라도 없으면 오류를 발생시킨다.
+        """
+        if not directory:
+            raise RuntimeError(
+                'POI_SNAPSHOT_DIR must be set when PLACE_DATA_MODE is "offline".'
+            )
+        if not os.path.isdir(directory):
+            raise FileNotFoundError(f"POI snapshot directory not found: {directory}")
+        paths = {
+            category: os.path.join(directory, f"{category}.csv")
+            for category in categories
+        }
+        missing = [path for path in paths.values() if not os.path.isfile(path)]
+        if missing:
+            raise FileNotFoundError(
+                f"POI snapshot files not found: {', '.join(missing)}"
+            )
+        return cls({category: load_snapshot(path) for category, path in paths.items()})
+
+    @classmethod
+    def get(cls, categories: Iterable[str]) -> "PlaceIndex":
+        """POI_SNAPSHOT_DIR 의 스냅샷으로 만든 프로세스 전역 인덱스를 반환한다."""
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = cls.from_directory(POI_SNAPSHOT_DIR, categories)
+        return cls._instance
+
+    def query(
+        self, lats: Sequence[float], lngs: Sequence[float], radii=RADII
+    ) -> Dict:
+        """여러 지점의 주변 장소 정보를 계산한다.
+
+        반환값은 {"nearest": {카테고리: 거리 배열}, 반경: {카테고리: 개수 배열}} 이다.
+        """
+        xyz = _to_unit_xyz(lats, lngs)
+        result = {"nearest": {}}
+        result.update({radius: {} for radius in radii})
+        chords = [_chord(radius) for radius in radii]
+        for category, tree in self.trees.items():
+            if tree is None:
+                result["nearest"][category] = np.full(len(xyz), MAX_DISTANCE)
+                for radius in radii:
+                    result[radius][category] = np.zeros(len(xyz), dtype=np.int64)
+                continue
+            chord, _ = tree.query(xyz, k=1, distance_upper_bound=_chord(MAX_DISTANCE))
+            distance = np.where(np.isinf(chord), MAX_DISTANCE, _arc(chord))
+            result["nearest"][category] = np.minimum(distance, MAX_DISTANCE).astype(
+                np.int64
+            )
+            for radius, r in zip(radii, chords):
+                result[radius][category] = np.asarray(
+                    tree.query_ball_point(xyz, r, return_length=True), dtype=np.int64
+                )
+        return result
+
+    def query_one(self, lat: float, lng: float) -> tuple:
+        """get_nearest_place_distance / get_place_count_in_radius 와 같은 형태로 반환한다."""
+        result = self.query([lat], [lng])
+        rd = {c: int(v[0]) for c, v in result["nearest"].items()}
+        counts = [
+            {c: int(v[0]) for c, v in result[radius].items()} for radius in RADII
+        ]
+        return (rd, *counts)
@@ -0,0 +1,199 @@
+import json
+import threading
+from typing import Dict, List, Optional, Sequence
+import numpy as np
+from app import SessionLocal
+from app.models.geo import GeometryData
+
+# geometry_data 에 저장된 지역 코드 자릿수 (시도 / 시군구 / 읍면동)
+REGION_LEVELS = (2, 5, 8)
+# STR 트리 노드 하나가 가지는 자식 수
+NODE_CAPACITY = 16
+# 점-다각형 판정 시 한 번에 만드는 (점 x 변) 행렬의 최대 크기
+MAX_PAIRS = 1 << 22
+
+
+def _contains(bbox: np.ndarray, x: np.ndarray, y: np.ndarray) -> np.ndarray:
+    return (bbox[:, 0] <= x) & (x <= bbox[:, 2]) & (bbox[:, 1] <= y) & (y <= bbox[:, 3])
+
+
+class STRTree:
+    """Sort-Tile-Recursive 방식으로 묶은 바운딩 박스 트리.
+
+    levels[0] 은 입력 바운딩 박스, 위로 갈수록 NODE_CAPACITY 개씩 묶은 노드이며
+    각 노드의 자식은 아래 단계의 [start, end) 구간이다.
+    """
+
+    def __init__(self, bboxes: np.ndarray) -> None:
+        # 입력 순서를 STR 순서로 바꾼 인덱스 (leaf 위치 -> 원래 항목 번호)
+        self.order = self._str_order(bboxes)
+        boxes = bboxes[self.order]
+        self.levels = [boxes]
+        self.children = []
+        while len(boxes) > 1:
+            starts = np.arange(0, len(boxes), NODE_CAPACITY)
+            ends = np.minimum(starts + NODE_CAPACITY, len(boxes))
+            boxes = np.column_stack(
+                (
+                    np.minimum.reduceat(boxes[:, 0], starts),
+                    np.minimum.reduceat(boxes[:, 1], starts),
+                    np.maximum.reduceat(boxes[:, 2], starts),
+                    np.maximum.reduceat(boxes[:, 3], starts),
+                )
+            )
+            self.levels.append(boxes)
+            self.children.append((starts, ends))
+
+    @staticmethod
+    def _str_order(bboxes: np.ndarray) -> np.ndarray:
+        n = len(bboxes)
+        if n == 0:
+            return np.arange(0)
+        cx = (bboxes[:, 0] + bboxes[:, 2]) / 2
+        cy = (bboxes[:, 1] + bboxes[:, 3]) / 2
+        slices = int(np.ceil(np.sqrt(np.ceil(n / NODE_CAPACITY))))
+        by_x = np.argsort(cx, kind="stable")
+        slice_size = slices * NODE_CAPACITY
+        order = []
+        for start in range(0, n, slice_size):
+            part = by_x[start : start + slice_size]
+            order.append(part[np.argsort(cy[part], kind="stable")])
+        return np.concatenate(order)
+
+    def query(self, x: np.ndarray, y: np.ndarray):
+        """점들과 바운딩 박스가 겹치는 (점 번호, 항목 번호) 쌍을 반환한다."""
+        if len(self.order) == 0:
+            empty = np.arange(0)
+            return empty, empty
+        top = self.levels[-1]
+        points = np.arange(len(x))
+        nodes = np.zeros(len(x), dtype=np.int64)
+        hit = _contains(top[nodes], x, y)
+        points, nodes = points[hit], nodes[hit]
+        for level in range(len(self.levels) - 2, -1, -1):
+            starts, ends = self.children[level]
+            counts = ends[nodes] - starts[nodes]
+            points = np.repeat(points, counts)
+            first = np.repeat(np.cumsum(counts) - counts, counts)
+            nodes = np.repeat(starts[nodes], counts) + np.arange(counts.sum()) - first
+            hit = _contains(self.levels[level][nodes], x[points], y[points])
+            points, nodes = points[hit], nodes[hit]
+        return points, self.order[nodes]
+
+
+class _Part:
+    """다각형 하나의 모든 링(외곽선과 구멍)의 변 목록."""
+
+    def __init__(self, rings: List[list]) -> None:
+        x1, y1, x2, y2 = [], [], [], []
+        for ring in rings:
+            ring = np.asarray(ring, dtype=np.float64)[:, :2]
+            if len(ring) < 3:
+                continue
+            x1.append(ring[:, 0])
+            y1.append(ring[:, 1])
+            x2.append(np.roll(ring[:, 0], -1))
+            y2.append(np.roll(ring[:, 1], -1))
+        self.x1 = np.concatenate(x1) if x1 else np.empty(0)
+        self.y1 = np.concatenate(y1) if y1 else np.empty(0)
+        self.x2 = np.concatenate(x2) if x2 else np.empty(0)
+        self.y2 = np.concatenate(y2) if y2 else np.empty(0)
+        self.bbox = (
+            (
+                min(self.x1.min(), self.x2.min()),
+                min(self.y1.min(), self.y2.min()),
+                max(self.x1.max(), self.x2.max()),
+                max(self.y1.max(), self.y2.max()),
+            )
+            if len(self.x1)
+            else (np.inf, np.inf, -np.inf, -np.inf)
+        )
+
+    def contains(self, x: np.ndarray, y: np.ndarray) -> np.ndarray:
+        """짝-홀 규칙의 광선 투사로 점들이 다각형 안에 있는지 판정한다 (구멍 포함)."""
+        inside = np.zeros(len(x), dtype=bool)
+        step = max(1, MAX_PAIRS // max(len(self.x1), 1))
+        for start in range(0, len(x), step):
+            px = x[start : start + step, None]
+            py = y[start : start + step, None]
+            crosses = (self.y1 > py) != (self.y2 > py)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                cross_x = self.x1 + (py - self.y1) * (self.x2 - self.x1) / (
+                    self.y2 - self.y1
+                )
+            inside[start : start + step] = (
+                np.count_nonzero(crosses & (px < cross_x), axis=1) % 2 == 1
+            )
+        return inside
+
+
+class _LevelIndex:
+    def __init__(self, regions: Dict[str, list]) -> None:
+        self.parts: List[_Part] = []
+        codes = []
+        for code, multi_polygon in regions.items():
+            for polygon in multi_polygon:
+                self.parts.append(_Part(polygon))
+                codes.append(code)
+        self.codes = np.array(codes, dtype=object)
+        bboxes = np.array([part.bbox for part in self.parts], dtype=np.float64)
+        self.tree = STRTree(bboxes.reshape(-1, 4))
+
+    def locate(self, x: np.ndarray, y: np.ndarray) -> np.ndarray:
+        result = np.full(len(x), None, dtype=object)
+        points, parts = self.tree.query(x, y)
+        if len(parts) == 0:
+            return result
+        # 후보 쌍을 다각형별로 묶어 다각형마다 한 번씩 판정
+        order = np.argsort(parts, kind="stable")
+        points, parts = points[order], parts[order]
+        starts = np.flatnonzero(np.r_[True, parts[1:] != parts[:-1]])
+        for p_points, part in zip(np.split(points, starts[1:]), parts[starts]):
+            inside = self.parts[part].contains(x[p_points], y[p_points])
+            result[p_points[inside]] = self.codes[part]
+        return result
+
+
+class RegionIndex:
+    """geometry_data 의 시도/시군구/읍면동 경계로 좌표가 속한 지역 코드를 찾는 인덱스.
+
+    지역 단위별 STR 트리로 후보 다각형을 고른 뒤 벡터화한 광선 투사로 판정한다.
+    좌표는 geometry_data 와 같이 [경도, 위도] 순서의 GeoJSON MultiPolygon 이다.
+    """
+
+    _instance = None
+    _lock = threading.Lock()
+
+    def __init__(self, regions: Dict[str, list]) -> None:
+        self.levels = {
+            level: _LevelIndex(
+                {code: mp for code, mp in regions.items() if len(code) == level}
+            )
+            for level in REGION_LEVELS
+        }
+
+    @classmethod
+    def from_db(cls) -> "RegionIndex":
+        with SessionLocal() as db:
+            rows = db.query(GeometryData.pnu, GeometryData.multi_polygon).all()
+        return cls({pnu: json.loads(multi_polygon) for pnu, multi_polygon in rows})
+
+    @classmethod
+    def get(cls) -> "RegionIndex":
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = cls.from_db()
+        return cls._instance
+
+    def locate_many(
+        self, lats: Sequence[float], lngs: Sequence[float]
+    ) -> Dict[int, np.ndarray]:
+        """여러 좌표의 {자릿수: 지역 코드 배열} 을 반환한다. 찾지 못하면 None."""
+        x = np.asarray(lngs, dtype=np.float64).reshape(-1)
+        y = np.asarray(lats, dtype=np.float64).reshape(-1)
+        return {level: index.locate(x, y) for level, index in self.levels.items()}
+
+    def locate(self, lat: float, lng: float) -> Dict[int, Optional[str]]:
+        codes = self.locate_many([lat], [lng])
+        return {level: level_codes[0] for level, level_codes in codes.items()}
@@ -0,0 +1,41 @@
+from typing import List
+from fastapi import Response
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+from app.config.server import JSON_STREAM_THRESHOLD
+from app.functions.geometry import dumps
+
+
+def model_response(model: BaseModel, status_code: int = 200) -> Response:
+    """검증된 데이터로 만든 응답 모델을 response_model 재검증 없이 바로 직렬화한다.
+
+    model_construct 로 만든 모델과 함께 사용하며, 직렬화는 pydantic-core 가 한다.
+    """
+    return Response(
+        content=model.model_dump_json(),
+        status_code=status_code,
+        media_type="application/json",
+    )
+
+
+def json_array_response(meta: dict, key: str, items: List[bytes]) -> Response:
+    """meta 필드에 이미 JSON 바이트인 items 를 key 배열로 붙인 응답을 만든다.
+
+    본문이 JSON_STREAM_THRESHOLD 보다 크면 전체를 이어 붙이지 않고 항목 단위로
+    스트리밍하여 메모리 복사를 줄이고 첫 바이트를 바로 보낸다.
+    """
+    head = dumps(meta)[:-1] + (b"," if meta else b"") + dumps(key) + b":["
+    size = len(head) + sum(len(item) + 1 for item in items)
+    if size < JSON_STREAM_THRESHOLD:
+        content = b"".join((head, b",".join(items), b"]}"))
+        return Response(content=content, media_type="application/json")
+
+    def body():
+        yield head
+        for i, item in enumerate(items):
+            if i:
+                yield b","
+            yield item
+        yield b"]}"
+
+    return StreamingResponse(body(), media_type="application/json")
@@ -2,8 +2,6 @@ from datetime import datetime
 from dataclasses import asdict
 import google.generativeai as genai
 from sqlalchemy.orm import Session
-import xgboost as xgb
-from app.config.model import MODEL_PATH
 from app.config.key import VWORLD_API_KEY, ECOS_API_KEY, GOOGLE_API_KEY
 from app.functions.api import (
     LandFeatureAPI,
@@ -14,6 +12,7 @@ from app.functions.api import (
     ConsumerPriceIndexAPI,
 )
 from app.functions.convert_code import code2addr
+from app.functions.model import ModelService
 
 from app.models.land import LandInfo
 
@@ -174,9 +173,8 @@ def _get_land_trade_data(land: LandInfoData, year: int, month: int):
         print(compare_land_trade)
 
 def generate(pnu: str, db: Session):
-    # 예측 모델 불러오기
-    model = xgb.XGBRegressor()
-    model.load_model(MODEL_PATH)
+    # 예측 모델 (프로세스에 한 번만 불러온 모델을 공유)
+    booster = ModelService.get().booster
     # 제미나이 예측 모델 불러오기
     genai.configure(api_key=GOOGLE_API_KEY)
     llm_model = genai.GenerativeModel("gemini-1.5-flash")
@@ -198,7 +196,7 @@ def generate(pnu: str, db: Session):
     # 토지 정보 정제
 
     tree_text = ""
-    tree_dump = model.get_booster().get_dump()
+    tree_dump = booster.get_dump()
     for i, tree in enumerate(tree_dump):
         tree_text += f"Tree {i}:\n{tree}"
 
@@ -0,0 +1,377 @@
+import json
+import math
+import os
+import time
+from typing import Dict, Iterator, List, Optional, Tuple
+import numpy as np
+from sqlalchemy.orm import Session
+from app.config.tile import (
+    PARCEL_TILE_CACHE_TTL,
+    PARCEL_TILE_MIN_ZOOM,
+    TILE_CACHE_DIR,
+    TILE_CACHE_SIZE,
+    TILE_CACHE_TTL,
+)
+from app.functions import geometry
+from app.functions.cache import MISSING, DirectoryCache, TieredCache, TTLCache
+from app.functions.convert_code import code2addr
+from app.models.geo import GeometryData, GeometryDataLod, ParcelGeometryData
+
+# Mapbox Vector Tile 2.1 (https://github.com/mapbox/vector-tile-spec)
+EXTENT = 4096
+# 타일 경계에서 잘린 선이 보이지 않도록 바깥으로 더 그리는 영역 (타일 좌표)
+BUFFER = 64
+# 줌 범위별로 그리는 지역 단위 (최소 줌, 코드 자릿수, 레이어 이름)
+REGION_LAYERS = ((0, 2, "sido"), (8, 5, "sigungu"), (11, 8, "eupmyeondong"))
+PARCEL_LAYER = "parcel"
+# 필지 중심점이 타일 밖에 있어도 경계가 걸칠 수 있으므로 조회 범위를 넓힘 (도)
+PARCEL_MARGIN = 0.005
+
+# 프로토콜 버퍼 필드 번호와 지오메트리 명령
+_TILE_LAYERS = 3
+_LAYER_VERSION, _LAYER_NAME, _LAYER_FEATURES = 15, 1, 2
+_LAYER_KEYS, _LAYER_VALUES, _LAYER_EXTENT = 3, 4, 5
+_FEATURE_ID, _FEATURE_TAGS, _FEATURE_TYPE, _FEATURE_GEOMETRY = 1, 2, 3, 4
+_VALUE_STRING = 1
+_POLYGON = 3
+_MOVE_TO, _LINE_TO, _CLOSE_PATH = 1, 2, 7
+
+tile_cache = TieredCache(
+    TTLCache(TILE_CACHE_SIZE, TILE_CACHE_TTL),
+    DirectoryCache(TILE_CACHE_DIR, TILE_CACHE_TTL, ".mvt") if TILE_CACHE_DIR else None,
+)
+# src/seed_tiles.py --refresh 가 디스크 타일을 다시 만든 뒤 갱신하는 파일.
+# 수정 시각을 메모리 캐시 키에 넣어, 실행 중인 서버도 다시 만든 타일을 읽게 한다.
+TILE_GENERATION_FILE = "generation"
+
+
+def tile_generation() -> int:
+    """디스크 타일의 세대(표시 파일의 수정 시각). 표시 파일이 없으면 0."""
+    if not TILE_CACHE_DIR:
+        return 0
+    try:
+        return os.stat(os.path.join(TILE_CACHE_DIR, TILE_GENERATION_FILE)).st_mtime_ns
+    except FileNotFoundError:
+        return 0
+
+
+def bump_tile_generation() -> None:
+    """디스크 타일의 세대를 올려 모든 서버의 메모리 타일 캐시를 무효화한다."""
+    os.makedirs(TILE_CACHE_DIR, exist_ok=True)
+    with open(os.path.join(TILE_CACHE_DIR, TILE_GENERATION_FILE), "w") as f:
+        f.write(str(time.time_ns()))
+
+
+def tile_cache_ttl(z: int) -> int:
+    """타일을 캐시해 둘 기간 (초). 필지 경계가 들어가는 줌은 짧게 보관한다."""
+    return PARCEL_TILE_CACHE_TTL if z >= PARCEL_TILE_MIN_ZOOM else TILE_CACHE_TTL
+
+
+def _varint(value: int) -> bytes:
+    out = bytearray()
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+    return bytes(out)
+
+
+def _uint_field(number: int, value: int) -> bytes:
+    return _varint(number << 3) + _varint(value)
+
+
+def _bytes_field(number: int, payload: bytes) -> bytes:
+    return _varint(number << 3 | 2) + _varint(len(payload)) + payload
+
+
+def _packed_field(number: int, values: List[int]) -> bytes:
+    return _bytes_field(number, b"".join(_varint(value) for value in values))
+
+
+def _command(command: int, count: int) -> int:
+    return command & 0x7 | count << 3
+
+
+def tile_bounds(z: int, x: int, y: int) -> Tuple[float, float, float, float]:
+    """타일의 웹 메르카토르 범위 (min_x, min_y, max_x, max_y, m)."""
+    size = 2 * math.pi * geometry.MERCATOR_RADIUS / 2**z
+    origin = math.pi * geometry.MERCATOR_RADIUS
+    return (
+        x * size - origin,
+        origin - (y + 1) * size,
+        (x + 1) * size - origin,
+        origin - y * size,
+    )
+
+
+def _lnglat(mx: float, my: float) -> Tuple[float, float]:
+    lng = mx / geometry.MERCATOR_RADIUS
+    lat = 2 * math.atan(math.exp(my / geometry.MERCATOR_RADIUS)) - math.pi / 2
+    return math.degrees(lng), math.degrees(lat)
+
+
+def tile_lnglat_bounds(
+    z: int, x: int, y: int, buffer: int = BUFFER
+) -> Tuple[float, float, float, float]:
+    """버퍼를 포함한 타일의 경위도 범위 (서, 남, 동, 북)."""
+    min_x, min_y, max_x, max_y = tile_bounds(z, x, y)
+    pad = (max_x - min_x) * buffer / EXTENT
+    west, south = _lnglat(min_x - pad, min_y - pad)
+    east, north = _lnglat(max_x + pad, max_y + pad)
+    return west, south, east, north
+
+
+def tiles_covering(
+    west: float, south: float, east: float, north: float, z: int
+) -> Iterator[Tuple[int, int]]:
+    """경위도 범위와 겹치는 z 레벨 타일의 (x, y) 를 순서대로 반환한다."""
+    n = 2**z
+    corners = geometry.to_mercator(np.array([[west, north], [east, south]]))
+    size = 2 * math.pi * geometry.MERCATOR_RADIUS / n
+    origin = math.pi * geometry.MERCATOR_RADIUS
+    x0, x1 = ((corners[:, 0] + origin) // size).astype(int).clip(0, n - 1)
+    y0, y1 = ((origin - corners[:, 1]) // size).astype(int).clip(0, n - 1)
+    for x in range(x0, x1 + 1):
+        for y in range(y0, y1 + 1):
+            yield x, y
+
+
+def _clip_ring(ring: np.ndarray, low: float, high: float) -> np.ndarray:
+    """열린 링을 [low, high] 정사각형으로 자른다 (Sutherland–Hodgman)."""
+    for axis in (0, 1):
+        for bound, keep_above in ((low, True), (high, False)):
+            if len(ring) == 0:
+                return ring
+            following = np.roll(ring, -1, axis=0)
+            inside = ring[:, axis] >= bound if keep_above else ring[:, axis] <= bound
+            crossing = inside != np.roll(inside, -1)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                t = (bound - ring[:, axis]) / (following[:, axis] - ring[:, axis])
+                intersection = ring + t[:, None] * (following - ring)
+            # 변마다 (안쪽 시작점, 경계와의 교점) 을 조건에 따라 내보냄
+            points = np.stack((ring, intersection), axis=1)
+            ring = points[np.column_stack((inside, crossing))]
+    return ring
+
+
+def _tile_ring(ring: np.ndarray, exterior: bool) -> Optional[np.ndarray]:
+    """타일 좌표의 링을 정수로 양자화하고 MVT 의 방향(외곽선 양수 면적)으로 맞춘다."""
+    ring = np.rint(ring).astype(np.int64)
+    ring = ring[np.any(ring != np.roll(ring, 1, axis=0), axis=1)]
+    if len(ring) < 3:
+        return None
+    x, y = ring[:, 0], ring[:, 1]
+    area = int((x * np.roll(y, -1) - np.roll(x, -1) * y).sum())
+    if area == 0:
+        return None
+    return ring if (area > 0) == exterior else ring[::-1]
+
+
+def tile_polygons(multi_polygon, z: int, x: int, y: int) -> List[List[np.ndarray]]:
+    """[경도, 위도] MultiPolygon 을 타일 좌표로 변환하고 버퍼 영역까지 잘라낸다."""
+    min_x, _, max_x, max_y = tile_bounds(z, x, y)
+    scale = EXTENT / (max_x - min_x)
+    low, high = -BUFFER, EXTENT + BUFFER
+    result = []
+    for polygon in multi_polygon:
+        rings = []
+        for i, ring in enumerate(polygon):
+            ring = np.asarray(ring, dtype=np.float64)[:, :2]
+            if len(ring) > 1 and (ring[0] == ring[-1]).all():
+                ring = ring[:-1]
+            if len(ring) < 3:
+                if i == 0:
+                    break
+                continue
+            projected = geometry.to_mercator(ring)
+            points = np.column_stack(
+                ((projected[:, 0] - min_x) * scale, (max_y - projected[:, 1]) * scale)
+            )
+            lo, hi = points.min(axis=0), points.max(axis=0)
+            if (hi < low).any() or (lo > high).any():
+                tiled = None
+            else:
+                if (lo < low).any() or (hi > high).any():
+                    points = _clip_ring(points, low, high)
+                tiled = _tile_ring(points, i == 0) if len(points) else None
+            if tiled is None:
+                # 외곽선이 타일 밖이면 구멍도 그리지 않음
+                if i == 0:
+                    break
+                continue
+            rings.append(tiled)
+        if rings:
+            result.append(rings)
+    return result
+
+
+def _geometry_commands(polygons: List[List[np.ndarray]]) -> List[int]:
+    commands = []
+    cursor = np.zeros(2, dtype=np.int64)
+    for polygon in polygons:
+        for ring in polygon:
+            deltas = np.diff(np.vstack((cursor, ring)), axis=0)
+            params = ((deltas << 1) ^ (deltas >> 63)).ravel().tolist()
+            commands.append(_command(_MOVE_TO, 1))
+            commands.extend(params[:2])
+            commands.append(_command(_LINE_TO, len(ring) - 1))
+            commands.extend(params[2:])
+            commands.append(_command(_CLOSE_PATH, 1))
+            cursor = ring[-1]
+    return commands
+
+
+def encode_layer(
+    name: str, features: List[Tuple[int, Dict[str, str], List[List[np.ndarray]]]]
+) -> bytes:
+    """(id, 문자열 속성, tile_polygons 결과) 목록을 MVT 레이어 메시지로 만든다."""
+    keys: Dict[str, int] = {}
+    values: Dict[str, int] = {}
+    encoded = []
+    for feature_id, properties, polygons in features:
+        if not polygons:
+            continue
+        tags = []
+        for key, value in properties.items():
+            if value is None:
+                continue
+            tags.append(keys.setdefault(key, len(keys)))
+            tags.append(values.setdefault(str(value), len(values)))
+        encoded.append(
+            _bytes_field(
+                _LAYER_FEATURES,
+                _uint_field(_FEATURE_ID, feature_id)
+                + _packed_field(_FEATURE_TAGS, tags)
+                + _uint_field(_FEATURE_TYPE, _POLYGON)
+                + _packed_field(_FEATURE_GEOMETRY, _geometry_commands(polygons)),
+            )
+        )
+    if not encoded:
+        return b""
+    return b"".join(
+        [
+            _uint_field(_LAYER_VERSION, 2),
+            _bytes_field(_LAYER_NAME, name.encode("utf-8")),
+            *encoded,
+            *[_bytes_field(_LAYER_KEYS, key.encode("utf-8")) for key in keys],
+            *[
+                _bytes_field(
+                    _LAYER_VALUES,
+                    _bytes_field(_VALUE_STRING, value.encode("utf-8")),
+                )
+                for value in values
+            ],
+            _uint_field(_LAYER_EXTENT, EXTENT),
+        ]
+    )
+
+
+def region_layer(z: int) -> Tuple[int, str]:
+    """줌에서 그리는 지역 단위의 (코드 자릿수, 레이어 이름)."""
+    length, name = REGION_LAYERS[0][1:]
+    for min_zoom, level_length, level_name in REGION_LAYERS:
+        if z >= min_zoom:
+            length, name = level_length, level_name
+    return length, name
+
+
+def _region_geometries(db: Session, length: int, bounds, z: int) -> Dict[str, list]:
+    # 바운딩 박스 컬럼이 채워진 (insert_land_data.backfill_geometry_binary) 경계만 사용
+    west, south, east, north = bounds
+    rows = (
+        db.query(GeometryData.pnu, GeometryData.geometry, GeometryData.multi_polygon)
+        .filter(
+            GeometryData.pnu.like("_" * length),
+            GeometryData.bbox_min_lng <= east,
+            GeometryData.bbox_max_lng >= west,
+            GeometryData.bbox_min_lat <= north,
+            GeometryData.bbox_max_lat >= south,
+        )
+        .all()
+    )
+    level = geometry.lod_level(zoom=z)
+    simplified = {}
+    if rows and level is not None:
+        simplified = dict(
+            db.query(GeometryDataLod.pnu, GeometryDataLod.geometry)
+            .filter(
+                GeometryDataLod.pnu.in_([pnu for pnu, _, _ in rows]),
+                GeometryDataLod.level == level,
+            )
+            .all()
+        )
+    result = {}
+    for pnu, packed, multi_polygon in rows:
+        packed = simplified.get(pnu, packed)
+        result[pnu] = (
+            geometry.decode(packed) if packed is not None else json.loads(multi_polygon)
+        )
+    return result
+
+
+def _parcel_geometries(db: Session, bounds) -> Dict[str, list]:
+    west, south, east, north = bounds
+    rows = (
+        db.query(ParcelGeometryData.pnu, ParcelGeometryData.multi_polygon)
+        .filter(
+            ParcelGeometryData.centroid_lng.between(
+                west - PARCEL_MARGIN, east + PARCEL_MARGIN
+            ),
+            ParcelGeometryData.centroid_lat.between(
+                south - PARCEL_MARGIN, north + PARCEL_MARGIN
+            ),
+        )
+        .all()
+    )
+    return {pnu: json.loads(multi_polygon) for pnu, multi_polygon in rows}
+
+
+def _features(regions: Dict[str, list], z: int, x: int, y: int) -> list:
+    return [
+        (int(pnu), {"pnu": pnu, "name": code2addr(pnu)}, tile_polygons(mp, z, x, y))
+        for pnu, mp in regions.items()
+    ]
+
+
+def build_tile(z: int, x: int, y: int, db: Session) -> bytes:
+    """z/x/y 타일에 걸치는 지역 경계(와 필지 경계)로 벡터 타일을 만든다.
+
+    줌에 따라 시도/시군구/읍면동 중 한 단위를 그리고, geometry_data_lod 에 해당 줌의
+    단순화된 경계가 있으면 사용한다. PARCEL_TILE_MIN_ZOOM 이상에서는
+    parcel_geometry_data 에 저장된 필지 경계도 함께 그린다. 빈 타일은 b"" 이다.
+    """
+    bounds = tile_lnglat_bounds(z, x, y)
+    length, name = region_layer(z)
+    layers = [
+        encode_layer(name, _features(_region_geometries(db, length, bounds, z), z, x, y))
+    ]
+    if z >= PARCEL_TILE_MIN_ZOOM:
+        parcels = _parcel_geometries(db, bounds)
+        layers.append(encode_layer(PARCEL_LAYER, _features(parcels, z, x, y)))
+    return b"".join(_bytes_field(_TILE_LAYERS, layer) for layer in layers if layer)
+
+
+def get_tile(z: int, x: int, y: int, db: Session) -> bytes:
+    """캐시된 타일을 반환하고, 없으면 만들어 캐시한다.
+
+    필지 경계가 들어가는 줌의 타일은 필지가 새로 저장될 수 있으므로
+    메모리에만 PARCEL_TILE_CACHE_TTL 동안 보관한다. 메모리 캐시 키에는 디스크 타일의
+    세대를 넣어, 시드 스크립트가 타일을 다시 만들면 디스크에서 새로 읽는다.
+    """
+    key = (z, x, y)
+    memory_key = (tile_generation(),) + key
+    content = tile_cache.memory.get(memory_key)
+    if content is not MISSING:
+        return content
+    if z >= PARCEL_TILE_MIN_ZOOM:
+        content = build_tile(z, x, y, db)
+        tile_cache.memory.set(memory_key, content, PARCEL_TILE_CACHE_TTL)
+        return content
+    if tile_cache.disk is not None:
+        content = tile_cache.disk.get(key)
+    if content is MISSING:
+        content = build_tile(z, x, y, db)
+        if tile_cache.disk is not None:
+            tile_cache.disk.set(key, content)
+    tile_cache.memory.set(memory_key, content)
+    return content
@@ -1,4 +1,5 @@
-from sqlalchemy import Column, String, Text
+from sqlalchemy import Column, Double, Integer, LargeBinary, String, Text, TIMESTAMP
+from sqlalchemy.sql import func
 from sqlalchemy.types import Numeric
 from app import Base
 
@@ -12,6 +13,53 @@ class GeometryData(Base):
     centroid_lat = Column(Numeric(17, 14), nullable=False, comment="Centroid Latitude")
     centroid_lng = Column(Numeric(17, 14), nullable=False, comment="Centroid Longitude")
     multi_polygon = Column(Text, nullable=False, comment="GeoJSON MultiPolygon data")
+    geometry = Column(
+        LargeBinary(length=2**32 - 1),
+        nullable=True,
+        comment="Packed MultiPolygon (app.functions.geometry)",
+    )
+    bbox_min_lng = Column(Double, nullable=True, comment="Bounding box min longitude")
+    bbox_min_lat = Column(Double, nullable=True, comment="Bounding box min latitude")
+    bbox_max_lng = Column(Double, nullable=True, comment="Bounding box max longitude")
+    bbox_max_lat = Column(Double, nullable=True, comment="Bounding box max latitude")
+    area = Column(Double, nullable=True, comment="Area (m²)")
 
     def __repr__(self):
         return f"<GeometryData(pnu={self.pnu}, centroid_lat={self.centroid_lat}, centroid_lng={self.centroid_lng})>"
+
+
+class GeometryDataLod(Base):
+    __tablename__ = "geometry_data_lod"
+
+    pnu = Column(
+        String(10), primary_key=True, nullable=False, comment="Parcel number (PNU)"
+    )
+    level = Column(
+        Integer, primary_key=True, nullable=False, comment="Web mercator zoom level"
+    )
+    tolerance = Column(Double, nullable=False, comment="Simplification tolerance (m)")
+    geometry = Column(
+        LargeBinary(length=2**32 - 1),
+        nullable=False,
+        comment="Packed simplified MultiPolygon (app.functions.geometry)",
+    )
+
+    def __repr__(self):
+        return f"<GeometryDataLod(pnu={self.pnu}, level={self.level})>"
+
+
+class ParcelGeometryData(Base):
+    __tablename__ = "parcel_geometry_data"
+
+    pnu = Column(
+        String(19), primary_key=True, nullable=False, comment="Parcel number (PNU)"
+    )
+    centroid_lat = Column(Numeric(17, 14), nullable=False, comment="Centroid Latitude")
+    centroid_lng = Column(Numeric(17, 14), nullable=False, comment="Centroid Longitude")
+    multi_polygon = Column(Text, nullable=False, comment="GeoJSON MultiPolygon data")
+    fetched_at = Column(
+        TIMESTAMP, server_default=func.now(), comment="VWorld fetch timestamp"
+    )
+
+    def __repr__(self):
+        return f"<ParcelGeometryData(pnu={self.pnu}, fetched_at={self.fetched_at})>"
@@ -1,4 +1,5 @@
 from sqlalchemy import Column, Integer, String, Float, Text, TIMESTAMP
+from sqlalchemy.types import Numeric
 from sqlalchemy.sql import func
 from app import Base
 
@@ -21,6 +22,14 @@ class LandInfo(Base):
     land_form = Column(String(10), nullable=False, comment="지형 형태")
     road_side = Column(String(10), nullable=False, comment="도로 접면 여부")
     land_uses = Column(Text, nullable=True, comment="토지 이용 계획")
+    lat = Column(Numeric(17, 14), nullable=True, comment="위도")
+    lng = Column(Numeric(17, 14), nullable=True, comment="경도")
+    sido = Column(String(20), nullable=True, comment="시도")
+    sigungu = Column(String(30), nullable=True, comment="시군구")
+    eupmyeondong = Column(String(30), nullable=True, comment="읍면동")
+    donglee = Column(String(30), nullable=True, comment="동리")
+    address_detail = Column(String(20), nullable=True, comment="지번")
+    full_address = Column(String(150), nullable=True, comment="전체 지번 주소")
 
     generated_at = Column(
         TIMESTAMP, server_default=func.now(), comment="데이터 생성일시"
@@ -29,3 +38,44 @@ class LandInfo(Base):
 
     def __repr__(self):
         return f"<LandInfo(pnu={self.pnu}, official_land_price={self.official_land_price}, land_area={self.land_area})>"
+
+
+class MacroIndicator(Base):
+    __tablename__ = "macro_indicator"
+
+    indicator = Column(
+        String(20),
+        primary_key=True,
+        comment="지표 종류 (REGION, LARGE_REGION, PPI, CPI)",
+    )
+    region_code = Column(
+        String(10), primary_key=True, comment="법정동/시도 코드 (전국 지표는 빈 문자열)"
+    )
+    stdr_year = Column(Integer, primary_key=True, comment="기준년도")
+    stdr_month = Column(Integer, primary_key=True, comment="기준월")
+    data = Column(Text, nullable=False, comment="지표 데이터 (JSON)")
+    refreshed_at = Column(
+        TIMESTAMP, server_default=func.now(), onupdate=func.now(), comment="갱신일시"
+    )
+
+    def __repr__(self):
+        return f"<MacroIndicator(indicator={self.indicator}, region_code={self.region_code}, stdr_year={self.stdr_year}, stdr_month={self.stdr_month})>"
+
+
+class LandPrediction(Base):
+    __tablename__ = "land_prediction"
+
+    pnu = Column(String(20), primary_key=True, comment="필지번호 (PNU)")
+    target_year = Column(Integer, primary_key=True, comment="예측 기준년도")
+    target_month = Column(Integer, primary_key=True, comment="예측 기준월")
+    model_version = Column(String(64), primary_key=True, comment="예측 모델 버전")
+    input_hash = Column(
+        String(64), nullable=False, comment="예측 당시 토지 정보의 해시"
+    )
+    predict_price = Column(Float, nullable=False, comment="예측된 토지가격")
+    predicted_at = Column(
+        TIMESTAMP, server_default=func.now(), onupdate=func.now(), comment="예측일시"
+    )
+
+    def __repr__(self):
+        return f"<LandPrediction(pnu={self.pnu}, target_year={self.target_year}, target_month={self.target_month}, model_version={self.model_version})>"
@@ -1,12 +1,12 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
-import json
-from typing import List
+from fastapi import APIRouter, Depends, HTTPException, Path, Query, Response
+from fastapi.concurrency import run_in_threadpool
+from typing import List, Optional
 from sqlalchemy.orm import Session
 from app import get_db
-from app.config.key import VWORLD_API_KEY
-from app.functions.api import GetGeometryDataAPI
-from app.functions import geo
-from app.models.geo import GeometryData
+from app.config.tile import TILE_MAX_ZOOM
+from app.functions import cadastral, geo, geometry, vector_tile
+from app.functions.convert_code import code2addr_many
+from app.functions.response import json_array_response
 from app.schemas import GEO, KUMapBaseResponse
 
 # router
@@ -16,7 +16,8 @@ geo_router = APIRouter(prefix="/geo")
 @geo_router.get("/get-pnu", response_model=GEO.GetPNUResponse)
 async def get_pnu(request: GEO.GetPNURequest = Depends()):
     try:
-        pnu, address = geo.get_pnu(request.lat, request.lng)
+        # PyKakao 는 동기 호출이므로 이벤트 루프를 막지 않도록 스레드풀에서 실행
+        pnu, address = await run_in_threadpool(geo.get_pnu, request.lat, request.lng)
         return {
             "status": "success",
             "message": "해당 위치의 PNU를 성공적으로 받아왔습니다.",
@@ -31,7 +32,7 @@ async def get_pnu(request: GEO.GetPNURequest = Depends()):
 
 @geo_router.get("/get-coord", response_model=KUMapBaseResponse)
 async def get_coord(request: GEO.GetCoordRequest = Depends()):
-    lat, lng = geo.get_coord(request.word)
+    lat, lng = await run_in_threadpool(geo.get_coord, request.word)
     if lat is None or lng is None:
         raise HTTPException(status_code=422, detail="address does not exist")
 
@@ -48,7 +49,7 @@ async def get_coord(request: GEO.GetCoordRequest = Depends()):
     "/auto-complete-address", response_model=GEO.AutoCompleteAddressResponse
 )
 async def auto_complete_address(request: GEO.AutoCompleteAddressRequest = Depends()):
-    result = geo.auto_complete_address(request.query)
+    result = await run_in_threadpool(geo.auto_complete_address, request.query)
 
     return {
         "status": "success",
@@ -57,40 +58,96 @@ async def auto_complete_address(request: GEO.AutoCompleteAddressRequest = Depend
     }
 
 
+@geo_router.post("/resolve-addresses", response_model=GEO.ResolveAddressesResponse)
+async def resolve_addresses(request: GEO.ResolveAddressesRequest):
+    columns = code2addr_many(request.pnu)
+    resolved = columns.pop("resolved")
+    addresses = {}
+    for name, values in columns.items():
+        addresses[name] = [
+            v if ok else None for v, ok in zip(values.tolist(), resolved.tolist())
+        ]
+    # 19자리가 아닌 코드는 code2addr 와 동일하게 detail 을 null 로 반환
+    addresses["detail"] = [v or None for v in addresses["detail"]]
+
+    return {
+        "status": "success",
+        "message": "주소 목록을 성공적으로 변환하였습니다.",
+        "pnu": request.pnu,
+        "addresses": addresses,
+    }
+
+
 @geo_router.get("/get-cadastral-map", response_model=GEO.GetCadastralMapResponse)
 async def get_cadastral_map(
     pnu: List[str] = Query(..., description="Parcel number(s)"),
+    zoom: Optional[float] = Query(
+        None, ge=0, le=24, description="Web mercator zoom level of the map"
+    ),
+    tolerance: Optional[float] = Query(
+        None, gt=0, description="Simplification tolerance in meters (overrides zoom)"
+    ),
     db: Session = Depends(get_db),
 ):
-    result = []
-    for pnu_code in pnu:
-        if len(pnu_code) == 19:
-            geo_api = GetGeometryDataAPI(key=VWORLD_API_KEY)
-            response = geo_api.get_data(pnu=pnu_code)
-            if not response:
-                raise HTTPException(
-                    status_code=422,
-                    detail="해당 토지의 지적도 데이터가 존재하지 않습니다.",
-                )
-            coordinates = response["features"][0]["geometry"]["coordinates"]
-            cleaned_coords = [
-                [[float(point[0]), float(point[1])] for point in polygon]
-                for polygon in coordinates[0]
-            ]
-            result.append(cleaned_coords)
-        else:
-            response = (
-                db.query(GeometryData).filter(GeometryData.pnu == pnu_code).first()
-            )
-            if not response:
-                raise HTTPException(
-                    status_code=422,
-                    detail="해당 토지의 지적도 데이터가 존재하지 않습니다.",
-                )
-            result.append(json.loads(response.multi_polygon))
+    # 줌/허용 오차를 주지 않으면 원본 해상도의 경계를 반환
+    level = geometry.lod_level(zoom, tolerance)
+    result = await cadastral.get_cadastral_polygons(pnu, db, level)
+    if any(polygon is None for polygon in result):
+        raise HTTPException(
+            status_code=422,
+            detail="해당 토지의 지적도 데이터가 존재하지 않습니다.",
+        )
 
-    return {
+    # 지적도 경계는 이미 JSON 바이트이므로 다시 파싱/검증하지 않고 응답 본문에 이어 붙임
+    meta = {"status": "success", "message": "토지 지적도를 받아왔습니다."}
+    return json_array_response(meta, "polygons", result)
+
+
+@geo_router.get("/get-viewport-map", response_model=GEO.GetViewportMapResponse)
+async def get_viewport_map(
+    request: GEO.GetViewportMapRequest = Depends(), db: Session = Depends(get_db)
+):
+    if request.min_lat > request.max_lat or request.min_lng > request.max_lng:
+        raise HTTPException(status_code=422, detail="지도 범위가 올바르지 않습니다.")
+    bounds = (request.min_lng, request.min_lat, request.max_lng, request.max_lat)
+    layer, items, has_next = await run_in_threadpool(
+        cadastral.get_viewport_polygons,
+        bounds,
+        request.zoom,
+        request.page,
+        request.size,
+        db,
+    )
+
+    # 경계는 이미 JSON 바이트이므로 get-cadastral-map 과 같이 그대로 이어 붙임
+    meta = {
         "status": "success",
-        "message": "토지 지적도를 받아왔습니다.",
-        "polygons": result,
+        "message": "지도 범위의 경계를 받아왔습니다.",
+        "layer": layer,
+        "page": request.page,
+        "size": request.size,
+        "has_next": has_next,
     }
+    polygons = [
+        b'{"pnu":' + geometry.dumps(pnu) + b',"polygon":' + polygon + b"}"
+        for pnu, polygon in items
+    ]
+    return json_array_response(meta, "polygons", polygons)
+
+
+@geo_router.get("/tiles/{z}/{x}/{y}")
+async def get_tile(
+    z: int = Path(..., ge=0, le=TILE_MAX_ZOOM, description="Zoom level"),
+    x: int = Path(..., ge=0, description="Tile column"),
+    y: int = Path(..., ge=0, description="Tile row"),
+    db: Session = Depends(get_db),
+):
+    if x >= 2**z or y >= 2**z:
+        raise HTTPException(status_code=404, detail="해당 타일이 존재하지 않습니다.")
+    # 타일 생성(클리핑/인코딩)은 CPU 작업이므로 스레드풀에서 실행
+    content = await run_in_threadpool(vector_tile.get_tile, z, x, y, db)
+    return Response(
+        content=content,
+        media_type="application/vnd.mapbox-vector-tile",
+        headers={"Cache-Control": f"public, max-age={vector_tile.tile_cache_ttl(z)}"},
+    )
@@ -1,8 +1,16 @@
+import queue
+from datetime import datetime
+import pytz
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 from app import get_db
 from app.config.auth import JWTBearer
 from app.functions import land
+from app.functions import make_input_data
+from app.functions import model
+from app.functions.job import prediction_jobs
+from app.functions.response import model_response
 from app.functions import text_generate
 from app.models.user import User, UserFavoriteLand
 from app.schemas import LAND, KUMapBaseResponse
@@ -45,23 +53,45 @@ def get_land_data(
             .filter(UserFavoriteLand.pnu == request.pnu)
             .count()
         )
-        return {
-            "status": "success",
-            "message": "해당 토지의 정보를 성공적으로 받아왔습니다.",
-            "data": data,
-            "like": like,
-            "total_like": total_like,
-        }
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
+    if data is None:
+        raise HTTPException(
+            status_code=404, detail="해당 토지의 정보가 존재하지 않습니다."
+        )
+    # data 는 이미 검증된 LAND.Land 이므로 응답 모델을 다시 검증하지 않음
+    return model_response(
+        LAND.GetLandDataResponse.model_construct(
+            status="success",
+            message="해당 토지의 정보를 성공적으로 받아왔습니다.",
+            data=data,
+            like=like,
+            total_like=total_like,
+        )
+    )
 
 
 @land_router.get(
     "/get-land-predicted-price", response_model=LAND.GetLandPredictedPriceResponse
 )
 def get_land_predicted_price(
-    request: LAND.GetLandRequest = Depends(), db: Session = Depends(get_db)
+    request: LAND.GetLandPredictedPriceRequest = Depends(),
+    db: Session = Depends(get_db),
 ):
+    if request.async_job:
+        try:
+            job = prediction_jobs.submit(request.pnu, request.priority)
+        except queue.Full:
+            raise HTTPException(
+                status_code=503, detail="예측 작업이 많아 잠시 후 다시 시도해주세요."
+            )
+        return {
+            "status": "success",
+            "message": "해당 토지의 예측 작업을 등록하였습니다.",
+            "job_id": job.job_id,
+            "job_status": job.status,
+        }
+
     try:
         predict_price = land.set_land_predict_price_data(request.pnu, db)
         return {
@@ -73,6 +103,72 @@ def get_land_predicted_price(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@land_router.get(
+    "/get-prediction-job", response_model=LAND.GetPredictionJobResponse
+)
+async def get_prediction_job(request: LAND.GetPredictionJobRequest = Depends()):
+    job = prediction_jobs.get(request.job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="예측 작업이 존재하지 않습니다.")
+    if request.wait > 0:
+        await run_in_threadpool(job.finished.wait, request.wait)
+    return {
+        "status": "success",
+        "message": "예측 작업 상태를 성공적으로 받아왔습니다.",
+        "job_id": job.job_id,
+        "pnu": job.pnu,
+        "job_status": job.status,
+        "predict_price": job.result,
+        "error": job.error,
+    }
+
+
+@land_router.post(
+    "/predict-land-prices", response_model=LAND.PredictLandPricesResponse
+)
+async def predict_land_prices(
+    request: LAND.PredictLandPricesRequest, db: Session = Depends(get_db)
+):
+    now = datetime.now(pytz.timezone("Asia/Seoul"))
+    year, month = now.year, now.month
+    try:
+        # 저장된 예측이 유효한 필지는 다시 계산하지 않음
+        predictions = dict.fromkeys(request.pnu)
+        # 입력 지표는 법정동별로 한 번만 조회하여 확인과 저장에 함께 사용
+        fingerprints = await run_in_threadpool(
+            make_input_data.input_fingerprints, request.pnu, year, month
+        )
+        stored = await run_in_threadpool(
+            land.get_stored_predictions, request.pnu, year, month, db, fingerprints
+        )
+        predictions.update(stored)
+        targets = [pnu for pnu in predictions if pnu not in stored]
+        if targets:
+            predicted = await model.predict_many_async(targets, year, month)
+            await run_in_threadpool(
+                land.save_land_predict_prices,
+                predicted,
+                year,
+                month,
+                db,
+                fingerprints,
+            )
+            predictions.update(predicted)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+    # 최대 PREDICT_BATCH_MAX_SIZE 개의 항목을 다시 검증하지 않도록 바로 구성
+    return model_response(
+        LAND.PredictLandPricesResponse.model_construct(
+            status="success",
+            message="토지 예측가 목록을 성공적으로 받아왔습니다.",
+            predictions=[
+                LAND.PredictedPrice.model_construct(pnu=pnu, predict_price=price)
+                for pnu, price in predictions.items()
+            ],
+        )
+    )
+
+
 @land_router.get("/get-land-report", response_model=KUMapBaseResponse)
 def get_land_report(
     request: LAND.GetLandRequest = Depends(),
@@ -1,5 +1,6 @@
 from pydantic import BaseModel, Field
-from typing import Optional
+from typing import List, Optional
+from app.config.tile import TILE_MAX_ZOOM, VIEWPORT_MAX_PAGE_SIZE, VIEWPORT_PAGE_SIZE
 from app.schemas import KUMapBaseResponse
 
 
@@ -13,6 +14,17 @@ class AddressSchema(BaseModel):
     fulladdr: Optional[str] = Field(None, description="Full formatted address")
 
 
+class AddressColumnsSchema(BaseModel):
+    sido: List[Optional[str]] = Field(..., description="Province/City")
+    sigungu: List[Optional[str]] = Field(..., description="City/District")
+    eupmyeondong: List[Optional[str]] = Field(..., description="Township/Village")
+    donglee: List[Optional[str]] = Field(..., description="Neighborhood")
+    detail: List[Optional[str]] = Field(
+        ..., description="Detailed address (if applicable)"
+    )
+    fulladdr: List[Optional[str]] = Field(..., description="Full formatted address")
+
+
 # requests
 class GetPNURequest(BaseModel):
     lat: float = Field(..., description="Latitude coordinate")
@@ -27,6 +39,25 @@ class AutoCompleteAddressRequest(BaseModel):
     query: str = Field(..., description="Search query")
 
 
+class ResolveAddressesRequest(BaseModel):
+    pnu: List[str] = Field(..., description="Parcel number(s)")
+
+
+class GetViewportMapRequest(BaseModel):
+    min_lat: float = Field(..., ge=-90, le=90, description="South latitude")
+    min_lng: float = Field(..., ge=-180, le=180, description="West longitude")
+    max_lat: float = Field(..., ge=-90, le=90, description="North latitude")
+    max_lng: float = Field(..., ge=-180, le=180, description="East longitude")
+    zoom: float = Field(..., ge=0, le=TILE_MAX_ZOOM, description="Web mercator zoom")
+    page: int = Field(1, ge=1, description="Page number")
+    size: int = Field(
+        VIEWPORT_PAGE_SIZE,
+        ge=1,
+        le=VIEWPORT_MAX_PAGE_SIZE,
+        description="Polygons per page",
+    )
+
+
 # responses
 class GetPNUResponse(KUMapBaseResponse):
     pnu: str = Field(..., description="19-digit PNU code")
@@ -45,3 +76,25 @@ class AutoCompleteAddressResponse(KUMapBaseResponse):
 
 class GetCadastralMapResponse(KUMapBaseResponse):
     polygons: list
+
+
+class ViewportPolygonSchema(BaseModel):
+    pnu: str = Field(..., description="Region code or 19-digit PNU code")
+    polygon: list = Field(..., description="MultiPolygon coordinates")
+
+
+class GetViewportMapResponse(KUMapBaseResponse):
+    layer: str = Field(
+        ..., description="sido / sigungu / eupmyeondong / parcel (chosen by zoom)"
+    )
+    page: int = Field(..., description="Page number")
+    size: int = Field(..., description="Polygons per page")
+    has_next: bool = Field(..., description="Whether another page exists")
+    polygons: List[ViewportPolygonSchema]
+
+
+class ResolveAddressesResponse(KUMapBaseResponse):
+    pnu: List[str] = Field(..., description="Requested parcel number(s)")
+    addresses: AddressColumnsSchema = Field(
+        ..., description="Resolved address columns (null if not found)"
+    )
@@ -1,5 +1,6 @@
 from app.schemas import KUMapBaseResponse
 from app.schemas.GEO import AddressSchema
+from app.config.model import PREDICT_BATCH_MAX_SIZE
 from pydantic import BaseModel, Field, NaiveDatetime
 from typing import Optional, List
 
@@ -73,11 +74,38 @@ class Land(BaseModel):
     listing: Optional[Listing] = Field(None, description="매물 정보")
 
 
+class PredictedPrice(BaseModel):
+    pnu: str = Field(..., description="PNU코드")
+    predict_price: Optional[float] = Field(
+        None, description="예측 실거래가 (입력 데이터를 만들지 못하면 null)"
+    )
+
+
 # requests
 class GetLandRequest(BaseModel):
     pnu: str = Field(..., description="PNU코드")
 
 
+class GetLandPredictedPriceRequest(GetLandRequest):
+    async_job: bool = Field(
+        False, description="예측을 작업 큐에 넣고 작업 ID 를 바로 반환할지 여부"
+    )
+    priority: int = Field(0, description="작업 우선순위 (높을수록 먼저 처리)")
+
+
+class GetPredictionJobRequest(BaseModel):
+    job_id: str = Field(..., description="예측 작업 ID")
+    wait: float = Field(
+        0, ge=0, le=30, description="작업이 끝날 때까지 기다릴 최대 시간 (초)"
+    )
+
+
+class PredictLandPricesRequest(BaseModel):
+    pnu: List[str] = Field(
+        ..., min_length=1, max_length=PREDICT_BATCH_MAX_SIZE, description="PNU코드 목록"
+    )
+
+
 # responses
 class GetLandDataResponse(KUMapBaseResponse):
     data: Land = Field(..., description="토지 정보 데이터")
@@ -87,3 +115,19 @@ class GetLandDataResponse(KUMapBaseResponse):
 
 class GetLandPredictedPriceResponse(KUMapBaseResponse):
     predict_price: float = Field(None, description="예측 실거래가")
+    job_id: Optional[str] = Field(None, description="예측 작업 ID (async_job 인 경우)")
+    job_status: Optional[str] = Field(
+        None, description="작업 상태 (queued, running, done, failed)"
+    )
+
+
+class GetPredictionJobResponse(KUMapBaseResponse):
+    job_id: str = Field(..., description="예측 작업 ID")
+    pnu: str = Field(..., description="PNU코드")
+    job_status: str = Field(..., description="작업 상태 (queued, running, done, failed)")
+    predict_price: Optional[float] = Field(None, description="예측 실거래가")
+    error: Optional[str] = Field(None, description="실패 사유")
+
+
+class PredictLandPricesResponse(KUMapBaseResponse):
+    predictions: List[PredictedPrice] = Field(..., description="필지별 예측 실거래가")
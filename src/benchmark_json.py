@@ -0,0 +1,118 @@
+import os
+import sys
+import json
+import time
+import argparse
+import statistics
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from fastapi.encoders import jsonable_encoder
+from app.functions import geometry
+from app.schemas import GEO
+
+# 가장 큰 시도 경계로 /geo/get-cadastral-map 응답 직렬화 방식별 시간을 비교하는 스크립트
+#   python src/benchmark_json.py               (geometry_data 에서 가장 큰 시도)
+#   python src/benchmark_json.py --geojson sido.json
+# --geojson 은 MultiPolygon 좌표, geometry 또는 Feature 형태의 GeoJSON 파일을 받는다.
+
+MESSAGE = "토지 지적도를 받아왔습니다."
+
+
+def load_largest_sido():
+    from sqlalchemy import func
+    from app import SessionLocal
+    from app.models.geo import GeometryData
+
+    with SessionLocal() as db:
+        row = (
+            db.query(GeometryData.pnu, GeometryData.multi_polygon)
+            .filter(GeometryData.pnu.like("__"))
+            .order_by(func.length(GeometryData.multi_polygon).desc())
+            .first()
+        )
+    if row is None:
+        raise SystemExit("geometry_data has no sido boundaries")
+    return row.pnu, row.multi_polygon
+
+
+def load_geojson(path: str):
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    if isinstance(data, dict):
+        data = data.get("geometry", data).get("coordinates")
+    return os.path.basename(path), json.dumps(data)
+
+
+def envelope(polygon: bytes) -> bytes:
+    return b"".join(
+        (
+            b'{"status":"success","message":',
+            geometry.dumps(MESSAGE),
+            b',"polygons":[',
+            polygon,
+            b"]}",
+        )
+    )
+
+
+def benchmark(name: str, func, repeat: int) -> None:
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        body = func()
+        times.append(time.perf_counter() - start)
+    print(
+        f"{name:<34} {statistics.median(times) * 1000:9.1f} ms "
+        f"{min(times) * 1000:9.1f} ms {len(body) / 1e6:8.2f} MB"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark polygon JSON responses")
+    parser.add_argument("--geojson", help="read the polygon from a GeoJSON file")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--zoom", type=int, default=8, help="zoom of the LOD path")
+    args = parser.parse_args()
+
+    code, text = load_geojson(args.geojson) if args.geojson else load_largest_sido()
+    coordinates = json.loads(text)
+    packed = geometry.encode(coordinates)
+    simplified = geometry.encode(
+        geometry.simplify(geometry.decode(packed), geometry.zoom_tolerance(args.zoom))
+    )
+    print(
+        f"# {code}: {len(coordinates)} polygons, "
+        f"{sum(len(ring) for polygon in coordinates for ring in polygon)} points, "
+        f"{len(text) / 1e6:.2f} MB JSON, {len(packed) / 1e6:.2f} MB packed"
+    )
+    print(f"{'path':<34} {'median':>12} {'min':>12} {'size':>11}")
+
+    def response_model_json():
+        # 이전 방식: JSON 파싱 → response_model 검증 → jsonable_encoder → json.dumps
+        content = {"status": "success", "message": MESSAGE, "polygons": [json.loads(text)]}
+        model = GEO.GetCadastralMapResponse.model_validate(content)
+        return json.dumps(jsonable_encoder(model)).encode("utf-8")
+
+    def response_model_pydantic():
+        # FastAPI 기본 방식: JSON 파싱 → response_model 검증 → pydantic-core 직렬화
+        content = {"status": "success", "message": MESSAGE, "polygons": [json.loads(text)]}
+        return GEO.GetCadastralMapResponse.model_validate(content).model_dump_json()
+
+    benchmark("json.loads + validate + json", response_model_json, args.repeat)
+    benchmark("json.loads + validate + pydantic", response_model_pydantic, args.repeat)
+    benchmark(
+        "json.loads + orjson (no validate)",
+        lambda: envelope(geometry.dumps(json.loads(text))),
+        args.repeat,
+    )
+    benchmark("stored JSON text", lambda: envelope(text.encode("utf-8")), args.repeat)
+    benchmark(
+        "packed binary + orjson",
+        lambda: envelope(geometry.to_json_bytes(packed)),
+        args.repeat,
+    )
+    benchmark(
+        f"packed LOD z{args.zoom} + orjson",
+        lambda: envelope(geometry.to_json_bytes(simplified)),
+        args.repeat,
+    )
@@ -48,6 +48,14 @@ def create_land_info(connection: object) -> None:
         land_form VARCHAR(10) NOT NULL,
         road_side VARCHAR(10) NOT NULL,
         land_uses TEXT,
+        lat DECIMAL(17,14),
+        lng DECIMAL(17,14),
+        sido VARCHAR(20),
+        sigungu VARCHAR(30),
+        eupmyeondong VARCHAR(30),
+        donglee VARCHAR(30),
+        address_detail VARCHAR(20),
+        full_address VARCHAR(150),
         generated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
         predicted_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
     );
@@ -62,6 +70,73 @@ def create_land_info(connection: object) -> None:
             cursor.close()
 
 
+LAND_INFO_LOCATION_COLUMNS = (
+    ("lat", "DECIMAL(17,14)"),
+    ("lng", "DECIMAL(17,14)"),
+    ("sido", "VARCHAR(20)"),
+    ("sigungu", "VARCHAR(30)"),
+    ("eupmyeondong", "VARCHAR(30)"),
+    ("donglee", "VARCHAR(30)"),
+    ("address_detail", "VARCHAR(20)"),
+    ("full_address", "VARCHAR(150)"),
+)
+
+
+def _add_missing_columns(
+    connection: object, table: str, columns: tuple, after: str
+) -> None:
+    cursor = connection.cursor()
+    try:
+        cursor.execute(
+            """
+    SELECT COLUMN_NAME FROM information_schema.COLUMNS
+    WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s;
+    """,
+            (table,),
+        )
+        existing = {column for (column,) in cursor.fetchall()}
+        previous = after
+        for column, column_type in columns:
+            if column not in existing:
+                cursor.execute(
+                    f"ALTER TABLE {table} ADD COLUMN {column} {column_type} AFTER {previous};"
+                )
+            previous = column
+        connection.commit()
+    finally:
+        cursor.close()
+
+
+def _add_missing_index(
+    connection: object, table: str, name: str, columns: str
+) -> None:
+    cursor = connection.cursor()
+    try:
+        cursor.execute(
+            """
+    SELECT COUNT(*) FROM information_schema.STATISTICS
+    WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s AND INDEX_NAME = %s;
+    """,
+            (table, name),
+        )
+        if cursor.fetchone()[0] == 0:
+            cursor.execute(f"CREATE INDEX {name} ON {table} ({columns});")
+        connection.commit()
+    finally:
+        cursor.close()
+
+
+def migrate_land_info_location(connection: object) -> None:
+    # 좌표/주소 컬럼이 없는 기존 land_info 테이블에 컬럼을 추가
+    try:
+        _add_missing_columns(
+            connection, "land_info", LAND_INFO_LOCATION_COLUMNS, "land_uses"
+        )
+        print("Land info location columns migrated successfully.")
+    except Error as err:
+        print(f'Error: "{err}"')
+
+
 def create_land_report(connection: object) -> None:
     try:
         cursor = connection.cursor()
@@ -170,7 +245,14 @@ def create_geometry_data(connection: object) -> None:
         pnu VARCHAR(10) NOT NULL PRIMARY KEY,
         centroid_lat DECIMAL(17,14) NOT NULL,
         centroid_lng DECIMAL(17,14) NOT NULL,
-        multi_polygon LONGTEXT NOT NULL
+        multi_polygon LONGTEXT NOT NULL,
+        geometry LONGBLOB,
+        bbox_min_lng DOUBLE,
+        bbox_min_lat DOUBLE,
+        bbox_max_lng DOUBLE,
+        bbox_max_lat DOUBLE,
+        area DOUBLE,
+        INDEX idx_geometry_data_bbox (bbox_min_lng, bbox_min_lat)
     );
     """
         cursor.execute(query)
@@ -183,6 +265,93 @@ def create_geometry_data(connection: object) -> None:
             cursor.close()
 
 
+GEOMETRY_DATA_BINARY_COLUMNS = (
+    ("geometry", "LONGBLOB"),
+    ("bbox_min_lng", "DOUBLE"),
+    ("bbox_min_lat", "DOUBLE"),
+    ("bbox_max_lng", "DOUBLE"),
+    ("bbox_max_lat", "DOUBLE"),
+    ("area", "DOUBLE"),
+)
+
+
+def migrate_geometry_data_binary(connection: object) -> None:
+    # 바이너리 지오메트리와 바운딩 박스/면적 컬럼이 없는 기존 geometry_data 에 추가
+    try:
+        _add_missing_columns(
+            connection, "geometry_data", GEOMETRY_DATA_BINARY_COLUMNS, "multi_polygon"
+        )
+        _add_missing_index(
+            connection,
+            "geometry_data",
+            "idx_geometry_data_bbox",
+            "bbox_min_lng, bbox_min_lat",
+        )
+        print("Geometry data binary columns migrated successfully.")
+    except Error as err:
+        print(f'Error: "{err}"')
+
+
+def create_geometry_data_lod(connection: object) -> None:
+    try:
+        cursor = connection.cursor()
+        query = """
+    CREATE TABLE IF NOT EXISTS geometry_data_lod (
+        pnu VARCHAR(10) NOT NULL,
+        level TINYINT NOT NULL,
+        tolerance DOUBLE NOT NULL,
+        geometry LONGBLOB NOT NULL,
+        PRIMARY KEY (pnu, level),
+        FOREIGN KEY (pnu) REFERENCES geometry_data(pnu) ON DELETE CASCADE
+    );
+    """
+        cursor.execute(query)
+        connection.commit()
+        print("Geometry data LOD table created successfully.")
+    except Error as err:
+        print(f'Error: "{err}"')
+    finally:
+        if connection.is_connected():
+            cursor.close()
+
+
+def create_parcel_geometry_data(connection: object) -> None:
+    try:
+        cursor = connection.cursor()
+        query = """
+    CREATE TABLE IF NOT EXISTS parcel_geometry_data (
+        pnu VARCHAR(19) NOT NULL PRIMARY KEY,
+        centroid_lat DECIMAL(17,14) NOT NULL,
+        centroid_lng DECIMAL(17,14) NOT NULL,
+        multi_polygon LONGTEXT NOT NULL,
+        fetched_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        INDEX idx_parcel_geometry_data_centroid (centroid_lng, centroid_lat)
+    );
+    """
+        cursor.execute(query)
+        connection.commit()
+        print("Parcel geometry data table created successfully.")
+    except Error as err:
+        print(f'Error: "{err}"')
+    finally:
+        if connection.is_connected():
+            cursor.close()
+
+
+def migrate_parcel_geometry_data_index(connection: object) -> None:
+    # 지도 범위 조회용 중심점 인덱스가 없는 기존 parcel_geometry_data 에 추가
+    try:
+        _add_missing_index(
+            connection,
+            "parcel_geometry_data",
+            "idx_parcel_geometry_data_centroid",
+            "centroid_lng, centroid_lat",
+        )
+        print("Parcel geometry data index migrated successfully.")
+    except Error as err:
+        print(f'Error: "{err}"')
+
+
 def create_user_favorite_land(connection: object) -> None:
     try:
         cursor = connection.cursor()
@@ -203,3 +372,52 @@ def create_user_favorite_land(connection: object) -> None:
     finally:
         if connection.is_connected():
             cursor.close()
+
+
+def create_macro_indicator(connection: object) -> None:
+    try:
+        cursor = connection.cursor()
+        query = """
+    CREATE TABLE IF NOT EXISTS macro_indicator (
+        indicator VARCHAR(20) NOT NULL,
+        region_code VARCHAR(10) NOT NULL,
+        stdr_year INT NOT NULL,
+        stdr_month INT NOT NULL,
+        data TEXT NOT NULL,
+        refreshed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+        PRIMARY KEY (indicator, region_code, stdr_year, stdr_month)
+    );
+    """
+        cursor.execute(query)
+        connection.commit()
+        print("Macro indicator table created successfully.")
+    except Error as err:
+        print(f'Error: "{err}"')
+    finally:
+        if connection.is_connected():
+            cursor.close()
+
+
+def create_land_prediction(connection: object) -> None:
+    try:
+        cursor = connection.cursor()
+        query = """
+    CREATE TABLE IF NOT EXISTS land_prediction (
+        pnu VARCHAR(20) NOT NULL,
+        target_year INT NOT NULL,
+        target_month INT NOT NULL,
+        model_version VARCHAR(64) NOT NULL,
+        input_hash VARCHAR(64) NOT NULL,
+        predict_price FLOAT NOT NULL,
+        predicted_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+        PRIMARY KEY (pnu, target_year, target_month, model_version)
+    );
+    """
+        cursor.execute(query)
+        connection.commit()
+        print("Land prediction table created successfully.")
+    except Error as err:
+        print(f'Error: "{err}"')
+    finally:
+        if connection.is_connected():
+            cursor.close()
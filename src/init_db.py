@@ -10,11 +10,18 @@ if __name__ == "__main__":
     connection = create_connection("localhost", USER_NAME, USER_PW, DATABASE_NAME)
     create_user(connection)
     create_land_info(connection)
+    migrate_land_info_location(connection)
     create_land_report(connection)
     create_listing(connection)
     create_trade_history(connection)
     create_region_coordinate(connection)
     create_geometry_data(connection)
+    migrate_geometry_data_binary(connection)
+    create_geometry_data_lod(connection)
+    create_parcel_geometry_data(connection)
+    migrate_parcel_geometry_data_index(connection)
     create_user_favorite_land(connection)
+    create_macro_indicator(connection)
+    create_land_prediction(connection)
     connection.close()
     print("Database initialize.")
@@ -5,6 +5,7 @@ import json
 sys.path.append("/home/kumap/land-price-backend/")
 from app.config import BASE_DIR
 from app.functions.geo import get_coord
+from app.functions import geometry
 from src.database import create_connection, USER_NAME, USER_PW, DATABASE_NAME
 
 
@@ -163,8 +164,92 @@ def insert_cadastral_data(connection: object):
                 print(e)
 
 
+def backfill_geometry_binary(connection: object):
+    # multi_polygon(JSON) 으로부터 바이너리 지오메트리, 바운딩 박스, 면적을 채우고
+    # 중심점을 꼭짓점 평균 대신 면적 가중 중심으로 다시 계산
+    print("# Backfill packed geometry data")
+    cursor = connection.cursor()
+    cursor.execute("SELECT pnu, multi_polygon FROM geometry_data WHERE geometry IS NULL;")
+    rows = cursor.fetchall()
+    query = """
+    UPDATE geometry_data
+    SET geometry = %s, bbox_min_lng = %s, bbox_min_lat = %s, bbox_max_lng = %s,
+        bbox_max_lat = %s, area = %s, centroid_lat = %s, centroid_lng = %s
+    WHERE pnu = %s;
+    """
+    count = 0
+    for pnu, multi_polygon in rows:
+        count += 1
+        print(f"\r#   {count:5d}/{len(rows):5d} {pnu}", end="")
+        try:
+            multi_polygon = json.loads(multi_polygon)
+            measured = geometry.measure(multi_polygon)
+            cursor.execute(
+                query,
+                (
+                    geometry.encode(multi_polygon),
+                    measured["bbox_min_lng"],
+                    measured["bbox_min_lat"],
+                    measured["bbox_max_lng"],
+                    measured["bbox_max_lat"],
+                    measured["area"],
+                    measured["centroid_lat"],
+                    measured["centroid_lng"],
+                    pnu,
+                ),
+            )
+        except Exception as e:
+            print(f" {e}")
+        if count % 100 == 0:
+            connection.commit()
+    connection.commit()
+    print()
+
+
+def build_geometry_lod(connection: object, rebuild: bool = False):
+    # 줌 레벨별(geometry.LOD_ZOOMS)로 단순화한 경계를 미리 만들어 geometry_data_lod 에 저장
+    print("# Build simplified geometry levels")
+    cursor = connection.cursor()
+    if rebuild:
+        cursor.execute("DELETE FROM geometry_data_lod;")
+        connection.commit()
+    cursor.execute(
+        """
+    SELECT pnu FROM geometry_data
+    WHERE geometry IS NOT NULL
+    AND pnu NOT IN (SELECT DISTINCT pnu FROM geometry_data_lod);
+    """
+    )
+    pnus = [pnu for (pnu,) in cursor.fetchall()]
+    query = """
+    REPLACE INTO geometry_data_lod (pnu, level, tolerance, geometry)
+    VALUES (%s, %s, %s, %s);
+    """
+    count = 0
+    for pnu in pnus:
+        count += 1
+        print(f"\r#   {count:5d}/{len(pnus):5d} {pnu}", end="")
+        try:
+            cursor.execute("SELECT geometry FROM geometry_data WHERE pnu = %s;", (pnu,))
+            multi_polygon = geometry.decode(cursor.fetchone()[0])
+            for level in geometry.LOD_ZOOMS:
+                tolerance = geometry.zoom_tolerance(level)
+                simplified = geometry.simplify(multi_polygon, tolerance)
+                cursor.execute(
+                    query, (pnu, level, tolerance, geometry.encode(simplified))
+                )
+        except Exception as e:
+            print(f" {e}")
+        if count % 100 == 0:
+            connection.commit()
+    connection.commit()
+    print()
+
+
 if __name__ == "__main__":
     connection = create_connection("localhost", USER_NAME, USER_PW, DATABASE_NAME)
     # insert_region_coordinates(connection)
     insert_cadastral_data(connection)
+    backfill_geometry_binary(connection)
+    build_geometry_lod(connection)
     connection.close()
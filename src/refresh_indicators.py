@@ -0,0 +1,32 @@
+import os
+import sys
+import argparse
+from datetime import datetime
+import pytz
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from app import SessionLocal
+from app.functions import indicator
+
+# 월별 거시 지표(지가변동률, 물가지수) 테이블 갱신 스크립트
+# 매일 새벽 cron 으로 실행하여 이번 달과 지난 달 지표를 갱신한다.
+# PPI, CPI, 모든 시도의 권역별 지가변동률과 법정동별 지가변동률을 저장한다.
+#   0 4 * * * cd /home/kumap/land-price-backend && python src/refresh_indicators.py
+
+if __name__ == "__main__":
+    now = datetime.now(pytz.timezone("Asia/Seoul"))
+    parser = argparse.ArgumentParser(description="Refresh monthly macro indicators")
+    parser.add_argument("--year", type=int, default=now.year)
+    parser.add_argument("--month", type=int, default=now.month)
+    parser.add_argument(
+        "--ld-code",
+        action="append",
+        help="legal-dong code whose regional rate is refreshed "
+        "(default: every code in land_info; "
+        "PPI, CPI and every sido are always refreshed)",
+    )
+    args = parser.parse_args()
+
+    with SessionLocal() as db:
+        count = indicator.refresh_recent(db, args.year, args.month, args.ld_code)
+    print(f"# {count} macro indicator rows refreshed.")
@@ -0,0 +1,132 @@
+import os
+import sys
+import json
+import time
+import asyncio
+import argparse
+from datetime import datetime
+import pytz
+from sqlalchemy import or_
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from app import SessionLocal
+from app.config import BASE_DIR
+from app.functions import land, make_input_data, model
+from app.models.land import LandInfo
+
+# land_info 전체(또는 지역)의 예측가를 다시 계산하는 스크립트
+# 매일 밤 cron 으로 실행하며, 중단되면 체크포인트부터 이어서 진행한다.
+#   0 2 * * * cd /home/kumap/land-price-backend && python src/repredict_land.py
+
+
+def load_checkpoint(path: str, key: dict, restart: bool = False) -> dict:
+    if os.path.exists(path) and not restart:
+        with open(path, encoding="utf-8") as f:
+            checkpoint = json.load(f)
+        if checkpoint.get("key") == key:
+            return checkpoint
+        print("# Checkpoint is for a different run, starting over.")
+    return {"key": key, "last_pnu": "", "predicted": 0, "skipped": 0, "failed": 0}
+
+
+def save_checkpoint(path: str, checkpoint: dict) -> None:
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(checkpoint, f)
+    os.replace(tmp_path, path)
+
+
+def next_chunk(db, last_pnu: str, regions, chunk_size: int):
+    query = db.query(LandInfo.pnu).filter(LandInfo.pnu > last_pnu)
+    if regions:
+        query = query.filter(or_(*[LandInfo.pnu.like(f"{r}%") for r in regions]))
+    return [pnu for (pnu,) in query.order_by(LandInfo.pnu).limit(chunk_size).all()]
+
+
+async def run(args) -> None:
+    key = {"year": args.year, "month": args.month, "regions": sorted(args.region)}
+    checkpoint = load_checkpoint(args.checkpoint, key, args.restart)
+    if checkpoint["last_pnu"]:
+        print(f"# Resume after {checkpoint['last_pnu']}")
+
+    start_time = time.time()
+    processed = 0
+    with SessionLocal() as db:
+        while True:
+            pnus = next_chunk(db, checkpoint["last_pnu"], args.region, args.chunk_size)
+            if not pnus:
+                break
+            chunk_start = time.time()
+
+            # 같은 기준월, 같은 모델, 같은 입력으로 저장된 예측은 건너뜀
+            # (입력 지표는 청크의 법정동별로 한 번만 조회하여 확인과 저장에 함께 사용)
+            fingerprints = make_input_data.input_fingerprints(
+                pnus, args.year, args.month
+            )
+            stored = (
+                land.get_stored_predictions(
+                    pnus, args.year, args.month, db, fingerprints
+                )
+                if not args.force
+                else {}
+            )
+            targets = [pnu for pnu in pnus if pnu not in stored]
+            predictions = await model.predict_many_async(
+                targets, args.year, args.month, args.concurrency
+            )
+            saved = land.save_land_predict_prices(
+                predictions, args.year, args.month, db, fingerprints
+            )
+
+            checkpoint["last_pnu"] = pnus[-1]
+            checkpoint["predicted"] += saved
+            checkpoint["skipped"] += len(stored)
+            checkpoint["failed"] += len(targets) - saved
+            save_checkpoint(args.checkpoint, checkpoint)
+
+            processed += len(pnus)
+            elapsed = time.time() - start_time
+            print(
+                f"# {pnus[-1]}: {saved}/{len(targets)} predicted, "
+                f"{len(stored)} up to date ({time.time() - chunk_start:.1f}s) | "
+                f"{processed} parcels, {processed / elapsed:.1f} parcels/s"
+            )
+
+    elapsed = time.time() - start_time
+    print(
+        f"# Done: {checkpoint['predicted']} predicted, {checkpoint['skipped']} up to date, "
+        f"{checkpoint['failed']} failed in {elapsed:.1f}s"
+    )
+    if os.path.exists(args.checkpoint):
+        os.remove(args.checkpoint)
+
+
+if __name__ == "__main__":
+    now = datetime.now(pytz.timezone("Asia/Seoul"))
+    parser = argparse.ArgumentParser(description="Re-predict land prices in land_info")
+    parser.add_argument("--year", type=int, default=now.year)
+    parser.add_argument("--month", type=int, default=now.month)
+    parser.add_argument(
+        "--region",
+        action="append",
+        default=[],
+        help="PNU prefix to re-predict, e.g. 11 or 11110 (default: every parcel)",
+    )
+    parser.add_argument("--chunk-size", type=int, default=500)
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=None,
+        help="parcels whose features are built at once (default: PREDICT_BATCH_CONCURRENCY)",
+    )
+    parser.add_argument(
+        "--checkpoint",
+        default=os.path.join(BASE_DIR or ".", "repredict_land.checkpoint.json"),
+    )
+    parser.add_argument(
+        "--restart", action="store_true", help="ignore an existing checkpoint"
+    )
+    parser.add_argument(
+        "--force", action="store_true", help="re-predict up-to-date parcels as well"
+    )
+    asyncio.run(run(parser.parse_args()))
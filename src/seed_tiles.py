@@ -0,0 +1,67 @@
+import os
+import sys
+import time
+import argparse
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from app import SessionLocal
+from app.config.tile import PARCEL_TILE_MIN_ZOOM, TILE_CACHE_DIR, TILE_SEED_MAX_ZOOM
+from app.functions import vector_tile
+from app.functions.cache import MISSING
+
+# 저줌 벡터 타일을 미리 만들어 TILE_CACHE_DIR 에 저장하는 스크립트
+# 경계 데이터(insert_land_data.py)를 다시 넣은 뒤 --refresh 로 실행한다.
+# --refresh 는 끝날 때 타일 세대를 올리므로 실행 중인 서버를 재시작할 필요가 없다.
+#   python src/seed_tiles.py --max-zoom 10 --refresh
+
+# 대한민국 전체를 덮는 경위도 범위 (서, 남, 동, 북)
+KOREA_BOUNDS = (124.5, 33.0, 132.0, 38.7)
+
+
+def seed(args) -> None:
+    start_time = time.time()
+    total = built = 0
+    disk = vector_tile.tile_cache.disk
+    with SessionLocal() as db:
+        for z in range(args.min_zoom, args.max_zoom + 1):
+            tiles = list(vector_tile.tiles_covering(*args.bounds, z))
+            zoom_start = time.time()
+            for x, y in tiles:
+                key = (z, x, y)
+                if not args.refresh and disk.get(key) is not MISSING:
+                    continue
+                disk.set(key, vector_tile.build_tile(z, x, y, db))
+                built += 1
+            total += len(tiles)
+            print(
+                f"# z={z}: {len(tiles)} tiles ({time.time() - zoom_start:.1f}s) | "
+                f"{built}/{total} built"
+            )
+    if args.refresh:
+        # 실행 중인 서버가 메모리에 들고 있는 이전 타일 대신 새 타일을 읽도록 함
+        vector_tile.bump_tile_generation()
+    print(f"# Done: {built} tiles built in {time.time() - start_time:.1f}s")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Pre-seed low zoom vector tiles")
+    parser.add_argument("--min-zoom", type=int, default=0)
+    parser.add_argument("--max-zoom", type=int, default=TILE_SEED_MAX_ZOOM)
+    parser.add_argument(
+        "--bounds",
+        type=float,
+        nargs=4,
+        default=KOREA_BOUNDS,
+        metavar=("WEST", "SOUTH", "EAST", "NORTH"),
+    )
+    parser.add_argument(
+        "--refresh", action="store_true", help="rebuild tiles that are already cached"
+    )
+    args = parser.parse_args()
+    if not TILE_CACHE_DIR:
+        parser.error("TILE_CACHE_DIR is not set")
+    if args.max_zoom >= PARCEL_TILE_MIN_ZOOM:
+        parser.error(
+            f"parcel tiles (zoom >= {PARCEL_TILE_MIN_ZOOM}) are not cached on disk"
+        )
+    seed(args)
@@ -0,0 +1,91 @@
+import numpy as np
+import pytest
+import shapely
+from app.functions import geometry
+
+TOLERANCE = geometry.zoom_tolerance(geometry.LOD_ZOOMS[0])
+# 서울 부근 웹 메르카토르 좌표(m)
+ORIGIN = np.array([14135000.0, 4518000.0])
+
+
+def _lnglat(points) -> list:
+    return geometry.from_mercator(ORIGIN + np.asarray(points, dtype=np.float64))
+
+
+def _shape(multi_polygon):
+    return shapely.MultiPolygon(
+        [shapely.Polygon(polygon[0], polygon[1:]) for polygon in multi_polygon]
+    )
+
+
+def _notched_polygon(t: float) -> list:
+    """바깥쪽으로 살짝 튀어나온 외곽선 바로 안쪽에 구멍이 있는 다각형.
+
+    외곽선만 따로 단순화하면 튀어나온 점이 지워지면서 새 변이 구멍을 가로지른다.
+    """
+    dip = [(45 * t, 0.0), (48 * t, -0.9 * t), (52 * t, -0.9 * t), (55 * t, 0.0)]
+    exterior = [(0, 0)] + dip + [(100 * t, 0), (100 * t, 100 * t), (0, 100 * t), (0, 0)]
+    hole = [
+        (49 * t, -0.5 * t),
+        (51 * t, -0.5 * t),
+        (51 * t, 10 * t),
+        (49 * t, 10 * t),
+        (49 * t, -0.5 * t),
+    ]
+    return [_lnglat(exterior), _lnglat(hole)]
+
+
+def _zigzag_pair(t: float) -> list:
+    """톱니 모양 경계를 사이에 두고 아주 가깝게 붙어 있는 두 다각형."""
+    teeth = [(x * t, 0.8 * t if i % 2 else 0.0) for i, x in enumerate(range(0, 201, 2))]
+    lower = teeth + [(200 * t, -50 * t), (0, -50 * t), teeth[0]]
+    upper = [(x, y + 0.2 * t) for x, y in teeth]
+    upper = upper + [(200 * t, 50 * t), (0, 50 * t), upper[0]]
+    return [[_lnglat(lower)], [_lnglat(upper)]]
+
+
+@pytest.mark.parametrize("level", geometry.LOD_ZOOMS)
+@pytest.mark.parametrize("build", [lambda t: [_notched_polygon(t)], _zigzag_pair])
+def test_simplify_keeps_valid_geometry(level, build):
+    multi_polygon = build(geometry.zoom_tolerance(geometry.LOD_ZOOMS[0]))
+    assert _shape(multi_polygon).is_valid
+
+    simplified = geometry.simplify(multi_polygon, geometry.zoom_tolerance(level))
+
+    assert simplified
+    assert _shape(simplified).is_valid
+    for polygon in simplified:
+        for ring in polygon:
+            assert len(ring) >= 4
+            np.testing.assert_array_equal(ring[0], ring[-1])
+
+
+def test_simplify_reduces_points_within_tolerance():
+    multi_polygon = _zigzag_pair(TOLERANCE)
+    original = _shape(multi_polygon)
+
+    simplified = geometry.simplify(multi_polygon, TOLERANCE)
+
+    count = sum(len(ring) for polygon in simplified for ring in polygon)
+    assert count < sum(len(ring) for polygon in multi_polygon for ring in polygon)
+    assert _shape(simplified).symmetric_difference(original).area < original.area / 50
+
+
+def test_simplify_keeps_largest_polygon_when_all_are_small():
+    tiny = [(0, 0), (1, 0), (1, 1), (0, 1), (0, 0)]
+    multi_polygon = [[_lnglat(tiny)], [_lnglat(np.array(tiny) * 2 + 10)]]
+
+    simplified = geometry.simplify(multi_polygon, TOLERANCE)
+
+    assert len(simplified) == 1
+    assert _shape(simplified).is_valid
+
+
+def test_encode_decode_round_trip():
+    multi_polygon = [_notched_polygon(TOLERANCE)]
+
+    decoded = geometry.decode(geometry.encode(multi_polygon))
+
+    assert len(decoded) == 1
+    for ring, expected in zip(decoded[0], multi_polygon[0]):
+        np.testing.assert_array_equal(ring, expected)